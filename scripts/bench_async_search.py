@@ -0,0 +1,94 @@
+"""비동기 검색 벤치마크 - 검색 중 이벤트 루프 응답성
+
+RAG 검색을 동시에 실행하면서, 같은 이벤트 루프에서 다른 요청(채팅 등)을 흉내 내는
+probe 코루틴이 얼마나 늦게 깨어나는지(loop lag)를 측정합니다.
+
+- sync : 이전 RAGTool._arun 방식 (코루틴 안에서 동기 검색 호출 → 루프 정지)
+- async: RAGTool._arun (VectorStore 전용 스레드 풀에서 검색)
+
+사용법:
+    uv run python scripts/bench_async_search.py
+    uv run python scripts/bench_async_search.py --concurrency 16 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.rag.rag_tool import RAGTool
+from src.systems.rag.vector_store import get_vector_store
+
+QUERIES = ["휴가 정책", "경비 규정", "출장 신청 절차", "재택 근무 기준", "교육 지원 대상", "보험금 청구 서류"]
+
+
+async def probe(stop: asyncio.Event, interval: float, lags: list[float]):
+    """interval마다 깨어나며 예정 시각 대비 지연을 기록합니다. (다른 요청의 대기 시간)"""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def searcher(mode: str, tool: RAGTool, stop: asyncio.Event, offset: int, counter: list[int]):
+    i = offset
+    while not stop.is_set():
+        # 매 호출이 캐시에 걸리지 않도록 질의를 바꿈
+        query = f"{QUERIES[i % len(QUERIES)]} {i}"
+        if mode == "sync":
+            tool._run(query)
+        else:
+            await tool._arun(query)
+        counter[0] += 1
+        i += 1
+        await asyncio.sleep(0)
+
+
+async def run(mode: str, concurrency: int, duration: float, interval: float) -> dict:
+    tool = RAGTool()
+    stop = asyncio.Event()
+    lags: list[float] = []
+    counter = [0]
+    tasks = [asyncio.create_task(probe(stop, interval, lags))]
+    tasks += [
+        asyncio.create_task(searcher(mode, tool, stop, n * 1000, counter)) for n in range(concurrency)
+    ]
+    await asyncio.sleep(duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    ordered = sorted(lags) or [0.0]
+    return {
+        "searches/s": counter[0] / duration,
+        "lag p50 ms": statistics.median(ordered) * 1000,
+        "lag p99 ms": ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1000,
+        "lag max ms": ordered[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 검색 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="모드별 측정 시간 (초)")
+    parser.add_argument("--interval", type=float, default=0.01, help="probe 주기 (초)")
+    args = parser.parse_args()
+
+    store = get_vector_store()
+    store.warm_up()
+    print(f"collection: {store.get_collection_stats()['count']} chunks | concurrency: {args.concurrency}")
+
+    print(f"\n{'mode':<6} {'searches/s':>11} {'lag p50 ms':>11} {'lag p99 ms':>11} {'lag max ms':>11}")
+    for mode in ("sync", "async"):
+        result = asyncio.run(run(mode, args.concurrency, args.duration, args.interval))
+        print(
+            f"{mode:<6} {result['searches/s']:>11.1f} {result['lag p50 ms']:>11.2f} "
+            f"{result['lag p99 ms']:>11.2f} {result['lag max ms']:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
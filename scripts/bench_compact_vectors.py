@@ -0,0 +1,115 @@
+"""Compact Vector 벤치마크 - recall vs 메모리
+
+색인된 Chroma 컬렉션(전체 차원)의 벡터로 차원 축소 / rescoring 정밀도 조합별
+recall@k와 벡터 저장 크기를 비교합니다. 저장된 벡터 일부를 질의로 사용하며(자기 자신 제외),
+전체 차원 float32 exact search 결과를 정답으로 합니다.
+
+출력 열:
+    index MB   - Chroma에 저장되는 축소 차원 float32 벡터 크기
+    rescore MB - rescoring 저장소의 전체 차원 벡터 크기 (off이면 0)
+    recall@k   - 정답 상위 k개 중 찾은 비율
+
+사용법:
+    uv run python scripts/bench_compact_vectors.py
+    uv run python scripts/bench_compact_vectors.py --dims 1024,512,256,128 --k 10 --candidates 4
+    uv run python scripts/bench_compact_vectors.py --npy ./vectors.npy
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.rag.compact_vectors import bytes_per_vector, decode, encode, truncate
+
+PRECISIONS = ["off", "float32", "float16", "int8"]
+
+
+def load_vectors(args) -> np.ndarray:
+    if args.npy:
+        return np.load(args.npy).astype(np.float32)
+
+    import chromadb
+    from src.config.settings import get_settings
+
+    path = args.chroma_path or get_settings().CHROMA_DB_PATH
+    collection = chromadb.PersistentClient(path=path).get_collection(args.collection)
+    result = collection.get(include=["embeddings"], limit=args.limit)
+    return np.asarray(result["embeddings"], dtype=np.float32)
+
+
+def top_k(matrix: np.ndarray, queries: np.ndarray, query_rows: np.ndarray, k: int) -> np.ndarray:
+    """질의별 상위 k개 행 index (자기 자신 제외)"""
+    scores = queries @ matrix.T
+    scores[np.arange(len(query_rows)), query_rows] = -np.inf
+    candidates = np.argpartition(-scores, k, axis=1)[:, :k]
+    order = np.take_along_axis(scores, candidates, axis=1).argsort(axis=1)[:, ::-1]
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def roundtrip(vectors: np.ndarray, precision: str) -> np.ndarray:
+    """rescoring 저장소에 저장 후 복원한 벡터 (양자화 오차 반영)"""
+    return np.stack([decode(*encode(vector, precision), precision) for vector in vectors])
+
+
+def recall(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found, truth))
+    return hits / truth.size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chroma-path", help="CHROMA_DB_PATH (기본: settings)")
+    parser.add_argument("--collection", default="soundmind_knowledge", help="전체 차원으로 색인된 컬렉션")
+    parser.add_argument("--npy", help="Chroma 대신 (N, D) 벡터 .npy 파일 사용")
+    parser.add_argument("--limit", type=int, default=100_000, help="불러올 최대 벡터 수")
+    parser.add_argument("--queries", type=int, default=200, help="질의로 사용할 벡터 수")
+    parser.add_argument("--dims", default="full,768,512,256,128", help="비교할 차원 수 목록")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--candidates", type=int, default=4, help="rescoring 후보 배수 (k × N)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    vectors = truncate(load_vectors(args), 0)
+    count, full_dims = vectors.shape
+    if count <= args.k:
+        sys.exit(f"need more than k={args.k} vectors, found {count}")
+
+    rng = np.random.default_rng(args.seed)
+    query_rows = rng.choice(count, size=min(args.queries, count), replace=False)
+    queries = vectors[query_rows]
+    truth = top_k(vectors, queries, query_rows, args.k)
+
+    dims_list = [full_dims if d == "full" else min(int(d), full_dims) for d in args.dims.split(",")]
+    print(f"vectors: {count} x {full_dims} | queries: {len(query_rows)} | k: {args.k} | candidates: k x {args.candidates}")
+    print(f"\n{'dims':>6} {'rescore':>8} {'index MB':>9} {'rescore MB':>11} {'total MB':>9} {'recall@k':>9}")
+
+    stored = {precision: roundtrip(vectors, precision) for precision in PRECISIONS[1:]}
+    for dims in dims_list:
+        index = truncate(vectors, dims)
+        index_queries = truncate(queries, dims)
+        index_mb = count * bytes_per_vector(dims, "float32") / 2**20
+
+        for precision in PRECISIONS:
+            if precision == "off":
+                found = top_k(index, index_queries, query_rows, args.k)
+                rescore_mb = 0.0
+            else:
+                pool = top_k(index, index_queries, query_rows, min(args.k * args.candidates, count - 1))
+                full = truncate(stored[precision], 0)
+                scores = np.einsum("qcd,qd->qc", full[pool], queries)
+                found = np.take_along_axis(pool, np.argsort(-scores, axis=1)[:, :args.k], axis=1)
+                scale_bytes = 4 if precision == "int8" else 0
+                rescore_mb = count * (bytes_per_vector(full_dims, precision) + scale_bytes) / 2**20
+
+            print(
+                f"{dims:>6} {precision:>8} {index_mb:>9.1f} {rescore_mb:>11.1f} "
+                f"{index_mb + rescore_mb:>9.1f} {recall(found, truth):>9.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Exact Search 벤치마크 - NumPy brute-force vs Chroma HNSW
+
+컬렉션 크기별로 VECTOR_SEARCH_BACKEND="numpy"(exact_index.py)와 "chroma"(HNSW)의
+색인 시간, 단일 질의 지연 시간, 배치 질의 처리량, recall@k를 비교합니다.
+정규화된 합성 벡터(군집 구조) 또는 --npy 벡터를 사용하며, 질의는 저장된 벡터에 잡음을 더해 만듭니다.
+recall@k의 정답은 numpy exact 검색 결과입니다.
+
+출력 열:
+    build s    - 색인 시간 (Chroma는 upsert + HNSW 구축, numpy는 행렬 적재)
+    p50 / p95  - 단일 질의 지연 시간
+    batch q/s  - --batch-size개 질의를 한 번에 검색할 때의 초당 질의 수
+    recall@k   - exact 상위 k개 중 찾은 비율
+
+사용법:
+    uv run python scripts/bench_exact_search.py
+    uv run python scripts/bench_exact_search.py --sizes 10000,50000,200000 --dims 1024 --k 10
+    uv run python scripts/bench_exact_search.py --npy ./vectors.npy --sizes 20000,100000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.rag.exact_index import ExactIndex
+
+
+def synthetic_vectors(count: int, dims: int, seed: int) -> np.ndarray:
+    """군집 구조가 있는 L2 정규화 벡터 (실제 임베딩처럼 이웃이 뭉쳐 있도록)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, count // 200), dims)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), count)]
+    vectors += 0.6 * rng.standard_normal((count, dims)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def make_queries(vectors: np.ndarray, count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed + 1)
+    queries = vectors[rng.integers(0, len(vectors), count)]
+    queries = queries + 0.05 * rng.standard_normal(queries.shape).astype(np.float32)
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def percentiles(samples: list[float]) -> tuple[float, float]:
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+    return pick(0.50), pick(0.95)
+
+
+def recall(found: list[list[str]], truth: list[list[str]]) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found, truth))
+    return hits / max(1, sum(len(t) for t in truth))
+
+
+def bench_exact(ids: list[str], vectors: np.ndarray, queries: np.ndarray, args) -> dict:
+    started = time.perf_counter()
+    index = ExactIndex()
+    for start in range(0, len(ids), 5000):
+        stop = start + 5000
+        index.add(ids[start:stop], vectors[start:stop], [""] * len(ids[start:stop]))
+    build = time.perf_counter() - started
+
+    samples, found = [], []
+    for query in queries:
+        started = time.perf_counter()
+        hits = index.search(query, args.k)
+        samples.append(time.perf_counter() - started)
+        found.append([hit[0] for hit in hits])
+
+    started = time.perf_counter()
+    for start in range(0, len(queries), args.batch_size):
+        index.search_batch(queries[start:start + args.batch_size], args.k)
+    throughput = len(queries) / (time.perf_counter() - started)
+    return {"build": build, "latency": percentiles(samples), "throughput": throughput, "found": found}
+
+
+def bench_chroma(ids: list[str], vectors: np.ndarray, queries: np.ndarray, args) -> dict:
+    import chromadb
+
+    directory = tempfile.mkdtemp(prefix="bench_exact_")
+    try:
+        client = chromadb.PersistentClient(path=directory)
+        collection = client.create_collection("bench")
+        page_size = min(5000, client.get_max_batch_size())
+        started = time.perf_counter()
+        for start in range(0, len(ids), page_size):
+            stop = start + page_size
+            collection.upsert(ids=ids[start:stop], embeddings=vectors[start:stop])
+        build = time.perf_counter() - started
+
+        samples, found = [], []
+        for query in queries:
+            started = time.perf_counter()
+            result = collection.query(query_embeddings=[query.tolist()], n_results=args.k, include=["distances"])
+            samples.append(time.perf_counter() - started)
+            found.append(result["ids"][0])
+
+        started = time.perf_counter()
+        for start in range(0, len(queries), args.batch_size):
+            collection.query(
+                query_embeddings=queries[start:start + args.batch_size],
+                n_results=args.k,
+                include=["distances"],
+            )
+        throughput = len(queries) / (time.perf_counter() - started)
+        return {"build": build, "latency": percentiles(samples), "throughput": throughput, "found": found}
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,50000,100000", help="비교할 컬렉션 크기 목록")
+    parser.add_argument("--dims", type=int, default=1024, help="합성 벡터 차원 수 (bge-m3: 1024)")
+    parser.add_argument("--npy", help="합성 벡터 대신 (N, D) 벡터 .npy 파일 사용")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=32, help="배치 질의 크기")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    if args.npy:
+        source = np.load(args.npy).astype(np.float32)
+        source /= np.clip(np.linalg.norm(source, axis=1, keepdims=True), 1e-12, None)
+    else:
+        source = synthetic_vectors(max(sizes), args.dims, args.seed)
+
+    print(f"dims={source.shape[1]} queries={args.queries} batch={args.batch_size} k={args.k}\n")
+    print(f"{'size':>8} | {'backend':>7} | {'build s':>8} | {'p50 ms':>8} | {'p95 ms':>8} | {'batch q/s':>10} | recall@{args.k}")
+    for size in sizes:
+        if size > len(source):
+            print(f"{size:>8} | skipped (only {len(source)} vectors)")
+            continue
+        vectors = np.ascontiguousarray(source[:size])
+        ids = [str(i) for i in range(size)]
+        queries = make_queries(vectors, args.queries, args.seed)
+
+        exact = bench_exact(ids, vectors, queries, args)
+        chroma = bench_chroma(ids, vectors, queries, args)
+        for name, result in (("numpy", exact), ("chroma", chroma)):
+            p50, p95 = result["latency"]
+            print(
+                f"{size:>8} | {name:>7} | {result['build']:8.2f} | {p50:8.3f} | {p95:8.3f} | "
+                f"{result['throughput']:10.0f} | {recall(result['found'], exact['found']):.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
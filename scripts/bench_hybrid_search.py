@@ -0,0 +1,108 @@
+"""하이브리드 검색 벤치마크 - BM25 역색인 지연 시간
+
+합성 코퍼스(한국어 문장 + 제품 코드/정책 번호)로 LexicalIndex를 만들고
+질의별 BM25 검색 지연 시간(p50/p95/p99)과 정확 일치 코드의 적중률을 측정합니다.
+--vector-store를 지정하면 설정된 VectorStore에서 dense / hybrid 검색 지연 시간도 함께 측정합니다.
+
+사용법:
+    uv run python scripts/bench_hybrid_search.py --docs 50000
+    uv run python scripts/bench_hybrid_search.py --vector-store --queries 50
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.rag.lexical_index import LexicalIndex
+
+TOPICS = ["휴가 정책", "경비 규정", "출장 신청", "보험금 청구", "계약 해지", "개인정보 처리", "재택 근무", "교육 지원"]
+PHRASES = [
+    "{topic}에 관한 세부 절차는 인사팀 공지를 따릅니다.",
+    "{topic} 관련 문의는 담당 부서로 접수해 주시기 바랍니다.",
+    "{code} 문서에 따라 {topic} 기준이 2024년부터 변경되었습니다.",
+    "신청서는 {code} 양식을 사용하며 {topic} 승인 후 처리됩니다.",
+]
+
+
+def build_corpus(count: int, seed: int) -> tuple[list[str], list[str]]:
+    rng = random.Random(seed)
+    texts, codes = [], []
+    for i in range(count):
+        code = f"POL-{2020 + i % 5}-{i:05d}"
+        topic = rng.choice(TOPICS)
+        sentences = [rng.choice(PHRASES).format(topic=topic, code=code) for _ in range(rng.randint(3, 8))]
+        texts.append(" ".join(sentences))
+        codes.append(code)
+    return texts, codes
+
+
+def percentiles(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+    return f"p50 {pick(0.50):8.3f} ms | p95 {pick(0.95):8.3f} ms | p99 {pick(0.99):8.3f} ms"
+
+
+def measure(search, queries: list[str]) -> list[float]:
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        search(query)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=20_000, help="합성 코퍼스 문서 수")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--vector-store", action="store_true", help="설정된 VectorStore의 dense / hybrid 지연 시간도 측정")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    texts, codes = build_corpus(args.docs, args.seed)
+    ids = [f"doc-{i}" for i in range(len(texts))]
+
+    index = LexicalIndex()
+    started = time.perf_counter()
+    index.add(ids, texts)
+    build_time = time.perf_counter() - started
+    print(f"lexical index: {len(index)} docs, {index.get_stats()['terms']} terms, built in {build_time:.2f}s")
+
+    picks = [rng.randrange(len(texts)) for _ in range(args.queries)]
+    code_queries = [f"{codes[i]} 규정" for i in picks]
+    topic_queries = [f"{rng.choice(TOPICS)} 신청 절차" for _ in range(args.queries)]
+
+    # 워밍업
+    measure(lambda q: index.search(q, args.k), code_queries[:10])
+
+    print(f"\n== BM25 latency (k={args.k})")
+    print(f"{'code queries':<16} {percentiles(measure(lambda q: index.search(q, args.k), code_queries))}")
+    print(f"{'topic queries':<16} {percentiles(measure(lambda q: index.search(q, args.k), topic_queries))}")
+
+    hits = sum(index.search(query, 1)[0][0] == ids[i] for query, i in zip(code_queries, picks))
+    print(f"\nexact code top-1 hit rate: {hits / len(code_queries):.3f}")
+
+    if not args.vector_store:
+        return
+
+    from src.systems.rag.vector_store import get_vector_store
+
+    store = get_vector_store()
+    store.warm_up()
+    store.get_lexical_index()
+    queries = (code_queries + topic_queries)[: args.queries]
+    print(f"\n== VectorStore latency ({store.get_collection_stats()['count']} chunks, k=4)")
+    print(f"{'lexical':<16} {percentiles(measure(lambda q: store.get_lexical_index().search(q, 4), queries))}")
+    print(f"{'dense':<16} {percentiles(measure(lambda q: store.similarity_search(q, k=4), queries))}")
+    print(f"{'hybrid':<16} {percentiles(measure(lambda q: store.hybrid_search(q, k=4), queries))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""ONNX 임베딩 벤치마크 - HuggingFace(PyTorch) vs ONNX Runtime(fp32 / int8)
+
+같은 모델을 현재 경로(HuggingFaceEmbeddings)와 ONNXEmbeddings로 임베딩하여
+코사인 일치도(parity)와 처리량(texts/s)을 비교합니다.
+최소 코사인 유사도가 --min-cosine 미만이면 종료 코드 1로 끝납니다.
+
+사용법:
+    uv run python scripts/bench_onnx_embeddings.py
+    uv run python scripts/bench_onnx_embeddings.py --model BAAI/bge-m3 --texts 512 --threads 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.onnx_embeddings import ONNXEmbeddings
+
+SAMPLE_SENTENCES = [
+    "보험 계약의 해지 환급금은 납입 기간과 경과 기간에 따라 달라집니다.",
+    "The quarterly report shows a 12% increase in operating revenue.",
+    "고객 상담 내역은 개인정보 보호 정책에 따라 3년간 보관합니다.",
+    "Refunds are processed within five business days after approval.",
+    "사고 접수 후 보상 담당자가 배정되며 진행 상황은 문자로 안내됩니다.",
+    "Policy POL-2024-0042 covers water damage but excludes flooding.",
+]
+
+
+def build_texts(count: int) -> list[str]:
+    """길이가 다양한 합성 문장 목록을 생성합니다."""
+    texts = []
+    for i in range(count):
+        repeat = 1 + i % 4
+        sentence = SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)]
+        texts.append(f"[{i}] " + " ".join([sentence] * repeat))
+    return texts
+
+
+def throughput(embeddings, texts: list[str], batch_size: int, rounds: int) -> float:
+    """embed_documents 처리량(texts/s)을 측정합니다. (첫 배치로 워밍업)"""
+    embeddings.embed_documents(texts[:batch_size])
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for start in range(0, len(texts), batch_size):
+            embeddings.embed_documents(texts[start:start + batch_size])
+    return len(texts) * rounds / (time.perf_counter() - started)
+
+
+def cosine_stats(reference, candidate) -> tuple[float, float]:
+    """행별 코사인 유사도의 (평균, 최소)를 반환합니다."""
+    import numpy as np
+
+    a = np.asarray(reference, dtype=np.float32)
+    b = np.asarray(candidate, dtype=np.float32)
+    cos = (a * b).sum(axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+    return float(cos.mean()), float(cos.min())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2", help="HuggingFace 모델명")
+    parser.add_argument("--texts", type=int, default=256, help="임베딩할 텍스트 수")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=0, help="ONNX Runtime 스레드 수 (0이면 기본값)")
+    parser.add_argument("--model-dir", help="ONNX export 디렉터리 (기본: 임시 디렉터리)")
+    parser.add_argument("--min-cosine", type=float, default=0.98, help="parity 판정 최소 코사인 유사도")
+    args = parser.parse_args()
+
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    texts = build_texts(args.texts)
+    base_dir = args.model_dir or tempfile.mkdtemp(prefix="onnx_bench_")
+
+    print(f"model: {args.model} | texts: {len(texts)} | batch: {args.batch_size} | onnx dir: {base_dir}")
+
+    reference = HuggingFaceEmbeddings(
+        model_name=args.model,
+        model_kwargs={"device": "cpu"},
+        encode_kwargs={"normalize_embeddings": True, "batch_size": args.batch_size},
+    )
+    reference_vectors = reference.embed_documents(texts)
+    results = [("torch", throughput(reference, texts, args.batch_size, args.rounds), 1.0, 1.0)]
+
+    for quantize in (False, True):
+        onnx = ONNXEmbeddings(
+            model_name=args.model,
+            base_dir=base_dir,
+            quantize=quantize,
+            num_threads=args.threads,
+            batch_size=args.batch_size,
+        )
+        mean_cos, min_cos = cosine_stats(reference_vectors, onnx.embed_documents(texts))
+        label = "onnx-int8" if quantize else "onnx-fp32"
+        results.append((label, throughput(onnx, texts, args.batch_size, args.rounds), mean_cos, min_cos))
+
+    base_rate = results[0][1]
+    print(f"\n{'backend':<10} {'texts/s':>10} {'speedup':>8} {'cos mean':>9} {'cos min':>9}")
+    for label, rate, mean_cos, min_cos in results:
+        print(f"{label:<10} {rate:>10.1f} {rate / base_rate:>7.2f}x {mean_cos:>9.4f} {min_cos:>9.4f}")
+
+    failed = [label for label, _, _, min_cos in results if min_cos < args.min_cosine]
+    if failed:
+        print(f"\nparity FAILED (min cosine < {args.min_cosine}): {', '.join(failed)}")
+        sys.exit(1)
+    print(f"\nparity OK (min cosine >= {args.min_cosine})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""PowerPoint 로더 벤치마크 - python-pptx vs XML 스트리밍
+
+합성 덱(텍스트 + 표 + 이미지)을 생성하여 PowerPointLoader와 PowerPointXMLLoader의
+처리 시간, 최대 메모리(tracemalloc), 추출 결과 일치 여부를 비교합니다.
+
+사용법:
+    uv run python scripts/bench_pptx_loaders.py --slides 300 --workers 4
+    uv run python scripts/bench_pptx_loaders.py --file ./sample.pptx
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.rag.loaders import PowerPointLoader, PowerPointXMLLoader
+
+
+def build_deck(path: str, num_slides: int, image_kb: int) -> None:
+    """텍스트 박스, 표, 이미지가 포함된 합성 덱을 생성합니다."""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    layout = prs.slide_layouts[5]  # Title Only
+    image_bytes = _make_png(image_kb)
+
+    for i in range(1, num_slides + 1):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = f"슬라이드 {i} - 분기 실적 요약"
+
+        body = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(5), Inches(2))
+        frame = body.text_frame
+        frame.text = f"매출은 전년 대비 {i % 17}% 증가했습니다."
+        for j in range(3):
+            frame.add_paragraph().text = f"항목 {j}: 정책 번호 POL-{i:04d}-{j}"
+
+        rows, cols = 4, 3
+        table = slide.shapes.add_table(rows, cols, Inches(5.5), Inches(1.5), Inches(4), Inches(2)).table
+        for r in range(rows):
+            for c in range(cols):
+                table.cell(r, c).text = f"R{r}C{c}-{i}"
+
+        if image_bytes:
+            slide.shapes.add_picture(io.BytesIO(image_bytes), Inches(0.5), Inches(4), Inches(2))
+
+    prs.save(path)
+
+
+def _make_png(size_kb: int) -> bytes:
+    """size_kb 정도 크기의 PNG 이미지를 생성합니다. (압축되지 않는 노이즈)"""
+    if size_kb <= 0:
+        return b""
+    import struct
+    import zlib
+
+    width = height = max(8, int((size_kb * 1024 / 3) ** 0.5))
+    raw = b"".join(b"\x00" + os.urandom(width * 3) for _ in range(height))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+def measure(name: str, loader, repeat: int):
+    best = float("inf")
+    peak = 0
+    documents = []
+    for _ in range(repeat):
+        tracemalloc.start()
+        started = time.perf_counter()
+        documents = loader.load()
+        elapsed = time.perf_counter() - started
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        best = min(best, elapsed)
+    print(f"{name:<28} {best * 1000:>10.1f} ms {peak / 1024 / 1024:>10.1f} MiB {len(documents):>8} docs")
+    return best, documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="기존 .pptx 파일 (지정하지 않으면 합성 덱 생성)")
+    parser.add_argument("--slides", type=int, default=200, help="합성 덱 슬라이드 수")
+    parser.add_argument("--image-kb", type=int, default=256, help="슬라이드당 이미지 크기(KB), 0이면 이미지 없음")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="XML 병렬 모드 워커 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmp, "bench.pptx")
+            build_deck(path, args.slides, args.image_kb)
+        print(f"file: {path} ({os.path.getsize(path) / 1024 / 1024:.1f} MiB)\n")
+        print(f"{'engine':<28} {'best':>13} {'peak (py)':>14} {'output':>13}")
+
+        base_time, base_docs = measure("python-pptx", PowerPointLoader(path), args.repeat)
+        xml_time, xml_docs = measure("xml (sequential)", PowerPointXMLLoader(path), args.repeat)
+        results = [("xml (sequential)", xml_time, xml_docs)]
+        if args.workers > 1:
+            par_time, par_docs = measure(
+                f"xml (workers={args.workers})",
+                PowerPointXMLLoader(path, max_workers=args.workers),
+                args.repeat,
+            )
+            results.append((f"xml (workers={args.workers})", par_time, par_docs))
+
+        print()
+        for name, elapsed, docs in results:
+            same = [(d.page_content, d.metadata) for d in docs] == [
+                (d.page_content, d.metadata) for d in base_docs
+            ]
+            print(f"{name:<28} speedup x{base_time / elapsed:.2f}, output identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Startup 벤치마크 - 모듈 import 시간 / 서버 기동 시간 / warm-up 시간
+
+각 측정은 새 인터프리터(subprocess)에서 수행하므로 cold start와 워커 재시작 비용을 반영합니다.
+
+1. import: 주요 모듈을 import 하는 데 걸린 시간 (--importtime이면 느린 모듈 상위 목록 출력)
+2. server: uvicorn 실행 → /health 첫 응답까지 시간, ready(warm-up 완료)까지 시간
+
+사용법:
+    uv run python scripts/bench_startup.py
+    uv run python scripts/bench_startup.py --runs 5 --importtime
+    uv run python scripts/bench_startup.py --skip-server
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "src.systems.rag.vector_store",
+    "src.systems.rag.ingestion",
+    "src.api.v1.documents",
+    "src.api.main",
+]
+
+
+def time_import(module: str) -> float:
+    """새 인터프리터에서 module import 시간을 측정합니다. (초)"""
+    code = (
+        "import time; started = time.perf_counter(); "
+        f"import {module}; "
+        "print(time.perf_counter() - started)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def slowest_imports(module: str, top: int) -> list[tuple[int, str]]:
+    """python -X importtime 결과에서 누적 시간이 큰 모듈 상위 목록을 반환합니다. (us, 모듈명)"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, check=True, capture_output=True, text=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        name = name.strip()
+        # 최상위 패키지만 집계
+        if "." not in name:
+            rows.append((int(cumulative.strip()), name))
+    return sorted(rows, reverse=True)[:top]
+
+
+def get_health(url: str):
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return json.loads(response.read())
+    except OSError:
+        return None
+
+
+def time_server(port: int, timeout: float) -> tuple[float, float | None]:
+    """uvicorn 기동 후 /health 첫 응답 시간과 ready 시간을 측정합니다. (초)"""
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api.main:app", "--port", str(port)],
+        cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    health_at = ready_at = None
+    try:
+        while time.perf_counter() - started < timeout:
+            body = get_health(url)
+            now = time.perf_counter() - started
+            if body is not None and health_at is None:
+                health_at = now
+            if body is not None and body.get("ready"):
+                ready_at = now
+                break
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+            time.sleep(0.05)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+    if health_at is None:
+        raise RuntimeError(f"/health did not respond within {timeout}s")
+    return health_at, ready_at
+
+
+def summarize(values: list[float]) -> str:
+    if len(values) == 1:
+        return f"{values[0] * 1000:8.0f} ms"
+    return f"{statistics.median(values) * 1000:8.0f} ms (min {min(values) * 1000:.0f}, max {max(values) * 1000:.0f})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="측정 반복 횟수 (중앙값 출력)")
+    parser.add_argument("--importtime", action="store_true", help="src.api.main import 시 느린 패키지 상위 목록 출력")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--skip-server", action="store_true", help="uvicorn 기동 측정 생략")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=300.0, help="서버 ready 대기 최대 시간 (초)")
+    args = parser.parse_args()
+
+    print("== import time (fresh interpreter)")
+    for module in MODULES:
+        print(f"{module:<34} {summarize([time_import(module) for _ in range(args.runs)])}")
+
+    if args.importtime:
+        print(f"\n== slowest top-level packages for src.api.main (cumulative)")
+        for cumulative_us, name in slowest_imports("src.api.main", args.top):
+            print(f"{name:<34} {cumulative_us / 1000:8.1f} ms")
+
+    if args.skip_server:
+        return
+
+    print("\n== server startup (uvicorn)")
+    health_times, ready_times = [], []
+    for _ in range(args.runs):
+        health_at, ready_at = time_server(args.port, args.timeout)
+        health_times.append(health_at)
+        if ready_at is not None:
+            ready_times.append(ready_at)
+    print(f"{'first /health response':<34} {summarize(health_times)}")
+    if ready_times:
+        print(f"{'ready (warm-up complete)':<34} {summarize(ready_times)}")
+    else:
+        print(f"{'ready (warm-up complete)':<34} not reached within {args.timeout:.0f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Bulk Index CLI - HTTP API 없이 디렉터리 전체를 벡터 DB에 색인
+
+디렉터리 트리를 순회하며 지원 형식의 파일을 찾아 IngestionService.ingest_batch로
+프로세스 병렬 파싱 + 대용량 배치 임베딩을 수행하고 CHROMA_DB_PATH에 저장합니다.
+완료된 파일은 체크포인트(JSONL)에 기록되므로 중단 후 같은 명령으로 이어서 실행할 수 있습니다.
+
+사용법:
+    uv run python scripts/bulk_index.py ./archive
+    uv run python scripts/bulk_index.py ./archive --chroma-path ./chroma_replica --processes 16
+    uv run python scripts/bulk_index.py ./archive --group-size 500 --embed-batch-size 512
+    uv run python scripts/bulk_index.py ./archive --embed-processes 4 --embed-cpus 0-31
+    uv run python scripts/bulk_index.py ./hr_docs --shard-key department --shard hr
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root", help="색인할 디렉터리")
+    parser.add_argument("--chroma-path", help="CHROMA_DB_PATH 오버라이드")
+    parser.add_argument("--provider", choices=["local", "openai", "onnx"], help="EMBEDDING_PROVIDER 오버라이드")
+    parser.add_argument("--processes", type=int, default=0, help="파싱 프로세스 수 (0이면 CPU 코어 수)")
+    parser.add_argument("--embed-batch-size", type=int, help="임베딩 배치 크기 (청크 수)")
+    parser.add_argument("--embed-processes", type=int, help="임베딩 워커 프로세스 수 (EMBEDDING_WORKER_PROCESSES)")
+    parser.add_argument("--embed-cpus", help="임베딩 워커에 나누어 고정할 CPU 목록 (예: 0-31)")
+    parser.add_argument("--group-size", type=int, default=200, help="체크포인트 단위 (파일 수)")
+    parser.add_argument("--checkpoint", help="체크포인트 파일 경로 (기본: <chroma-path>/bulk_index_checkpoint.jsonl)")
+    parser.add_argument("--source-prefix", help="metadata source 앞에 붙일 경로 (기본: root 경로)")
+    parser.add_argument("--shard-key", help="VECTOR_SHARD_KEY 오버라이드 (예: department)")
+    parser.add_argument("--shard", help="모든 청크를 저장할 shard (VECTOR_SHARD_KEY metadata 값)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 실행")
+    return parser.parse_args()
+
+
+def apply_overrides(args):
+    """src 모듈 import 전에 환경 변수로 settings를 오버라이드합니다."""
+    if args.chroma_path:
+        os.environ["CHROMA_DB_PATH"] = args.chroma_path
+    if args.provider:
+        os.environ["EMBEDDING_PROVIDER"] = args.provider
+    if args.embed_batch_size:
+        os.environ["INGESTION_EMBED_BATCH_SIZE"] = str(args.embed_batch_size)
+    if args.embed_processes is not None:
+        os.environ["EMBEDDING_WORKER_PROCESSES"] = str(args.embed_processes)
+    if args.embed_cpus:
+        os.environ["EMBEDDING_WORKER_CPUS"] = args.embed_cpus
+    if args.shard_key:
+        os.environ["VECTOR_SHARD_KEY"] = args.shard_key
+
+
+def file_key(path: str) -> str:
+    """체크포인트 키: 경로 + 크기 + 수정 시각 (파일이 바뀌면 다시 색인)"""
+    stat = os.stat(path)
+    return f"{path}:{stat.st_size}:{int(stat.st_mtime)}"
+
+
+def load_checkpoint(path: str) -> set[str]:
+    if not os.path.exists(path):
+        return set()
+    done = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                done.add(json.loads(line)["key"])
+    return done
+
+
+def discover(root: str, extensions: set[str]) -> list[str]:
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if os.path.splitext(filename)[1].lower() in extensions:
+                paths.append(os.path.join(dirpath, filename))
+    return paths
+
+
+def main():
+    args = parse_args()
+    apply_overrides(args)
+
+    from src.config.settings import get_settings
+    from src.core.embedding_service import EmbeddingService
+    from src.systems.rag.ingestion import IngestionService
+
+    settings = get_settings()
+    service = IngestionService()
+
+    if args.shard and not settings.VECTOR_SHARD_KEY:
+        sys.exit("--shard requires VECTOR_SHARD_KEY (or --shard-key)")
+    shard_metadata = service.shard_metadata(args.shard)
+
+    root = os.path.normpath(args.root)
+    source_prefix = args.source_prefix or root
+    checkpoint_path = args.checkpoint or os.path.join(settings.CHROMA_DB_PATH, "bulk_index_checkpoint.jsonl")
+    os.makedirs(os.path.dirname(checkpoint_path) or ".", exist_ok=True)
+    if args.restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    paths = discover(root, IngestionService.SUPPORTED_EXTENSIONS)
+    done = load_checkpoint(checkpoint_path)
+    pending = [path for path in paths if file_key(path) not in done]
+
+    print(f"root: {root}")
+    print(f"chroma: {settings.CHROMA_DB_PATH} (embedding: {settings.EMBEDDING_PROVIDER})")
+    print(f"files: {len(paths)} found, {len(paths) - len(pending)} already indexed, {len(pending)} to index")
+    if not pending:
+        return
+
+    total_files = total_chunks = total_failed = 0
+    started = time.perf_counter()
+
+    with service.create_parse_pool(args.processes or None) as pool, \
+            open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+        for offset in range(0, len(pending), args.group_size):
+            group = pending[offset:offset + args.group_size]
+            items = [
+                (path, os.path.join(source_prefix, os.path.relpath(path, root)))
+                for path in group
+            ]
+            source_to_path = {source: path for path, source in items}
+
+            result = service.ingest_batch(items, pool=pool, metadata=shard_metadata)
+
+            # 실패한 파일은 체크포인트에 남기지 않아 다음 실행에서 재시도
+            for source, path in source_to_path.items():
+                if source not in result.failed:
+                    checkpoint.write(json.dumps({"key": file_key(path), "source": source}, ensure_ascii=False) + "\n")
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+
+            total_files += len(group)
+            total_chunks += result.chunks_created
+            total_failed += len(result.failed)
+            elapsed = time.perf_counter() - started
+            print(
+                f"[{total_files}/{len(pending)}] "
+                f"+{result.chunks_created} chunks, {len(result.failed)} failed, "
+                f"{result.files_unchanged} unchanged | "
+                f"{total_files / elapsed:.1f} files/s, {total_chunks / elapsed:.1f} chunks/s"
+            )
+            for source, error in result.failed.items():
+                print(f"  ! {source}: {error}")
+
+    EmbeddingService.shutdown_worker_pools()
+    elapsed = time.perf_counter() - started
+    print(
+        f"\ndone in {elapsed:.1f}s: {total_files} files ({total_failed} failed), {total_chunks} chunks | "
+        f"{total_files / elapsed:.1f} files/s, {total_chunks / elapsed:.1f} chunks/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Vector Index Snapshot CLI - 벡터 인덱스 export / import
+
+색인을 마친 인스턴스에서 모든 shard의 벡터, 문서, metadata, id를 스냅샷 디렉터리로 내보내고,
+새 레플리카에서는 재임베딩 없이 한 번에 불러옵니다. (src/systems/rag/snapshot.py 참고)
+레플리카는 VECTOR_SNAPSHOT_PATH를 설정하면 서버 warm-up 시 빈 저장소에 자동으로 import합니다.
+
+사용법:
+    uv run python scripts/snapshot.py export ./snapshots/2026-10-18
+    uv run python scripts/snapshot.py import ./snapshots/2026-10-18 --chroma-path ./chroma_replica
+    uv run python scripts/snapshot.py info ./snapshots/2026-10-18
+    uv run python scripts/snapshot.py import ./snapshot --force   # 임베딩 모델 이름이 달라도 import
+"""
+
+import argparse
+import json
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["export", "import", "info"])
+    parser.add_argument("path", help="스냅샷 디렉터리")
+    parser.add_argument("--chroma-path", help="CHROMA_DB_PATH 오버라이드")
+    parser.add_argument("--shard-key", help="VECTOR_SHARD_KEY 오버라이드 (예: department)")
+    parser.add_argument("--force", action="store_true", help="임베딩 모델 확인을 건너뜀 (import)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.chroma_path:
+        os.environ["CHROMA_DB_PATH"] = args.chroma_path
+    if args.shard_key:
+        os.environ["VECTOR_SHARD_KEY"] = args.shard_key
+
+    from src.systems.rag.exceptions import SnapshotError
+    from src.systems.rag.snapshot import read_manifest
+
+    try:
+        if args.command == "info":
+            print(json.dumps(read_manifest(args.path), ensure_ascii=False, indent=2))
+            return
+
+        from src.systems.rag.vector_store import get_vector_store
+
+        store = get_vector_store()
+        if args.command == "export":
+            manifest = store.export_snapshot(args.path)
+            total = sum(entry["count"] for entry in manifest["shards"])
+            print(f"exported {total} chunks from {len(manifest['shards'])} shard(s) in {manifest['elapsed_seconds']}s")
+            for entry in manifest["shards"]:
+                print(f"  {entry['value']}: {entry['count']} chunks ({entry['collection']})")
+        else:
+            result = store.import_snapshot(args.path, force=args.force)
+            print(f"imported {result['count']} chunks in {result['elapsed_seconds']}s")
+            for value, count in result["shards"].items():
+                print(f"  {value}: {count} chunks")
+    except SnapshotError as e:
+        sys.exit(str(e))
+
+
+if __name__ == "__main__":
+    main()
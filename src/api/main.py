@@ -3,18 +3,47 @@ from fastapi.middleware.cors import CORSMiddleware
 from src.api.router import api_router
 from src.config.settings import get_settings
 from src.core.mcp_manager import mcp_manager
+from src.core.embedding_service import EmbeddingService
+from src.core.llm_service import LLMService
+from src.systems.rag.jobs import ingestion_job_manager
+from src.systems.rag.vector_store import VectorStore, get_vector_store
 from contextlib import asynccontextmanager
+import asyncio
 
 settings = get_settings()
 
+
+async def warm_up_vector_store():
+    """임베딩 모델과 Chroma를 백그라운드 스레드에서 로드합니다. (이벤트 루프 비차단)"""
+    try:
+        await asyncio.to_thread(lambda: get_vector_store().warm_up())
+        print("Vector store warm-up complete")
+    except Exception as e:
+        # warm-up 실패 시 첫 요청에서 다시 초기화를 시도
+        print(f"Vector store warm-up failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic
     print(f"Starting {settings.APP_NAME}...")
     await mcp_manager.initialize()
+    await ingestion_job_manager.start()
+    # 모델 로드를 기다리지 않고 바로 요청을 받음 (/health는 warm-up 중에도 응답)
+    warmup_task = (
+        asyncio.create_task(warm_up_vector_store())
+        if settings.EMBEDDING_WARMUP_ON_STARTUP
+        else None
+    )
     yield
     # Shutdown logic
     print("Shutting down...")
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await ingestion_job_manager.shutdown()
+    EmbeddingService.shutdown_worker_pools()
+    VectorStore.shutdown_executor()
+    await LLMService.aclose()
     await mcp_manager.cleanup()
 
 app = FastAPI(
@@ -35,4 +64,4 @@ app.include_router(api_router)
 
 @app.get("/health")
 async def health_check():
-    return {"status": "ok", "version": "0.1.0"}
+    return {"status": "ok", "version": "0.1.0", "ready": VectorStore.is_ready()}
@@ -3,36 +3,108 @@
 문서 업로드, 관리, 검색 기능을 담당합니다.
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
+import os
+import re
+import zipfile
 
-from src.schema.api_schema import BaseResponse
+from typing import List, Optional
+
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+
+from src.config.settings import get_settings
+from src.schema.api_schema import BaseResponse, SearchRequest
 from src.systems.rag.ingestion import IngestionService
-from src.systems.rag.exceptions import UnsupportedFileTypeError, FileLoadError
+from src.systems.rag.jobs import ingestion_job_manager
+from src.systems.rag.vector_store import aget_vector_store
+from src.systems.rag.exceptions import (
+    UnsupportedFileTypeError,
+    FileLoadError,
+    IndexingBatchError,
+    IngestionQueueFullError,
+    InvalidFilterError,
+)
 
 router = APIRouter()
 
 # 문서 수집 서비스 인스턴스
 _ingestion_service = IngestionService()
 
+# shard 값: 문자/숫자/한글, ".", "-", "_" (source 경로에 포함되므로 "/" 등은 허용하지 않음)
+_SHARD_PATTERN = re.compile(r"^[\w.-]{1,64}$")
+
+_SHARD_QUERY = Query(
+    None, description="청크를 저장할 shard (VECTOR_SHARD_KEY metadata 값, 예: 부서/테넌트)"
+)
+
+
+def _validate_shard(shard: Optional[str]):
+    """shard 파라미터를 검증합니다."""
+    if shard is None:
+        return
+    if not get_settings().VECTOR_SHARD_KEY:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "sharding_disabled",
+                "message": "shard requires VECTOR_SHARD_KEY to be configured"
+            }
+        )
+    if not _SHARD_PATTERN.match(shard) or shard in (".", ".."):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "invalid_shard",
+                "message": f"Invalid shard: {shard!r}"
+            }
+        )
+
 
 @router.post("/upload", response_model=BaseResponse)
-async def upload_document(file: UploadFile = File(...)):
+async def upload_document(
+    file: UploadFile = File(...),
+    background: bool = Query(False, description="True이면 job id를 즉시 반환하고 백그라운드에서 처리"),
+    shard: Optional[str] = _SHARD_QUERY,
+):
     """문서를 업로드하고 벡터 데이터베이스에 저장합니다.
 
     지원 파일 형식: .pdf, .txt, .docx, .xlsx, .pptx
 
     Args:
         file: 업로드할 문서 파일
+        background: True이면 수집 작업을 대기열에 넣고 job id를 즉시 반환
+        shard: 청크를 저장할 shard (VECTOR_SHARD_KEY가 설정된 경우)
 
     Returns:
-        BaseResponse: 업로드 결과 및 생성된 청크 수
+        BaseResponse: 업로드 결과 및 추가/삭제/유지된 청크 수 (background 모드에서는 job 정보)
     """
+    _validate_shard(shard)
     try:
-        num_chunks = await _ingestion_service.process_file(file)
+        if background:
+            file_path = await _ingestion_service.save_upload(file)
+            try:
+                job = await ingestion_job_manager.submit(file_path, file.filename, shard)
+            except IngestionQueueFullError:
+                os.remove(file_path)
+                raise
+            return BaseResponse(
+                success=True,
+                message=f"Queued {file.filename} for ingestion",
+                data={
+                    "job_id": job.job_id,
+                    "status": job.status,
+                    "status_url": f"/v1/documents/jobs/{job.job_id}",
+                }
+            )
+
+        sync = await _ingestion_service.process_file(file, shard)
         return BaseResponse(
             success=True,
-            message=f"Successfully uploaded {file.filename}",
-            data={"chunks_created": num_chunks}
+            message=(
+                f"{file.filename} is already indexed (unchanged)"
+                if sync.file_unchanged
+                else f"Successfully uploaded {file.filename}"
+            ),
+            data=sync.to_dict()
         )
     except UnsupportedFileTypeError as e:
         raise HTTPException(
@@ -43,6 +115,14 @@ async def upload_document(file: UploadFile = File(...)):
                 "supported_types": list(IngestionService.SUPPORTED_EXTENSIONS)
             }
         )
+    except IngestionQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "ingestion_queue_full",
+                "message": str(e)
+            }
+        )
     except FileLoadError as e:
         raise HTTPException(
             status_code=422,
@@ -51,5 +131,145 @@ async def upload_document(file: UploadFile = File(...)):
                 "message": str(e)
             }
         )
+    except IndexingBatchError as e:
+        raise HTTPException(
+            status_code=502,
+            detail={
+                "error": "indexing_failed",
+                "message": str(e)
+            }
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/upload/batch", response_model=BaseResponse)
+async def upload_documents_batch(
+    files: List[UploadFile] = File(...),
+    background: bool = Query(False, description="True이면 job id를 즉시 반환하고 백그라운드에서 처리"),
+    shard: Optional[str] = _SHARD_QUERY,
+):
+    """여러 문서(또는 zip 아카이브)를 한 번에 업로드합니다.
+
+    파일 파싱은 프로세스 풀에서 병렬로 수행되고, 생성된 청크는 큰 배치 단위로 임베딩됩니다.
+    지원하지 않는 형식의 파일은 건너뛰고 skipped_files로 보고합니다.
+
+    Args:
+        files: 업로드할 문서 파일 목록 (.zip 포함 가능)
+        background: True이면 배치 작업을 대기열에 넣고 job id를 즉시 반환
+        shard: 청크를 저장할 shard (VECTOR_SHARD_KEY가 설정된 경우)
+
+    Returns:
+        BaseResponse: 배치 수집 결과 (background 모드에서는 job 정보)
+    """
+    _validate_shard(shard)
+    try:
+        if background:
+            items, skipped = await _ingestion_service.save_batch_uploads(files, shard)
+            try:
+                job = await ingestion_job_manager.submit_batch(items, skipped, shard)
+            except IngestionQueueFullError:
+                _ingestion_service.cleanup(items)
+                raise
+            return BaseResponse(
+                success=True,
+                message=f"Queued {len(items)} files for ingestion",
+                data={
+                    "job_id": job.job_id,
+                    "status": job.status,
+                    "files_total": len(items),
+                    "skipped_files": skipped,
+                    "status_url": f"/v1/documents/jobs/{job.job_id}",
+                }
+            )
+
+        result, skipped = await _ingestion_service.process_batch(files, shard)
+        return BaseResponse(
+            success=True,
+            message=f"Processed {result.files_succeeded}/{result.files_total} files",
+            data={**result.to_dict(), "skipped_files": skipped}
+        )
+    except IngestionQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "ingestion_queue_full",
+                "message": str(e)
+            }
+        )
+    except zipfile.BadZipFile as e:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "file_load_error",
+                "message": f"Invalid zip archive: {e}"
+            }
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/jobs/{job_id}", response_model=BaseResponse)
+async def get_ingestion_job(job_id: str):
+    """백그라운드 수집 작업의 진행 상태와 단계별 소요 시간을 조회합니다.
+
+    Args:
+        job_id: 업로드 시 반환된 job id
+
+    Returns:
+        BaseResponse: 작업 상태 (status, stage, progress, timings 등)
+    """
+    job = ingestion_job_manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "job_not_found",
+                "message": f"Ingestion job '{job_id}' not found"
+            }
+        )
+    return BaseResponse(success=True, data=job.to_dict())
+
+
+@router.post("/search", response_model=BaseResponse)
+async def search_documents(request: SearchRequest):
+    """지식 베이스를 직접 검색합니다. (metadata filter 지원)
+
+    filter 예시: {"file_type": "xlsx", "sheet_name": "2024"}, {"source": ["./user_uploads/a.pdf"]}
+    source, file_name, file_type, sheet_name, slide_number 필드는 미리 색인되어 있어 빠르게 제한됩니다.
+    VECTOR_SHARD_KEY 조건(예: {"department": "hr"})이 있으면 해당 shard만 검색합니다.
+
+    Args:
+        request: 질의, 결과 수(k), 검색 방식(hybrid / dense), metadata filter
+
+    Returns:
+        BaseResponse: 검색 결과 (content, metadata, score)
+            score는 hybrid이면 RRF 점수(클수록 유사), dense이면 거리(작을수록 유사)
+    """
+    try:
+        store = await aget_vector_store()
+        if request.mode == "hybrid":
+            results = await store.ahybrid_search_with_score(request.query, request.k, request.filter)
+        else:
+            results = await store.asimilarity_search_with_score(request.query, request.k, request.filter)
+    except InvalidFilterError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "invalid_filter",
+                "message": str(e)
+            }
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+    return BaseResponse(
+        success=True,
+        data={
+            "count": len(results),
+            "results": [
+                {"content": doc.page_content, "metadata": doc.metadata, "score": float(score)}
+                for doc, score in results
+            ],
+        }
+    )
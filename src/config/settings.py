@@ -24,6 +24,11 @@ class Settings(BaseSettings):
 
     # Common LLM Settings
     LLM_TEMPERATURE: float = 0.7
+    # LLM HTTP 연결 풀: 모든 LLM 인스턴스가 하나의 httpx client(keep-alive)를 공유
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 60.0  # 유휴 연결 유지 시간 (초)
+    LLM_HTTP2: bool = True  # h2 패키지가 설치된 경우에만 적용 (vLLM/HTTP 1.1 서버는 자동으로 HTTP/1.1 사용)
 
     # Anthropic (향후 확장용)
     ANTHROPIC_API_KEY: Optional[str] = None
@@ -37,8 +42,8 @@ class Settings(BaseSettings):
     # ==========================================================
     # Embedding Configuration
     # ==========================================================
-    # Provider: "local" (HuggingFace) or "openai" (OpenAI API)
-    EMBEDDING_PROVIDER: Literal["local", "openai"] = "local"
+    # Provider: "local" (HuggingFace), "openai" (OpenAI API) or "onnx" (ONNX Runtime, CPU)
+    EMBEDDING_PROVIDER: Literal["local", "openai", "onnx"] = "local"
 
     # Local Embedding Settings (HuggingFace)
     LOCAL_EMBEDDING_MODEL: str = "BAAI/bge-m3"
@@ -47,11 +52,119 @@ class Settings(BaseSettings):
     # OpenAI Embedding Settings
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
 
+    # ONNX Embedding Settings (LOCAL_EMBEDDING_MODEL을 ONNX로 export하여 CPU 추론)
+    ONNX_EMBEDDING_DIR: str = "./onnx_models"
+    ONNX_QUANTIZE: bool = True  # int8 dynamic quantization
+    ONNX_NUM_THREADS: int = 0  # 0이면 ONNX Runtime 기본값 (물리 코어 수)
+    ONNX_BATCH_SIZE: int = 32
+    ONNX_MAX_SEQ_LENGTH: int = 0  # 0이면 모델 설정값
+
+    # Embedding Vector Cache (디스크, (provider, model, 텍스트 해시) 기준)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = "./embedding_cache/embeddings.sqlite3"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 500_000
+
+    # Query Embedding Micro-Batching (동시 질의를 최대 N개 / M ms 동안 모아 한 번에 계산)
+    EMBEDDING_QUERY_BATCHING: bool = True
+    EMBEDDING_QUERY_BATCH_MAX_SIZE: int = 32
+    EMBEDDING_QUERY_BATCH_MAX_WAIT_MS: float = 5.0
+
+    # Embedding Worker Pool (embed_documents를 N개 워커 프로세스로 분산, 0이면 API 프로세스에서 계산)
+    EMBEDDING_WORKER_PROCESSES: int = 0
+    EMBEDDING_WORKER_CPUS: str = ""  # 예: "0-15" → 워커 수로 나누어 고정. 빈 값이면 고정하지 않음
+    EMBEDDING_WORKER_MAX_QUEUE: int = 8  # 동시에 제출 가능한 최대 배치 수 (초과 시 대기)
+    EMBEDDING_WORKER_BATCH_SIZE: int = 64  # 워커 호출당 텍스트 수
+
+    # 서버 시작 후 백그라운드에서 임베딩 모델/Chroma를 미리 로드 (False면 첫 요청 시 로드)
+    EMBEDDING_WARMUP_ON_STARTUP: bool = True
+
     # ==========================================================
     # Vector DB
     # ==========================================================
     CHROMA_DB_PATH: str = "./chroma_db"
-    
+    # Compact storage: Chroma에는 앞쪽 N차원만 저장 (Matryoshka 방식, 0이면 전체 차원)
+    # 차원이 바뀌면 별도 컬렉션(soundmind_knowledge_d<N>)을 사용하므로 재색인이 필요합니다.
+    VECTOR_STORAGE_DIMENSIONS: int = 0
+    # Rescoring: 전체 차원 벡터를 해당 정밀도로 별도 저장하고 후보 k × N개를 다시 점수 매김
+    # (VECTOR_STORAGE_DIMENSIONS > 0일 때만 사용, 0이면 Chroma에 전체 차원이 있으므로 무시)
+    VECTOR_RESCORE_PRECISION: Literal["off", "float32", "float16", "int8"] = "off"
+    VECTOR_RESCORE_CANDIDATES: int = 4
+    # Hybrid search: dense + BM25 역색인을 RRF로 결합 (RAG 도구 기본 검색 방식)
+    HYBRID_SEARCH_ENABLED: bool = True
+    HYBRID_CANDIDATES: int = 20  # 각 측에서 가져올 후보 수
+    HYBRID_RRF_K: int = 60
+    HYBRID_LEXICAL_MIN_SCORE_RATIO: float = 0.2  # 최고 BM25 점수 대비 이 비율 미만 후보는 제외
+    # RAG 도구 결과 조립 (context_assembly.py): 후보 RAG_MAX_K개 중 dense 코사인 유사도가 RAG_MIN_SIMILARITY 이상인
+    # 것만 사용(최소 RAG_MIN_K개)하고, 겹치는 인접 청크 병합 / 중복 제거 후 RAG_CONTEXT_MAX_TOKENS(tiktoken) 안에 담음
+    RAG_MAX_K: int = 8
+    RAG_MIN_K: int = 1
+    RAG_MIN_SIMILARITY: float = 0.35
+    RAG_DEDUP_THRESHOLD: float = 0.9  # 토큰 집합의 이 비율 이상이 앞선 결과에 포함되면 중복으로 제외
+    RAG_CONTEXT_MAX_TOKENS: int = 1500  # 0이면 제한 없음
+    # 여러 질의를 한 번에 검색하는 search_knowledge_base_batch 도구의 최대 질의 수 / 합친 결과의 토큰 예산
+    RAG_BATCH_MAX_QUERIES: int = 8
+    RAG_BATCH_CONTEXT_MAX_TOKENS: int = 3000
+    # Query result cache: (정규화된 질의, k, filter) → 검색 결과. 저장소 변경 시 자동 무효화
+    QUERY_CACHE_ENABLED: bool = True
+    QUERY_CACHE_MAX_ENTRIES: int = 1000
+    QUERY_CACHE_TTL_SECONDS: float = 300.0
+    # 비동기 검색/추가(asimilarity_search 등)를 실행하는 전용 스레드 수
+    VECTOR_STORE_ASYNC_WORKERS: int = 4
+    # add_documents 배치: 청크 수 / 토큰 수 중 먼저 도달하는 쪽으로 나눔 (0이면 제한 없음)
+    # 배치 N을 저장하는 동안 배치 N+1을 임베딩하며, 실패한 배치는 지수 backoff로 재시도
+    VECTOR_ADD_BATCH_SIZE: int = 128
+    VECTOR_ADD_BATCH_MAX_TOKENS: int = 100_000
+    # 배치 토큰 수 계산: "chars" (문자 수로 추정, tokenizer 로드 없음) 또는 "tiktoken" (TIKTOKEN_ENCODING 기준)
+    # "tiktoken"은 처음 사용할 때 BPE 파일을 내려받으므로, 오프라인 환경에서는 TIKTOKEN_CACHE_DIR에
+    # 미리 받아 두어야 함 (로드 실패 시 문자 수 추정으로 대체)
+    VECTOR_ADD_BATCH_TOKEN_COUNTER: Literal["chars", "tiktoken"] = "chars"
+    VECTOR_ADD_MAX_RETRIES: int = 3
+    VECTOR_ADD_RETRY_BACKOFF_SECONDS: float = 1.0
+    # Sharding: 이 metadata 키(예: "department", "tenant") 값별로 컬렉션을 나누어 저장 (빈 값이면 단일 컬렉션)
+    # 키가 없는 청크와 기존 데이터는 기본 shard(soundmind_knowledge)에 저장
+    VECTOR_SHARD_KEY: str = ""
+    VECTOR_SHARD_DEFAULT: str = "default"
+    VECTOR_SHARD_SEARCH_WORKERS: int = 8  # 여러 shard를 동시에 검색하는 스레드 수
+    # Dense 검색 backend: "chroma"(HNSW 근사 검색) 또는 "numpy"(메모리 내 float32 행렬 brute-force exact 검색)
+    # numpy는 수십만 청크 이하에서 지연 시간과 recall 모두 유리하며, 첫 검색/warm-up 때 컬렉션에서 색인을 만듭니다.
+    VECTOR_SEARCH_BACKEND: Literal["chroma", "numpy"] = "chroma"
+    # 검색 filter용 필드 색인을 BM25 / exact 색인에 유지할 metadata 필드 (그 밖의 필드는 Chroma where로 조회)
+    FILTER_INDEXED_FIELDS: list[str] = ["source", "file_name", "file_type", "sheet_name", "slide_number"]
+    # 스냅샷 디렉터리 (scripts/snapshot.py export로 생성). 설정하면 warm-up 시 저장소가 비어 있을 때
+    # 재임베딩 없이 bulk import (새 레플리카 cold start용, 빈 값이면 사용 안 함)
+    VECTOR_SNAPSHOT_PATH: str = ""
+
+    # ==========================================================
+    # Ingestion
+    # ==========================================================
+    # 청크 크기 단위: "chars" (문자 수) 또는 "tokens" (CHUNK_TOKENIZER 기준 토큰 수)
+    CHUNK_LENGTH_UNIT: Literal["chars", "tokens"] = "chars"
+    CHUNK_SIZE: int = 500
+    CHUNK_OVERLAP: int = 100
+    # 토큰 길이 기준: "tiktoken" (LLM 프롬프트 예산) 또는 "embedding" (LOCAL_EMBEDDING_MODEL tokenizer)
+    CHUNK_TOKENIZER: Literal["tiktoken", "embedding"] = "tiktoken"
+    TIKTOKEN_ENCODING: str = "cl100k_base"
+
+    # 백그라운드 수집 작업(job) 워커 수 / 대기열 크기 / 완료 작업 보관 개수
+    INGESTION_WORKERS: int = 2
+    INGESTION_QUEUE_SIZE: int = 64
+    INGESTION_JOB_RETENTION: int = 500
+    # 배치 업로드 파싱 프로세스 수 (0이면 CPU 코어 수) / 임베딩 배치 크기(청크 수)
+    INGESTION_PARSE_PROCESSES: int = 0
+    INGESTION_EMBED_BATCH_SIZE: int = 256
+    # 스트리밍 수집: 임베딩/저장 윈도우 크기(청크 수)
+    INGESTION_WINDOW_SIZE: int = 64
+    # 대용량 PDF: 이 페이지 수 이상이면 페이지 범위를 나누어 프로세스 병렬 파싱
+    INGESTION_PDF_PARALLEL_MIN_PAGES: int = 300
+    INGESTION_PDF_PAGES_PER_WORKER: int = 100
+    # Excel 스트리밍: N행 또는 M토큰마다 헤더를 반복한 청크 생성
+    EXCEL_STREAMING: bool = True
+    EXCEL_ROWS_PER_CHUNK: int = 50
+    EXCEL_MAX_TOKENS_PER_CHUNK: int = 400
+    # PowerPoint 추출 엔진: "python-pptx" (객체 모델) 또는 "xml" (슬라이드 XML 스트리밍)
+    PPTX_LOADER_ENGINE: Literal["python-pptx", "xml"] = "python-pptx"
+    PPTX_XML_WORKERS: int = 1  # 2 이상이면 슬라이드를 프로세스 병렬로 추출
+
     # MCP Servers
     # - @antv/mcp-server-chart: 차트/다이어그램 생성 (25+ 종류)
     # - mcp-echarts: Apache ECharts 기반 전문 차트
@@ -0,0 +1,131 @@
+"""Query Embedding Micro-Batcher - 동시 질의 임베딩 묶음 처리
+
+동시에 들어오는 embed_query 요청을 몇 ms 동안(또는 최대 배치 크기까지) 모아
+한 번의 배치 forward pass로 계산하고, 결과를 각 호출자에게 돌려줍니다.
+세션 수십 개가 동시에 RAG 검색을 할 때 batch-size-1 forward pass가 CPU를 두고
+경쟁하는 대신 하나의 배치 연산으로 처리됩니다.
+
+배치 계산은 underlying.embed_documents로 수행합니다. 이 서비스에서 사용하는
+HuggingFaceEmbeddings(query/document encode 설정 동일)와 OpenAIEmbeddings는
+embed_query(text) == embed_documents([text])[0] 이므로 결과가 같습니다.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+
+def embed_queries(embeddings: Embeddings, texts: List[str]) -> List[List[float]]:
+    """여러 질의를 한 번의 배치로 임베딩합니다.
+
+    래퍼(캐시 / 워커 풀 / 마이크로 배치)는 embed_queries로 질의 경로를 유지하고,
+    모델은 embed_documents 배치로 계산합니다. (embed_query와 결과가 같음, 모듈 docstring 참고)
+    """
+    if len(texts) == 1:
+        return [embeddings.embed_query(texts[0])]
+    method = getattr(embeddings, "embed_queries", None)
+    if method is not None:
+        return method(texts)
+    return embeddings.embed_documents(texts)
+
+
+class MicroBatchingEmbeddings(Embeddings):
+    """embed_query를 마이크로 배치로 묶는 Embeddings 래퍼
+
+    sync(embed_query)와 async(aembed_query) 호출 모두 같은 배치 큐를 공유합니다.
+    embed_documents는 이미 배치 호출이므로 그대로 전달합니다.
+    """
+
+    def __init__(self, underlying: Embeddings, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self.underlying = underlying
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self.batches = 0
+        self.queries = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.underlying.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.submit(text).result()
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """이미 배치인 질의 목록은 대기 시간 없이 바로 계산합니다."""
+        if len(texts) == 1:
+            return [self.embed_query(texts[0])]
+        return embed_queries(self.underlying, texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.wrap_future(self.submit(text))
+
+    def submit(self, text: str) -> Future:
+        """질의를 배치 큐에 넣고 결과 Future를 반환합니다."""
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def _ensure_worker(self):
+        if self._worker is not None:
+            return
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="query-embedding-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._process(batch)
+
+    def _process(self, batch: List[Tuple[str, Future]]):
+        # 호출자가 이미 취소한 요청은 제외
+        batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        texts = [text for text, _ in batch]
+        try:
+            vectors = (
+                [self.underlying.embed_query(texts[0])]
+                if len(texts) == 1
+                else self.underlying.embed_documents(texts)
+            )
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.queries += len(batch)
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
+
+    def get_stats(self) -> dict:
+        """배치 처리 통계를 반환합니다."""
+        return {
+            "batches": self.batches,
+            "queries": self.queries,
+            "avg_batch_size": round(self.queries / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+        }
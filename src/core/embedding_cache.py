@@ -0,0 +1,233 @@
+"""Embedding Cache - 디스크 기반 임베딩 벡터 캐시
+
+(provider, model, 정규화된 텍스트 해시)를 키로 임베딩 벡터를 SQLite에 저장합니다.
+동일한 청크(반복되는 머리말, 정책 문단 등)나 반복 질의는 모델을 다시 호출하지 않습니다.
+
+- namespace("provider:model")가 키에 포함되므로 모델이 바뀌면 이전 벡터는 절대 적중하지 않으며,
+  캐시를 열 때 현재 namespace가 아닌 항목은 삭제됩니다.
+- 최대 항목 수를 넘으면 마지막 접근 시각이 오래된 항목부터 제거합니다. (LRU)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+from src.core.embedding_batcher import embed_queries
+
+# SQLite 바인딩 변수 개수 제한을 넘지 않도록 IN 절을 나누는 크기
+_SQL_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings (last_access);
+CREATE INDEX IF NOT EXISTS idx_embeddings_namespace ON embeddings (namespace);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC + 공백 정리)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """SQLite 기반 임베딩 벡터 저장소 (스레드 안전)"""
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_many(self, keys: List[str]) -> dict[str, List[float]]:
+        """저장된 벡터를 조회하고 적중한 항목의 접근 시각을 갱신합니다."""
+        found: dict[str, List[float]] = {}
+        if not keys:
+            return found
+
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(keys), _SQL_BATCH):
+                batch = keys[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+                if rows:
+                    hit_keys = [key for key, _ in rows]
+                    self._conn.execute(
+                        f"UPDATE embeddings SET last_access = ? WHERE key IN ({','.join('?' * len(hit_keys))})",
+                        [now, *hit_keys],
+                    )
+            self._conn.commit()
+        return found
+
+    def put_many(self, namespace: str, items: dict[str, List[float]]):
+        """벡터를 저장하고 최대 항목 수를 넘으면 오래된 항목을 제거합니다."""
+        if not items:
+            return
+
+        now = time.time()
+        rows = [
+            (key, namespace, array("f", vector).tobytes(), now)
+            for key, vector in items.items()
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, namespace, vector, last_access) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._count += self._conn.total_changes - before
+            self._evict()
+            self._conn.commit()
+
+    def purge_other_namespaces(self, namespace: str):
+        """현재 namespace가 아닌 항목(다른 모델/provider의 벡터)을 삭제합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings WHERE namespace != ?", (namespace,))
+            self._conn.commit()
+            self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def clear(self):
+        """모든 캐시 항목을 삭제합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _evict(self):
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        # 한 번에 10% 여유를 두고 제거하여 삽입마다 eviction이 일어나지 않도록 함
+        excess += self.max_entries // 10
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY last_access LIMIT ?)",
+            (excess,),
+        )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+class CachedEmbeddings(Embeddings):
+    """임베딩 캐시를 앞단에 둔 Embeddings 래퍼
+
+    embed_documents / embed_query 모두 캐시를 먼저 조회하고,
+    없는 텍스트만 (중복 제거 후) 원래 Embeddings로 한 번에 계산합니다.
+    """
+
+    def __init__(self, underlying: Embeddings, cache: EmbeddingCache, namespace: str):
+        self.underlying = underlying
+        self.cache = cache
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def _key(self, kind: str, text: str) -> str:
+        digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{self.namespace}:{kind}:{digest}"
+
+    def _record(self, hits: int, misses: int):
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += misses
+
+    def _embed_many(self, kind: str, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(kind, text) for text in texts]
+        found = self.cache.get_many(list(dict.fromkeys(keys)))
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+
+        if missing:
+            texts_to_embed = list(missing.values())
+            vectors = (
+                embed_queries(self.underlying, texts_to_embed)
+                if kind == "q"
+                else self.underlying.embed_documents(texts_to_embed)
+            )
+            computed = dict(zip(missing.keys(), vectors))
+            self.cache.put_many(self.namespace, computed)
+            found.update(computed)
+
+        misses = sum(1 for key in keys if key in missing)
+        self._record(len(keys) - misses, misses)
+        return [found[key] for key in keys]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed_many("d", texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key("q", text)
+        found = self.cache.get_many([key])
+        if key in found:
+            self._record(1, 0)
+            return found[key]
+
+        vector = self.underlying.embed_query(text)
+        self.cache.put_many(self.namespace, {key: vector})
+        self._record(0, 1)
+        return vector
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """여러 질의를 임베딩합니다. 캐시 미스만 (중복 제거 후) 질의 경로의 배치 한 번으로 계산합니다.
+
+        워커 풀이 있어도 질의는 API 프로세스에서 계산됩니다. (ProcessPoolEmbeddings.embed_queries)
+        """
+        return self._embed_many("q", texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = self._key("q", text)
+        found = self.cache.get_many([key])
+        if key in found:
+            self._record(1, 0)
+            return found[key]
+
+        vector = await self.underlying.aembed_query(text)
+        self.cache.put_many(self.namespace, {key: vector})
+        self._record(0, 1)
+        return vector
+
+    def get_stats(self) -> dict:
+        """캐시 적중/미스 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "entries": len(self.cache),
+            "max_entries": self.cache.max_entries,
+            "path": self.cache.path,
+        }
@@ -0,0 +1,206 @@
+"""Embedding Worker Pool - 멀티 프로세스 문서 임베딩
+
+embed_documents 배치를 워커 프로세스 풀로 보내 계산합니다. 대량 수집 시 임베딩이
+모든 코어로 확장되고, API 프로세스(GIL, 질의 임베딩)는 수집 부하와 분리됩니다.
+
+- 각 워커는 시작 시 모델을 한 번만 로드합니다. (spawn 컨텍스트)
+- EMBEDDING_WORKER_CPUS가 지정되면 코어를 워커 수로 나누어 각 워커를 고정(affinity)하고
+  워커의 연산 스레드 수를 할당된 코어 수에 맞춥니다.
+- 동시에 처리 중/대기 중인 배치 수가 max_queue를 넘으면 호출자가 대기합니다. (backpressure)
+- embed_query / embed_queries는 API 프로세스의 모델(질의 마이크로 배치 포함)로 계산합니다.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from src.core.embedding_batcher import embed_queries
+
+# 워커 프로세스 전역 상태
+_worker_embeddings: Optional[Embeddings] = None
+
+
+def parse_cpu_list(spec: str) -> List[int]:
+    """"0-3,8,10-11" 형식의 CPU 목록을 파싱합니다."""
+    cpus: List[int] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def split_cpus(cpus: List[int], processes: int) -> List[List[int]]:
+    """CPU 목록을 워커 수만큼 연속 구간으로 나눕니다. (코어가 부족하면 일부 워커는 공유)"""
+    if not cpus:
+        return [[] for _ in range(processes)]
+    if len(cpus) < processes:
+        return [[cpus[i % len(cpus)]] for i in range(processes)]
+    size, extra = divmod(len(cpus), processes)
+    groups, start = [], 0
+    for i in range(processes):
+        end = start + size + (1 if i < extra else 0)
+        groups.append(cpus[start:end])
+        start = end
+    return groups
+
+
+def _init_worker(provider: str, model: Optional[str], cpu_groups: List[List[int]], counter):
+    """워커 초기화: CPU 고정, 스레드 수 설정, 모델 로드"""
+    global _worker_embeddings
+
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    cpus = cpu_groups[index % len(cpu_groups)]
+
+    if cpus:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+        # torch/ONNX Runtime이 import 되기 전에 스레드 수를 할당된 코어 수로 제한
+        threads = str(len(cpus))
+        os.environ["OMP_NUM_THREADS"] = threads
+        os.environ["MKL_NUM_THREADS"] = threads
+
+    from src.core.embedding_service import EmbeddingService
+
+    _worker_embeddings = EmbeddingService.create_base_embeddings(provider, model)
+
+    if cpus and provider == "local":
+        import torch
+
+        torch.set_num_threads(len(cpus))
+
+
+def _embed_in_worker(texts: List[str]) -> List[List[float]]:
+    return _worker_embeddings.embed_documents(texts)
+
+
+class ProcessPoolEmbeddings(Embeddings):
+    """embed_documents를 워커 프로세스 풀로 분산하는 Embeddings 래퍼
+
+    Args:
+        query_embeddings: embed_query에 사용할 API 프로세스 내 Embeddings
+        provider: 워커에서 로드할 provider
+        model: 워커에서 로드할 모델명 (None이면 provider 기본값)
+        processes: 워커 프로세스 수
+        cpus: 워커에 나누어 고정할 CPU 목록 (빈 목록이면 고정하지 않음)
+        max_queue: 동시에 제출할 수 있는 최대 배치 수
+        batch_size: 워커 한 번 호출당 텍스트 수
+    """
+
+    def __init__(
+        self,
+        query_embeddings: Embeddings,
+        provider: str,
+        model: Optional[str] = None,
+        processes: int = 2,
+        cpus: Optional[List[int]] = None,
+        max_queue: int = 8,
+        batch_size: int = 64,
+    ):
+        self.query_embeddings = query_embeddings
+        self.provider = provider
+        self.model = model
+        self.processes = max(1, processes)
+        self.cpu_groups = split_cpus(cpus or [], self.processes)
+        self.max_queue = max(1, max_queue)
+        self.batch_size = max(1, batch_size)
+
+        self._slots = threading.BoundedSemaphore(self.max_queue)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.in_flight = 0
+        self.batches = 0
+        self.texts = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+
+        executor = self._ensure_executor()
+        futures: List[Future] = []
+        try:
+            for start in range(0, len(texts), self.batch_size):
+                # 큐가 가득 차면 앞선 배치가 끝날 때까지 대기
+                self._slots.acquire()
+                with self._stats_lock:
+                    self.in_flight += 1
+                try:
+                    future = executor.submit(_embed_in_worker, texts[start:start + self.batch_size])
+                except BaseException:
+                    self._release(None)
+                    raise
+                future.add_done_callback(self._release)
+                futures.append(future)
+
+            vectors: List[List[float]] = []
+            for future in futures:
+                vectors.extend(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        with self._stats_lock:
+            self.batches += len(futures)
+            self.texts += len(texts)
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.query_embeddings.embed_query(text)
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """여러 질의도 워커가 아닌 API 프로세스의 모델로 계산합니다."""
+        return embed_queries(self.query_embeddings, texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.query_embeddings.aembed_query(text)
+
+    def _release(self, _future):
+        with self._stats_lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is not None:
+            return self._executor
+        with self._start_lock:
+            if self._executor is None:
+                context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.provider, self.model, self.cpu_groups, context.Value("i", 0)),
+                )
+        return self._executor
+
+    def shutdown(self):
+        """워커 프로세스를 종료합니다."""
+        with self._start_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def get_stats(self) -> dict:
+        """워커 풀 통계를 반환합니다."""
+        return {
+            "processes": self.processes,
+            "started": self._executor is not None,
+            "cpu_groups": self.cpu_groups,
+            "in_flight": self.in_flight,
+            "max_queue": self.max_queue,
+            "batches": self.batches,
+            "texts": self.texts,
+        }
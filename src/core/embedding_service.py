@@ -1,13 +1,24 @@
 """Embedding Service - 임베딩 모델 관리
 
-Local HuggingFace와 OpenAI Embeddings 두 가지 provider를 지원합니다.
+Local HuggingFace, OpenAI, ONNX Runtime(CPU, 선택적 int8 양자화) 세 가지 provider를 지원합니다.
 settings.py의 EMBEDDING_PROVIDER 설정으로 전환할 수 있습니다.
+
+provider 패키지(langchain_huggingface → sentence-transformers/torch, langchain_openai)는
+import 비용이 크므로 해당 provider를 처음 사용할 때 import합니다.
 """
 
+from typing import TYPE_CHECKING
+
 from langchain_core.embeddings import Embeddings
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_openai import OpenAIEmbeddings
 from src.config.settings import get_settings
+from src.core.embedding_cache import CachedEmbeddings, EmbeddingCache
+from src.core.embedding_batcher import MicroBatchingEmbeddings
+from src.core.embedding_pool import ProcessPoolEmbeddings, parse_cpu_list
+
+if TYPE_CHECKING:
+    from langchain_huggingface import HuggingFaceEmbeddings
+    from langchain_openai import OpenAIEmbeddings
+    from src.core.onnx_embeddings import ONNXEmbeddings
 
 settings = get_settings()
 
@@ -15,7 +26,7 @@ settings = get_settings()
 class EmbeddingService:
     """Embedding 서비스 클래스
 
-    Provider 설정에 따라 Local HuggingFace 또는 OpenAI Embeddings를 사용합니다.
+    Provider 설정에 따라 Local HuggingFace, OpenAI 또는 ONNX Embeddings를 사용합니다.
 
     Usage:
         # 기본 설정 사용 (settings.py의 EMBEDDING_PROVIDER 따름)
@@ -24,13 +35,19 @@ class EmbeddingService:
         # 특정 provider 강제 지정
         embeddings = EmbeddingService.get_embeddings(provider="openai")
         embeddings = EmbeddingService.get_embeddings(provider="local")
+        embeddings = EmbeddingService.get_embeddings(provider="onnx")
 
         # 파라미터 오버라이드
         embeddings = EmbeddingService.get_embeddings(model="text-embedding-3-large")
     """
 
-    _local_instance: HuggingFaceEmbeddings | None = None
-    _openai_instance: OpenAIEmbeddings | None = None
+    _local_instance: "HuggingFaceEmbeddings | None" = None
+    _openai_instance: "OpenAIEmbeddings | None" = None
+    _onnx_instance: "ONNXEmbeddings | None" = None
+    _vector_cache: EmbeddingCache | None = None
+    _cached_instances: dict[str, CachedEmbeddings] = {}
+    _batchers: dict[str, MicroBatchingEmbeddings] = {}
+    _worker_pools: dict[str, ProcessPoolEmbeddings] = {}
 
     @classmethod
     def get_embeddings(
@@ -42,37 +59,160 @@ class EmbeddingService:
         """Embedding 인스턴스를 반환합니다.
 
         Args:
-            provider: "local" (HuggingFace) 또는 "openai". None이면 settings 사용
+            provider: "local" (HuggingFace), "openai" 또는 "onnx". None이면 settings 사용
             model: 모델명. None이면 provider에 따른 기본값 사용
             **kwargs: Embeddings 클래스에 전달할 추가 파라미터
 
         Returns:
             Embeddings: LangChain Embeddings 인스턴스
+                (설정에 따라 디스크 캐시 → 문서 임베딩 워커 풀 → 질의 마이크로 배치 → 모델 순으로 감싼 래퍼)
 
         Raises:
             ValueError: 유효하지 않은 provider인 경우
         """
         selected_provider = provider or settings.EMBEDDING_PROVIDER
+        embeddings = cls.create_base_embeddings(selected_provider, model, **kwargs)
+
+        # 파라미터를 오버라이드한 인스턴스는 래핑하지 않음
+        if kwargs:
+            return embeddings
 
         if selected_provider == "local":
-            return cls._get_local_embeddings(model, **kwargs)
+            model_name = model or settings.LOCAL_EMBEDDING_MODEL
         elif selected_provider == "openai":
-            return cls._get_openai_embeddings(model, **kwargs)
+            model_name = model or settings.OPENAI_EMBEDDING_MODEL
         else:
-            raise ValueError(
-                f"Unknown embedding provider: {selected_provider}. Use 'local' or 'openai'"
+            model_name = cls._onnx_model_name(model)
+
+        namespace = f"{selected_provider}:{model_name}"
+        if settings.EMBEDDING_QUERY_BATCHING:
+            embeddings = cls._with_batcher(embeddings, namespace)
+        if settings.EMBEDDING_WORKER_PROCESSES > 0:
+            embeddings = cls._with_worker_pool(embeddings, namespace, selected_provider, model)
+        if settings.EMBEDDING_CACHE_ENABLED:
+            embeddings = cls._with_cache(embeddings, namespace)
+        return embeddings
+
+    @classmethod
+    def create_base_embeddings(
+        cls,
+        provider: str,
+        model: str | None = None,
+        **kwargs
+    ) -> Embeddings:
+        """래퍼 없이 provider의 모델 인스턴스를 반환합니다. (임베딩 워커 프로세스에서도 사용)
+
+        Raises:
+            ValueError: 유효하지 않은 provider인 경우
+        """
+        if provider == "local":
+            return cls._get_local_embeddings(model, **kwargs)
+        if provider == "openai":
+            return cls._get_openai_embeddings(model, **kwargs)
+        if provider == "onnx":
+            return cls._get_onnx_embeddings(model, **kwargs)
+        raise ValueError(
+            f"Unknown embedding provider: {provider}. Use 'local', 'openai' or 'onnx'"
+        )
+
+    @classmethod
+    def _with_worker_pool(
+        cls,
+        embeddings: Embeddings,
+        namespace: str,
+        provider: str,
+        model: str | None
+    ) -> ProcessPoolEmbeddings:
+        """embed_documents를 워커 프로세스 풀로 보내는 래퍼로 감쌉니다.
+
+        embed_query는 감싼 Embeddings(API 프로세스)로 계산합니다.
+        """
+        pool = cls._worker_pools.get(namespace)
+        if pool is not None and pool.query_embeddings is embeddings:
+            return pool
+        if pool is not None:
+            pool.shutdown()
+
+        pool = ProcessPoolEmbeddings(
+            embeddings,
+            provider=provider,
+            model=model,
+            processes=settings.EMBEDDING_WORKER_PROCESSES,
+            cpus=parse_cpu_list(settings.EMBEDDING_WORKER_CPUS),
+            max_queue=settings.EMBEDDING_WORKER_MAX_QUEUE,
+            batch_size=settings.EMBEDDING_WORKER_BATCH_SIZE,
+        )
+        cls._worker_pools[namespace] = pool
+        return pool
+
+    @classmethod
+    def _with_batcher(cls, embeddings: Embeddings, namespace: str) -> MicroBatchingEmbeddings:
+        """동시 embed_query 요청을 묶어 배치 계산하는 래퍼로 감쌉니다."""
+        batcher = cls._batchers.get(namespace)
+        if batcher is not None and batcher.underlying is embeddings:
+            return batcher
+
+        batcher = MicroBatchingEmbeddings(
+            embeddings,
+            max_batch_size=settings.EMBEDDING_QUERY_BATCH_MAX_SIZE,
+            max_wait_ms=settings.EMBEDDING_QUERY_BATCH_MAX_WAIT_MS,
+        )
+        cls._batchers[namespace] = batcher
+        return batcher
+
+    @classmethod
+    def _with_cache(cls, embeddings: Embeddings, namespace: str) -> CachedEmbeddings:
+        """Embeddings를 (provider, model) namespace의 디스크 캐시 래퍼로 감쌉니다.
+
+        기본 모델의 namespace로 캐시를 처음 열 때, 다른 모델/provider의 벡터는 삭제합니다.
+        """
+        cached = cls._cached_instances.get(namespace)
+        if cached is not None and cached.underlying is embeddings:
+            return cached
+
+        if cls._vector_cache is None:
+            cls._vector_cache = EmbeddingCache(
+                settings.EMBEDDING_CACHE_PATH, settings.EMBEDDING_CACHE_MAX_ENTRIES
             )
+            if settings.EMBEDDING_PROVIDER == "local":
+                default_model = settings.LOCAL_EMBEDDING_MODEL
+            elif settings.EMBEDDING_PROVIDER == "onnx":
+                default_model = cls._onnx_model_name()
+            else:
+                default_model = settings.OPENAI_EMBEDDING_MODEL
+            if namespace == f"{settings.EMBEDDING_PROVIDER}:{default_model}":
+                cls._vector_cache.purge_other_namespaces(namespace)
+
+        cached = CachedEmbeddings(embeddings, cls._vector_cache, namespace)
+        cls._cached_instances[namespace] = cached
+        return cached
+
+    @classmethod
+    def get_cache_stats(cls) -> dict:
+        """임베딩 캐시 적중/미스 및 질의 배치 통계를 반환합니다."""
+        return {
+            "enabled": settings.EMBEDDING_CACHE_ENABLED,
+            "namespaces": [cached.get_stats() for cached in cls._cached_instances.values()],
+            "query_batching": {
+                namespace: batcher.get_stats() for namespace, batcher in cls._batchers.items()
+            },
+            "worker_pools": {
+                namespace: pool.get_stats() for namespace, pool in cls._worker_pools.items()
+            },
+        }
 
     @classmethod
     def _get_local_embeddings(
         cls,
         model: str | None = None,
         **kwargs
-    ) -> HuggingFaceEmbeddings:
+    ) -> "HuggingFaceEmbeddings":
         """Local HuggingFace Embeddings 인스턴스 생성
 
         싱글톤 패턴으로 동일한 모델은 재사용합니다.
         """
+        from langchain_huggingface import HuggingFaceEmbeddings
+
         model_name = model or settings.LOCAL_EMBEDDING_MODEL
 
         # 기본 모델이고 캐시된 인스턴스가 있으면 재사용
@@ -97,8 +237,10 @@ class EmbeddingService:
         cls,
         model: str | None = None,
         **kwargs
-    ) -> OpenAIEmbeddings:
+    ) -> "OpenAIEmbeddings":
         """OpenAI Embeddings 인스턴스 생성"""
+        from langchain_openai import OpenAIEmbeddings
+
         model_name = model or settings.OPENAI_EMBEDDING_MODEL
 
         if not settings.OPENAI_API_KEY:
@@ -123,6 +265,47 @@ class EmbeddingService:
 
         return embeddings
 
+    @staticmethod
+    def _onnx_model_name(model: str | None = None) -> str:
+        """ONNX 모델의 캐시 namespace용 이름 (양자화 모델은 벡터가 달라지므로 구분)"""
+        model_name = model or settings.LOCAL_EMBEDDING_MODEL
+        return f"{model_name}@int8" if settings.ONNX_QUANTIZE else model_name
+
+    @classmethod
+    def _get_onnx_embeddings(
+        cls,
+        model: str | None = None,
+        **kwargs
+    ) -> "ONNXEmbeddings":
+        """ONNX Runtime Embeddings 인스턴스 생성
+
+        최초 호출 시 LOCAL_EMBEDDING_MODEL을 ONNX_EMBEDDING_DIR에 export(및 양자화)하며,
+        이후에는 export된 모델을 재사용합니다.
+        """
+        from src.core.onnx_embeddings import ONNXEmbeddings
+
+        model_name = model or settings.LOCAL_EMBEDDING_MODEL
+
+        # 기본 모델이고 캐시된 인스턴스가 있으면 재사용
+        if model_name == settings.LOCAL_EMBEDDING_MODEL and cls._onnx_instance is not None:
+            return cls._onnx_instance
+
+        options = {
+            "base_dir": settings.ONNX_EMBEDDING_DIR,
+            "quantize": settings.ONNX_QUANTIZE,
+            "num_threads": settings.ONNX_NUM_THREADS,
+            "batch_size": settings.ONNX_BATCH_SIZE,
+            "max_seq_length": settings.ONNX_MAX_SEQ_LENGTH,
+        }
+        options.update(kwargs)
+        embeddings = ONNXEmbeddings(model_name=model_name, **options)
+
+        # 기본 모델이면 캐시
+        if model_name == settings.LOCAL_EMBEDDING_MODEL:
+            cls._onnx_instance = embeddings
+
+        return embeddings
+
     @staticmethod
     def get_provider() -> str:
         """현재 설정된 Embedding provider를 반환합니다."""
@@ -139,6 +322,14 @@ class EmbeddingService:
                 "model": settings.LOCAL_EMBEDDING_MODEL,
                 "device": settings.LOCAL_EMBEDDING_DEVICE
             }
+        elif provider == "onnx":
+            return {
+                "provider": "onnx",
+                "model": settings.LOCAL_EMBEDDING_MODEL,
+                "quantized": settings.ONNX_QUANTIZE,
+                "num_threads": settings.ONNX_NUM_THREADS,
+                "model_dir": settings.ONNX_EMBEDDING_DIR
+            }
         else:
             return {
                 "provider": "openai",
@@ -148,6 +339,17 @@ class EmbeddingService:
 
     @classmethod
     def clear_cache(cls) -> None:
-        """캐시된 인스턴스를 초기화합니다."""
+        """캐시된 인스턴스를 초기화합니다. (디스크의 벡터 캐시는 유지)"""
         cls._local_instance = None
         cls._openai_instance = None
+        cls._onnx_instance = None
+        cls._cached_instances = {}
+        cls._batchers = {}
+        cls.shutdown_worker_pools()
+
+    @classmethod
+    def shutdown_worker_pools(cls) -> None:
+        """임베딩 워커 프로세스를 종료합니다."""
+        for pool in cls._worker_pools.values():
+            pool.shutdown()
+        cls._worker_pools = {}
@@ -2,8 +2,16 @@
 
 Local vLLM과 OpenAI API 두 가지 provider를 지원합니다.
 settings.py의 LLM_PROVIDER 설정으로 전환할 수 있습니다.
+
+LLM 인스턴스는 (provider, model, temperature, kwargs)별로 한 번만 생성하여 재사용하고,
+모든 인스턴스가 하나의 httpx 연결 풀(keep-alive, 가능하면 HTTP/2)을 공유합니다.
+호출마다 새 HTTP client를 만들지 않으므로 vLLM / OpenAI 연결을 다시 맺는 비용이 없습니다.
 """
 
+import importlib.util
+import json
+import threading
+
 from langchain_openai import ChatOpenAI
 from src.config.settings import get_settings
 
@@ -27,14 +35,20 @@ class LLMService:
         llm = LLMService.get_llm(temperature=0.3, model="gpt-4o")
     """
 
-    @staticmethod
+    _instances: dict[tuple, ChatOpenAI] = {}
+    _http_client = None
+    _http_async_client = None
+    _lock = threading.Lock()
+
+    @classmethod
     def get_llm(
+        cls,
         provider: str | None = None,
         model: str | None = None,
         temperature: float | None = None,
         **kwargs
     ) -> ChatOpenAI:
-        """LLM 인스턴스를 반환합니다.
+        """LLM 인스턴스를 반환합니다. (같은 설정이면 캐시된 인스턴스)
 
         Args:
             provider: "local" (vLLM) 또는 "openai". None이면 settings 사용
@@ -55,12 +69,69 @@ class LLMService:
         temp = temperature if temperature is not None else settings.LLM_TEMPERATURE
 
         if selected_provider == "local":
-            return LLMService._get_local_llm(model, temp, **kwargs)
+            factory = cls._get_local_llm
         elif selected_provider == "openai":
-            return LLMService._get_openai_llm(model, temp, **kwargs)
+            factory = cls._get_openai_llm
         else:
             raise ValueError(f"Unknown LLM provider: {selected_provider}. Use 'local' or 'openai'")
 
+        key = (selected_provider, model, temp, cls._kwargs_key(kwargs))
+        llm = cls._instances.get(key)
+        if llm is None:
+            with cls._lock:
+                llm = cls._instances.get(key)
+                if llm is None:
+                    llm = factory(model, temp, **cls._with_http_clients(kwargs))
+                    cls._instances[key] = llm
+        return llm
+
+    @staticmethod
+    def _kwargs_key(kwargs: dict) -> str:
+        """추가 파라미터의 캐시 키 (dict / list 값도 허용)"""
+        return json.dumps(kwargs, sort_keys=True, default=repr)
+
+    @classmethod
+    def _with_http_clients(cls, kwargs: dict) -> dict:
+        """호출자가 직접 지정하지 않았으면 공유 httpx client를 사용하도록 합니다."""
+        if "http_client" in kwargs or "http_async_client" in kwargs:
+            return kwargs
+        http_client, http_async_client = cls._get_http_clients()
+        return {"http_client": http_client, "http_async_client": http_async_client, **kwargs}
+
+    @classmethod
+    def _get_http_clients(cls):
+        """공유 httpx (동기, 비동기) client를 반환합니다. (처음 호출 시 생성)
+
+        openai SDK의 기본 client(DefaultHttpxClient)로 만들어 SDK 기본 timeout / redirect 설정은
+        그대로 두고 연결 풀 설정만 바꿉니다.
+        """
+        if cls._http_client is None:
+            import httpx
+            from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+
+            limits = httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+            )
+            # HTTP/2는 h2 패키지가 있을 때만 사용 (없으면 httpx가 ImportError를 냄)
+            http2 = settings.LLM_HTTP2 and importlib.util.find_spec("h2") is not None
+            cls._http_async_client = DefaultAsyncHttpxClient(limits=limits, http2=http2)
+            cls._http_client = DefaultHttpxClient(limits=limits, http2=http2)
+        return cls._http_client, cls._http_async_client
+
+    @classmethod
+    async def aclose(cls):
+        """캐시된 LLM 인스턴스를 비우고 공유 HTTP 연결 풀을 닫습니다. (서버 종료 시)"""
+        with cls._lock:
+            http_client, http_async_client = cls._http_client, cls._http_async_client
+            cls._instances.clear()
+            cls._http_client = cls._http_async_client = None
+        if http_client is not None:
+            http_client.close()
+        if http_async_client is not None:
+            await http_async_client.aclose()
+
     @staticmethod
     def _get_local_llm(model: str | None, temperature: float, **kwargs) -> ChatOpenAI:
         """Local vLLM 인스턴스 생성"""
@@ -0,0 +1,209 @@
+"""ONNX Runtime Embeddings - CPU 최적화 로컬 임베딩
+
+sentence-transformers 모델의 transformer를 ONNX로 export하고(선택적으로 int8 dynamic
+quantization), ONNX Runtime으로 추론합니다. GPU는 vLLM이 사용하므로 CPU 추론 속도를 높이기 위한
+provider입니다. pooling(CLS/mean)과 정규화는 원래 sentence-transformers 설정을 따릅니다.
+
+export 결과는 ONNX_EMBEDDING_DIR/<모델명>/ 에 저장되어 재시작 시 재사용됩니다.
+
+필요 패키지 (optional):
+    uv pip install onnxruntime onnx
+"""
+
+import json
+import os
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+_FP32_FILE = "model.onnx"
+_INT8_FILE = "model.int8.onnx"
+_META_FILE = "embedding_config.json"
+
+
+def _require_onnxruntime():
+    try:
+        import onnxruntime
+    except ImportError as e:
+        raise ImportError(
+            "onnxruntime is required for EMBEDDING_PROVIDER='onnx'. "
+            "Install it with: uv pip install onnxruntime onnx"
+        ) from e
+    return onnxruntime
+
+
+def model_dir(base_dir: str, model_name: str) -> str:
+    """모델별 export 디렉터리 경로"""
+    return os.path.join(base_dir, model_name.replace("/", "__"))
+
+
+def export_onnx(model_name: str, output_dir: str, quantize: bool = True) -> str:
+    """sentence-transformers 모델을 ONNX로 export하고 모델 파일 경로를 반환합니다.
+
+    이미 export된 파일이 있으면 재사용합니다.
+
+    Args:
+        model_name: HuggingFace 모델명 (예: "BAAI/bge-m3")
+        output_dir: export 디렉터리
+        quantize: True이면 int8 dynamic quantization 모델 경로를 반환
+    """
+    fp32_path = os.path.join(output_dir, _FP32_FILE)
+    int8_path = os.path.join(output_dir, _INT8_FILE)
+
+    if not os.path.exists(fp32_path):
+        _export_fp32(model_name, output_dir, fp32_path)
+
+    if not quantize:
+        return fp32_path
+
+    if not os.path.exists(int8_path):
+        _require_onnxruntime()
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        # 2GB 이상 모델(bge-m3 등)은 external data 형식이 필요
+        quantize_dynamic(
+            fp32_path,
+            int8_path,
+            weight_type=QuantType.QInt8,
+            use_external_data_format=True,
+        )
+    return int8_path
+
+
+def _export_fp32(model_name: str, output_dir: str, fp32_path: str):
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(output_dir, exist_ok=True)
+    st_model = SentenceTransformer(model_name, device="cpu")
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+
+    pooling = st_model[1]
+    meta = {
+        "model_name": model_name,
+        "pooling": "cls" if getattr(pooling, "pooling_mode_cls_token", False) else "mean",
+        "max_seq_length": st_model.max_seq_length,
+    }
+
+    dummy = tokenizer(["embedding export"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in dummy]
+    meta["input_names"] = input_names
+
+    class _LastHiddenState(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, *inputs):
+            return self.model(**dict(zip(input_names, inputs))).last_hidden_state
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            _LastHiddenState(transformer),
+            tuple(dummy[name] for name in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+            do_constant_folding=True,
+        )
+
+    tokenizer.save_pretrained(output_dir)
+    with open(os.path.join(output_dir, _META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+
+class ONNXEmbeddings(Embeddings):
+    """ONNX Runtime 기반 sentence embedding
+
+    Args:
+        model_name: HuggingFace 모델명
+        base_dir: export 결과를 저장할 상위 디렉터리
+        quantize: int8 dynamic quantization 사용 여부
+        num_threads: ONNX Runtime intra-op 스레드 수 (0이면 ORT 기본값)
+        batch_size: 한 번에 추론할 텍스트 수
+        max_seq_length: 최대 토큰 길이 (0이면 sentence-transformers 설정값)
+        normalize: L2 정규화 여부 (HuggingFaceEmbeddings의 normalize_embeddings와 동일)
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        base_dir: str = "./onnx_models",
+        quantize: bool = True,
+        num_threads: int = 0,
+        batch_size: int = 32,
+        max_seq_length: int = 0,
+        normalize: bool = True,
+    ):
+        onnxruntime = _require_onnxruntime()
+        from transformers import AutoTokenizer
+
+        self.model_name = model_name
+        self.quantize = quantize
+        self.batch_size = max(1, batch_size)
+        self.normalize = normalize
+
+        export_dir = model_dir(base_dir, model_name)
+        self.model_path = export_onnx(model_name, export_dir, quantize=quantize)
+
+        with open(os.path.join(export_dir, _META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.pooling = meta["pooling"]
+        self.input_names = meta["input_names"]
+        self.max_seq_length = max_seq_length or meta["max_seq_length"]
+
+        self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+
+        options = onnxruntime.SessionOptions()
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = onnxruntime.InferenceSession(
+            self.model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+
+        # 길이순으로 정렬해 배치마다 padding을 최소화하고, 결과는 원래 순서로 복원
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        vectors: List[List[float]] = [None] * len(texts)
+        for start in range(0, len(order), self.batch_size):
+            indices = order[start:start + self.batch_size]
+            batch_vectors = self._encode([texts[i] for i in indices])
+            for index, vector in zip(indices, batch_vectors):
+                vectors[index] = vector.tolist()
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def _encode(self, texts: List[str]):
+        import numpy as np
+
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_seq_length,
+            return_tensors="np",
+        )
+        inputs = {name: encoded[name].astype(np.int64) for name in self.input_names}
+        hidden = self.session.run(["last_hidden_state"], inputs)[0]
+
+        if self.pooling == "cls":
+            pooled = hidden[:, 0]
+        else:
+            mask = encoded["attention_mask"][..., None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+        if self.normalize:
+            pooled = pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled.astype(np.float32)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
 
 class BaseResponse(BaseModel):
@@ -15,3 +15,10 @@ class ChatResponse(BaseModel):
     response: str
     tool_calls: List[Dict[str, Any]] = []
     metadata: Dict[str, Any] = {}
+
+class SearchRequest(BaseModel):
+    query: str
+    k: int = Field(4, ge=1, le=50)
+    mode: Literal["hybrid", "dense"] = "hybrid"
+    # {"file_type": "pdf"}, {"source": [...]}, {"sheet_name": {"$in": [...]}} 형식 (여러 필드는 AND)
+    filter: Optional[Dict[str, Any]] = None
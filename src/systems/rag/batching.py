@@ -0,0 +1,76 @@
+"""Indexing Batches - 벡터 저장소 추가 작업의 배치 분할과 재시도
+
+VectorStore.add_documents는 청크 목록을 청크 수(VECTOR_ADD_BATCH_SIZE)와
+토큰 수(VECTOR_ADD_BATCH_MAX_TOKENS) 중 먼저 도달하는 쪽으로 나누어
+배치마다 임베딩/저장합니다. OpenAI 임베딩 API의 요청 크기 제한을 넘지 않고,
+한 배치가 실패해도 앞서 저장한 배치는 유지됩니다.
+
+토큰 수는 기본적으로 문자 수로 추정합니다. (VECTOR_ADD_BATCH_TOKEN_COUNTER)
+영문은 실제 토큰 수보다 크게, 한글은 비슷하게 잡히며 기본 제한은 API 한도보다 충분히 작습니다.
+"tiktoken"으로 정확히 셀 때는 BPE 파일을 미리 캐시해 두어야 하며, 로드에 실패하면 문자 수로 대체합니다.
+"""
+
+import time
+from typing import Callable, List, TypeVar
+
+from src.config.settings import get_settings
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+# tiktoken 로드에 실패하면 이후 배치 계획은 다시 시도하지 않고 문자 수 추정을 사용
+_tiktoken_failed = False
+
+
+def estimate_token_counts(texts: List[str]) -> List[int]:
+    """배치 계획용 텍스트별 토큰 수 (VECTOR_ADD_BATCH_TOKEN_COUNTER 기준)"""
+    global _tiktoken_failed
+    if settings.VECTOR_ADD_BATCH_TOKEN_COUNTER == "tiktoken" and not _tiktoken_failed:
+        from src.systems.rag.tokenization import get_token_counter
+
+        try:
+            return get_token_counter("tiktoken").count_batch(texts)
+        except Exception as e:
+            _tiktoken_failed = True
+            print(f"tiktoken unavailable for batch planning, falling back to character counts: {e}")
+    return [len(text) for text in texts]
+
+
+def plan_batches(texts: List[str], max_size: int, max_tokens: int) -> List[range]:
+    """texts를 (청크 수, 토큰 수) 제한에 맞는 연속 구간으로 나눕니다.
+
+    Args:
+        max_size: 배치당 최대 청크 수 (0이면 제한 없음)
+        max_tokens: 배치당 최대 토큰 수 (0이면 제한 없음, 토큰 수도 계산하지 않음)
+            한 청크가 단독으로 제한을 넘으면 그 청크만으로 배치를 만듭니다.
+    """
+    if not texts:
+        return []
+    max_size = max_size or len(texts)
+    if not max_tokens:
+        return [range(start, min(start + max_size, len(texts))) for start in range(0, len(texts), max_size)]
+
+    lengths = estimate_token_counts(texts)
+    batches: List[range] = []
+    start, tokens = 0, 0
+    for i, length in enumerate(lengths):
+        if i > start and (i - start >= max_size or tokens + length > max_tokens):
+            batches.append(range(start, i))
+            start, tokens = i, 0
+        tokens += length
+    batches.append(range(start, len(texts)))
+    return batches
+
+
+def call_with_retry(func: Callable[..., T], *args, retries: int = None, backoff: float = None) -> T:
+    """func(*args)를 실패 시 지수 backoff(backoff × 2^n초)로 최대 retries번 다시 시도합니다."""
+    retries = settings.VECTOR_ADD_MAX_RETRIES if retries is None else retries
+    backoff = settings.VECTOR_ADD_RETRY_BACKOFF_SECONDS if backoff is None else backoff
+    for attempt in range(retries + 1):
+        try:
+            return func(*args)
+        except Exception:
+            if attempt == retries:
+                raise
+            time.sleep(backoff * 2 ** attempt)
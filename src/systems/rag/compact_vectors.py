@@ -0,0 +1,196 @@
+"""Compact Vector Storage - 차원 축소 + 저정밀도 rescoring 저장소
+
+bge-m3(1024차원 float32) 벡터를 그대로 Chroma에 저장하면 디스크/메모리 사용량이 빠르게 커집니다.
+
+- 차원 축소 (Matryoshka 방식): 앞쪽 N차원만 남기고 다시 L2 정규화하여 Chroma에 저장합니다.
+  Chroma의 HNSW 인덱스는 float32만 지원하므로 인덱스 크기는 차원 수로 줄입니다.
+- Rescoring: 전체 차원 벡터를 float32 / float16 / int8(벡터별 scale)로 별도 SQLite에 저장하고,
+  Chroma에서 k × N개 후보를 찾은 뒤 전체 차원 벡터로 다시 점수를 매겨 상위 k개를 반환합니다.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Literal, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+Precision = Literal["float32", "float16", "int8"]
+
+# SQLite 바인딩 변수 개수 제한을 넘지 않도록 IN 절을 나누는 크기
+_SQL_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vectors (
+    id TEXT PRIMARY KEY,
+    vector BLOB NOT NULL,
+    scale REAL NOT NULL
+);
+"""
+
+
+def truncate(vectors: np.ndarray, dimensions: int) -> np.ndarray:
+    """앞쪽 dimensions 차원만 남기고 L2 정규화합니다. (dimensions가 0이면 정규화만)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if dimensions and dimensions < vectors.shape[-1]:
+        vectors = vectors[..., :dimensions]
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.clip(norms, 1e-12, None)
+
+
+def encode(vector: np.ndarray, precision: Precision) -> tuple[bytes, float]:
+    """벡터를 지정한 정밀도의 (bytes, scale)로 인코딩합니다."""
+    vector = np.asarray(vector, dtype=np.float32)
+    if precision == "float32":
+        return vector.tobytes(), 1.0
+    if precision == "float16":
+        return vector.astype(np.float16).tobytes(), 1.0
+    if precision == "int8":
+        # 벡터별 대칭 양자화: [-max|x|, max|x|] → [-127, 127]
+        scale = float(np.abs(vector).max()) / 127 or 1.0
+        return np.round(vector / scale).astype(np.int8).tobytes(), scale
+    raise ValueError(f"Unknown precision: {precision}. Use 'float32', 'float16' or 'int8'")
+
+
+def decode(blob: bytes, scale: float, precision: Precision) -> np.ndarray:
+    """encode()로 인코딩한 벡터를 float32로 복원합니다."""
+    dtype = {"float32": np.float32, "float16": np.float16, "int8": np.int8}[precision]
+    return np.frombuffer(blob, dtype=dtype).astype(np.float32) * scale
+
+
+def encode_matrix(vectors: np.ndarray, precision: Precision) -> tuple[np.ndarray, np.ndarray]:
+    """encode()의 행렬 버전: (지정한 정밀도의 배열, 행별 scale)을 반환합니다."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.ones(len(vectors), dtype=np.float32)
+    if precision == "float32":
+        return vectors, scales
+    if precision == "float16":
+        return vectors.astype(np.float16), scales
+    if precision == "int8":
+        scales = np.abs(vectors).max(axis=1) / 127 if len(vectors) else scales
+        scales[scales == 0] = 1.0
+        return np.round(vectors / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+    raise ValueError(f"Unknown precision: {precision}. Use 'float32', 'float16' or 'int8'")
+
+
+def decode_matrix(encoded: np.ndarray, scales: np.ndarray, precision: Precision) -> np.ndarray:
+    """encode_matrix()로 인코딩한 행렬을 float32로 복원합니다."""
+    return np.asarray(encoded).astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+
+
+def bytes_per_vector(dimensions: int, precision: Precision) -> int:
+    """인코딩된 벡터 하나의 크기 (bytes, scale 제외)"""
+    return dimensions * {"float32": 4, "float16": 2, "int8": 1}[precision]
+
+
+class TruncatedEmbeddings(Embeddings):
+    """차원 축소 + 정규화된 벡터를 반환하는 Embeddings 래퍼 (Chroma 저장/검색용)"""
+
+    def __init__(self, underlying: Embeddings, dimensions: int):
+        self.underlying = underlying
+        self.dimensions = dimensions
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return truncate(self.underlying.embed_documents(texts), self.dimensions).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return truncate(self.underlying.embed_query(text), self.dimensions).tolist()
+
+
+class RescoreStore:
+    """rescoring용 전체 차원 벡터 저장소 (SQLite, 스레드 안전)"""
+
+    def __init__(self, path: str, precision: Precision):
+        self.path = path
+        self.precision = precision
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def put_many(self, ids: List[str], vectors: np.ndarray):
+        """벡터를 저장합니다. (같은 id는 덮어씀)"""
+        rows = []
+        for chunk_id, vector in zip(ids, vectors):
+            blob, scale = encode(vector, self.precision)
+            rows.append((chunk_id, blob, scale))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO vectors (id, vector, scale) VALUES (?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def get_many(self, ids: List[str]) -> Dict[str, np.ndarray]:
+        """저장된 벡터를 float32로 복원하여 반환합니다."""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for start in range(0, len(ids), _SQL_BATCH):
+                batch = ids[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT id, vector, scale FROM vectors WHERE id IN ({placeholders})", batch
+                ).fetchall()
+                for chunk_id, blob, scale in rows:
+                    found[chunk_id] = decode(blob, scale, self.precision)
+        return found
+
+    def delete(self, ids: List[str]):
+        with self._lock:
+            for start in range(0, len(ids), _SQL_BATCH):
+                batch = ids[start:start + _SQL_BATCH]
+                self._conn.execute(
+                    f"DELETE FROM vectors WHERE id IN ({','.join('?' * len(batch))})", batch
+                )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+
+    def get_stats(self) -> dict:
+        return {
+            "path": self.path,
+            "precision": self.precision,
+            "count": len(self),
+            "size_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+        }
+
+
+def rescore(
+    query: np.ndarray,
+    candidate_ids: List[str],
+    fallback_scores: List[float],
+    store: RescoreStore,
+    k: int,
+) -> List[tuple[int, float]]:
+    """후보를 전체 차원 벡터로 다시 점수 매겨 상위 k개의 (후보 index, 코사인 유사도)를 반환합니다.
+
+    rescoring 저장소에 없는 후보(모드 전환 이전에 저장된 청크 등)는 fallback_scores(축소 차원 점수)를 사용합니다.
+    """
+    vectors = store.get_many(candidate_ids)
+    scores = np.asarray(fallback_scores, dtype=np.float32)
+
+    available = [i for i, chunk_id in enumerate(candidate_ids) if chunk_id in vectors]
+    if available:
+        query = truncate(query, 0)
+        matrix = truncate(np.stack([vectors[candidate_ids[i]] for i in available]), 0)
+        scores[available] = matrix @ query
+
+    order = np.argsort(-scores, kind="stable")[:k]
+    return [(int(i), float(scores[i])) for i in order]
+
+
+def create_rescore_store(base_dir: str, precision: Optional[str]) -> Optional[RescoreStore]:
+    """설정에 따라 rescoring 저장소를 생성합니다. ("off"이면 None)"""
+    if not precision or precision == "off":
+        return None
+    return RescoreStore(os.path.join(base_dir, f"rescore_vectors_{precision}.sqlite3"), precision)
@@ -0,0 +1,201 @@
+"""Context Assembly - RAG 검색 결과를 토큰 예산 안의 프롬프트 문맥으로 조립
+
+RAGTool이 검색 결과를 그대로 이어 붙이면 chunk_overlap으로 겹치는 인접 청크와 거의 같은 청크가
+프롬프트를 채워, LLM(vLLM) prefill 시간이 늘어납니다. 이 모듈은 검색 결과를 다음 순서로 정리합니다.
+
+1. 적응형 k: dense 유사도(코사인)가 RAG_MIN_SIMILARITY 미만인 후보는 제외 (최소 RAG_MIN_K개는 유지)
+2. 병합: 같은 source / 같은 페이지·시트·슬라이드의 청크가 겹치거나 맞닿으면 하나로 합침
+   - metadata에 start_index(text splitter가 기록한 원문 위치)가 있으면 위치로,
+     없으면(이전에 색인된 청크) 앞 청크의 끝과 뒤 청크의 시작이 같은 텍스트인지로 판단
+3. 중복 제거: 토큰 집합의 RAG_DEDUP_THRESHOLD 이상이 앞선 결과에 포함된 청크는 제외
+4. 예산: 순위대로 RAG_CONTEXT_MAX_TOKENS(tiktoken 기준)까지 담음 (넘치는 청크는 건너뛰고,
+   첫 결과가 예산보다 크면 예산에 맞게 자름)
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+from src.config.settings import get_settings
+from src.systems.rag.lexical_index import tokenize
+
+settings = get_settings()
+
+# 같은 원문 구간으로 보는 metadata 필드 (이 값이 모두 같아야 병합)
+_SECTION_FIELDS = ("source", "page", "sheet_name", "slide_number")
+
+# 위치 정보 없이 텍스트로 겹침을 판단할 때 필요한 최소 겹침 길이 (문자)
+_MIN_TEXT_OVERLAP = 20
+
+
+@dataclass
+class _Passage:
+    """병합 중인 검색 결과 (rank: 가장 좋은 구성 청크의 순위)"""
+
+    rank: int
+    text: str
+    metadata: dict
+    start: Optional[int] = None
+    parts: int = 1
+    tokens: set = field(default_factory=set)
+
+    @property
+    def end(self) -> Optional[int]:
+        return None if self.start is None else self.start + len(self.text)
+
+
+def distance_to_similarity(distance: float) -> float:
+    """정규화 벡터의 제곱 L2 거리(Chroma 기본 l2)를 코사인 유사도로 변환합니다."""
+    return 1 - distance / 2
+
+
+def select_adaptive(
+    scored: Sequence[Tuple[Document, float]],
+    min_similarity: Optional[float] = None,
+    min_k: Optional[int] = None,
+) -> List[Document]:
+    """(Document, 코사인 유사도) 목록에서 유사도 기준을 넘는 문서만 남깁니다. (순서 유지)"""
+    min_similarity = settings.RAG_MIN_SIMILARITY if min_similarity is None else min_similarity
+    min_k = settings.RAG_MIN_K if min_k is None else min_k
+    return [doc for i, (doc, similarity) in enumerate(scored) if i < min_k or similarity >= min_similarity]
+
+
+def _section(metadata: dict) -> tuple:
+    return tuple(metadata.get(name) for name in _SECTION_FIELDS)
+
+
+def _text_overlap(head: str, tail: str) -> int:
+    """head의 끝과 tail의 시작이 겹치는 길이 (없으면 0)"""
+    if len(head) < _MIN_TEXT_OVERLAP or len(tail) < _MIN_TEXT_OVERLAP:
+        return 0
+    probe = tail[:_MIN_TEXT_OVERLAP]
+    position = head.find(probe, max(0, len(head) - len(tail)))
+    while position != -1:
+        if tail.startswith(head[position:]):
+            return len(head) - position
+        position = head.find(probe, position + 1)
+    return 0
+
+
+def _merge_positioned(passages: List[_Passage]) -> List[_Passage]:
+    """start_index 기준으로 겹치거나 맞닿은 구간을 합칩니다."""
+    passages = sorted(passages, key=lambda passage: passage.start)
+    merged = [passages[0]]
+    for passage in passages[1:]:
+        current = merged[-1]
+        if passage.start > current.end:
+            merged.append(passage)
+            continue
+        if passage.end > current.end:
+            current.text += passage.text[current.end - passage.start:]
+        current.rank = min(current.rank, passage.rank)
+        current.parts += passage.parts
+    return merged
+
+
+def _merge_textual(passages: List[_Passage]) -> List[_Passage]:
+    """앞 청크의 끝과 뒤 청크의 시작이 같은 텍스트이면 합칩니다. (체인도 모두 합쳐질 때까지 반복)"""
+    merged = list(passages)
+    changed = True
+    while changed and len(merged) > 1:
+        changed = False
+        for i, head in enumerate(merged):
+            for j, tail in enumerate(merged):
+                if i == j:
+                    continue
+                if tail.text in head.text:
+                    overlap = len(tail.text)
+                    head_text = head.text
+                else:
+                    overlap = _text_overlap(head.text, tail.text)
+                    head_text = head.text + tail.text[overlap:]
+                if not overlap:
+                    continue
+                head.text = head_text
+                head.rank = min(head.rank, tail.rank)
+                head.parts += tail.parts
+                del merged[j]
+                changed = True
+                break
+            if changed:
+                break
+    return merged
+
+
+def merge_adjacent(documents: Sequence[Document]) -> List[_Passage]:
+    """같은 원문 구간에서 겹치거나 맞닿은 청크를 합쳐 순위순 passage 목록을 반환합니다."""
+    groups: dict[tuple, List[_Passage]] = {}
+    for rank, doc in enumerate(documents):
+        start = doc.metadata.get("start_index")
+        # 음수(-1: splitter가 위치를 찾지 못함)이거나 정수가 아니면 위치 정보 없음으로 보고 텍스트로 병합
+        if not isinstance(start, int) or isinstance(start, bool) or start < 0:
+            start = None
+        passage = _Passage(rank, doc.page_content, dict(doc.metadata), start)
+        groups.setdefault(_section(doc.metadata), []).append(passage)
+
+    passages: List[_Passage] = []
+    for group in groups.values():
+        if len(group) == 1:
+            passages.extend(group)
+            continue
+        positioned = [passage for passage in group if passage.start is not None]
+        others = [passage for passage in group if passage.start is None]
+        if positioned:
+            positioned = _merge_positioned(positioned)
+        passages.extend(_merge_textual(positioned + others) if others else positioned)
+    return sorted(passages, key=lambda passage: passage.rank)
+
+
+def drop_near_duplicates(passages: List[_Passage], threshold: Optional[float] = None) -> List[_Passage]:
+    """토큰 집합의 threshold 이상이 앞선(순위가 높은) passage에 포함된 passage를 제외합니다."""
+    threshold = settings.RAG_DEDUP_THRESHOLD if threshold is None else threshold
+    kept: List[_Passage] = []
+    for passage in passages:
+        passage.tokens = set(tokenize(passage.text))
+        if passage.tokens and any(
+            len(passage.tokens & other.tokens) >= threshold * len(passage.tokens) for other in kept
+        ):
+            continue
+        kept.append(passage)
+    return kept
+
+
+def fit_budget(passages: List[_Passage], max_tokens: Optional[int] = None) -> List[Document]:
+    """순위대로 토큰 예산 안에 들어가는 passage를 Document로 반환합니다. (0이면 제한 없음)"""
+    max_tokens = settings.RAG_CONTEXT_MAX_TOKENS if max_tokens is None else max_tokens
+
+    def to_document(passage: _Passage, text: str) -> Document:
+        metadata = passage.metadata
+        if passage.parts > 1:
+            metadata = {**metadata, "merged_chunks": passage.parts}
+            metadata.pop("start_index", None)
+        return Document(page_content=text, metadata=metadata)
+
+    if not max_tokens:
+        return [to_document(passage, passage.text) for passage in passages]
+
+    from src.systems.rag.tokenization import get_token_counter
+
+    lengths = get_token_counter("tiktoken").count_batch([passage.text for passage in passages])
+    selected: List[Document] = []
+    remaining = max_tokens
+    for passage, length in zip(passages, lengths):
+        if length <= remaining:
+            selected.append(to_document(passage, passage.text))
+            remaining -= length
+        elif not selected:
+            # 가장 관련 높은 결과 하나가 예산보다 크면 문자 비율로 잘라서라도 포함
+            cut = max(1, len(passage.text) * remaining // length)
+            selected.append(to_document(passage, passage.text[:cut]))
+            remaining = 0
+        if not remaining:
+            break
+    return selected
+
+
+def assemble(documents: Sequence[Document], max_tokens: Optional[int] = None) -> List[Document]:
+    """순위순 검색 결과를 병합 → 중복 제거 → 토큰 예산 적용한 Document 목록으로 만듭니다."""
+    if not documents:
+        return []
+    return fit_budget(drop_near_duplicates(merge_adjacent(documents)), max_tokens)
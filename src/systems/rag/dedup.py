@@ -0,0 +1,157 @@
+"""Content-hash 기반 중복 제거 및 증분 재수집
+
+파일과 청크의 해시, 청크 분할 설정의 해시를 metadata(file_hash, chunk_hash, chunk_config)에 기록하고,
+(검색 filter용 file_name / file_type도 함께 기록)
+청크 id를 (source, chunk 내용) 해시로 결정적으로 생성합니다.
+같은 문서를 다시 업로드하면 기존 청크 id와 비교하여
+새로 생긴 청크만 임베딩하고 사라진 청크는 삭제합니다.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional
+
+from langchain_core.documents import Document
+
+# 파일 해시 계산 시 읽는 블록 크기
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def hash_file(file_path: str) -> str:
+    """파일 내용의 sha256 해시를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_text(text: str) -> str:
+    """공백을 정규화한 텍스트의 sha256 해시를 반환합니다."""
+    normalized = _WHITESPACE_RE.sub(" ", text).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def chunk_id(source: str, chunk_hash: str) -> str:
+    """source와 청크 해시로 결정적인 벡터 저장소 id를 생성합니다."""
+    source_hash = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return f"{source_hash[:16]}-{chunk_hash[:32]}"
+
+
+@dataclass
+class SyncPlan:
+    """한 source에 대한 증분 동기화 계획"""
+
+    source: str
+    file_hash: str
+    new_ids: List[str] = field(default_factory=list)
+    new_chunks: List[Document] = field(default_factory=list)
+    kept_ids: List[str] = field(default_factory=list)
+    kept_metadatas: List[dict] = field(default_factory=list)
+    removed_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SyncResult:
+    """증분 동기화 결과 (청크 수 기준)"""
+
+    added: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    file_unchanged: bool = False
+
+    def merge(self, other: "SyncResult") -> None:
+        self.added += other.added
+        self.removed += other.removed
+        self.unchanged += other.unchanged
+
+    def to_dict(self) -> dict:
+        return {
+            "chunks_created": self.added,
+            "chunks_removed": self.removed,
+            "chunks_unchanged": self.unchanged,
+            "file_unchanged": self.file_unchanged,
+        }
+
+
+class SyncTracker:
+    """청크 스트림을 하나씩 분류하는 증분 동기화 추적기
+
+    전체 청크 목록을 메모리에 모으지 않고도 (스트리밍 수집)
+    새 청크 / 유지 청크 / 문서 내 중복을 판별하고, 끝난 뒤 삭제 대상 id를 계산합니다.
+    """
+
+    NEW = "new"
+    KEPT = "kept"
+    DUPLICATE = "duplicate"
+
+    def __init__(
+        self,
+        source: str,
+        file_hash: str,
+        existing: dict[str, dict],
+        chunk_config: Optional[str] = None,
+    ):
+        self.source = source
+        self.file_hash = file_hash
+        self.existing = existing
+        self.chunk_config = chunk_config
+        self._seen: set[str] = set()
+
+    def classify(self, chunk: Document) -> tuple[str, str]:
+        """청크에 해시 metadata를 기록하고 (분류, id)를 반환합니다."""
+        digest = hash_text(chunk.page_content)
+        doc_id = chunk_id(self.source, digest)
+        if doc_id in self._seen:
+            return self.DUPLICATE, doc_id
+        self._seen.add(doc_id)
+
+        chunk.metadata["source"] = self.source
+        # 검색 filter용 (loader가 이미 기록한 file_type은 유지)
+        chunk.metadata["file_name"] = os.path.basename(self.source)
+        chunk.metadata.setdefault("file_type", os.path.splitext(self.source)[1].lstrip(".").lower())
+        chunk.metadata["file_hash"] = self.file_hash
+        chunk.metadata["chunk_hash"] = digest
+        if self.chunk_config is not None:
+            chunk.metadata["chunk_config"] = self.chunk_config
+
+        if doc_id in self.existing:
+            return self.KEPT, doc_id
+        return self.NEW, doc_id
+
+    def removed_ids(self) -> List[str]:
+        """지금까지 분류한 청크에 없는 기존 청크 id 목록"""
+        return [doc_id for doc_id in self.existing if doc_id not in self._seen]
+
+
+def plan_sync(
+    source: str,
+    file_hash: str,
+    chunks: Iterable[Document],
+    existing: dict[str, dict],
+    chunk_config: Optional[str] = None,
+) -> SyncPlan:
+    """새 청크 목록과 저장된 청크(id → metadata)를 비교하여 동기화 계획을 만듭니다.
+
+    - 같은 문서 안에서 내용이 동일한 청크는 한 번만 저장합니다.
+    - 이미 저장된 청크는 다시 임베딩하지 않고 metadata만 갱신합니다.
+    - 새 청크 목록에 없는 기존 청크(해시 도입 이전의 청크 포함)는 삭제 대상입니다.
+    """
+    plan = SyncPlan(source=source, file_hash=file_hash)
+    tracker = SyncTracker(source, file_hash, existing, chunk_config)
+
+    for chunk in chunks:
+        kind, doc_id = tracker.classify(chunk)
+        if kind == SyncTracker.KEPT:
+            plan.kept_ids.append(doc_id)
+            plan.kept_metadatas.append(chunk.metadata)
+        elif kind == SyncTracker.NEW:
+            plan.new_ids.append(doc_id)
+            plan.new_chunks.append(chunk)
+
+    plan.removed_ids = tracker.removed_ids()
+    return plan
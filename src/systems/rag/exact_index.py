@@ -0,0 +1,228 @@
+"""Exact Index - NumPy brute-force dense 검색 (VECTOR_SEARCH_BACKEND="numpy")
+
+수십만 청크 이하의 컬렉션에서는 연속된 float32 행렬 전체와의 내적이 HNSW 근사 검색보다
+빠르고 recall도 항상 100%입니다. (bge-m3 벡터는 normalize_embeddings=True로 이미 L2 정규화됨)
+
+- 벡터는 (용량 × 차원) float32 행렬의 행(slot)에 저장하고, 삭제된 slot은 재사용합니다.
+- 거리는 Chroma 기본(l2)과 같은 제곱 L2 거리(‖x‖² + ‖q‖² - 2·x·q)로 반환하므로
+  VectorStore의 shard 병합 / rescoring 경로를 그대로 사용합니다.
+- 상위 k개는 argpartition으로 고르고, 여러 질의는 행렬곱 한 번으로 함께 검색합니다.
+- 본문과 metadata도 함께 보관하여 검색 시 Chroma를 조회하지 않습니다.
+
+Chroma가 원본 저장소이며, 이 색인은 BM25 역색인처럼 첫 검색(또는 warm-up) 때 컬렉션에서 만들고
+이후 add_documents / delete / update_metadatas 시 함께 갱신합니다.
+"""
+
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.systems.rag.metadata_filter import Conditions, FieldIndex
+
+# (id, 본문, metadata, 제곱 L2 거리)
+Hit = Tuple[str, str, Optional[dict], float]
+
+
+class ExactIndex:
+    """brute-force dense 색인 (스레드 안전)
+
+    Args:
+        indexed_fields: filter용 값 색인을 유지할 metadata 필드 목록
+    """
+
+    def __init__(self, indexed_fields: Iterable[str] = ()):
+        self._fields = FieldIndex(indexed_fields)
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._sq_norms = np.zeros(0, dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._ids: List[Optional[str]] = []
+        self._texts: List[Optional[str]] = []
+        self._metadatas: List[Optional[dict]] = []
+        self._slots: dict[str, int] = {}
+        self._free: List[int] = []
+        self._lock = threading.RLock()
+
+    @property
+    def dimensions(self) -> int:
+        return self._matrix.shape[1]
+
+    def add(
+        self,
+        ids: Iterable[str],
+        vectors,
+        texts: Iterable[str],
+        metadatas: Optional[Iterable[Optional[dict]]] = None,
+    ):
+        """벡터를 색인합니다. (같은 id는 교체)"""
+        ids, texts = list(ids), list(texts)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if not ids:
+            return
+        metadatas = list(metadatas) if metadatas is not None else [None] * len(ids)
+        with self._lock:
+            if not self.dimensions:
+                self._matrix = np.zeros((0, vectors.shape[1]), dtype=np.float32)
+            elif vectors.shape[1] != self.dimensions:
+                raise ValueError(f"Vector dimensions mismatch: {vectors.shape[1]} != {self.dimensions}")
+
+            slots = []
+            for doc_id, text, metadata in zip(ids, texts, metadatas):
+                if doc_id in self._slots:
+                    self._remove(doc_id)
+                slot = self._allocate(doc_id)
+                self._texts[slot] = text
+                self._metadatas[slot] = dict(metadata) if metadata else None
+                self._fields.add(slot, metadata)
+                slots.append(slot)
+            slots = np.asarray(slots, dtype=np.int64)
+            self._matrix[slots] = vectors
+            self._sq_norms[slots] = np.einsum("ij,ij->i", vectors, vectors)
+            self._live[slots] = True
+
+    def update_metadata(self, ids: Iterable[str], metadatas: Iterable[dict]):
+        """metadata를 갱신합니다. (벡터는 유지)"""
+        with self._lock:
+            for doc_id, metadata in zip(ids, metadatas):
+                slot = self._slots.get(doc_id)
+                if slot is not None:
+                    self._metadatas[slot] = dict(metadata) if metadata else None
+                    self._fields.remove(slot)
+                    self._fields.add(slot, metadata)
+
+    def delete(self, ids: Iterable[str]):
+        """벡터를 색인에서 제거합니다."""
+        with self._lock:
+            for doc_id in ids:
+                if doc_id in self._slots:
+                    self._remove(doc_id)
+
+    def can_filter(self, conditions: Conditions) -> bool:
+        """모든 조건 필드가 색인된 필드인지 여부"""
+        return self._fields.can_filter(conditions)
+
+    def _allocate(self, doc_id: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot] = doc_id
+        else:
+            slot = len(self._ids)
+            self._ids.append(doc_id)
+            self._texts.append(None)
+            self._metadatas.append(None)
+            if slot >= len(self._matrix):
+                self._grow(max(1024, 2 * len(self._matrix)))
+        self._slots[doc_id] = slot
+        return slot
+
+    def _grow(self, capacity: int):
+        matrix = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        matrix[:len(self._matrix)] = self._matrix
+        self._matrix = matrix
+        self._sq_norms = np.concatenate([self._sq_norms, np.zeros(capacity - len(self._sq_norms), np.float32)])
+        self._live = np.concatenate([self._live, np.zeros(capacity - len(self._live), bool)])
+
+    def _remove(self, doc_id: str):
+        slot = self._slots.pop(doc_id)
+        self._fields.remove(slot)
+        self._live[slot] = False
+        self._ids[slot] = self._texts[slot] = self._metadatas[slot] = None
+        self._free.append(slot)
+
+    def search(
+        self,
+        query_vector,
+        k: int = 4,
+        conditions: Optional[Conditions] = None,
+        allowed_ids: Optional[Iterable[str]] = None,
+    ) -> List[Hit]:
+        """거리가 가까운 상위 k개를 반환합니다."""
+        return self.search_batch([query_vector], k, conditions, allowed_ids)[0]
+
+    def search_batch(
+        self,
+        query_vectors,
+        k: int = 4,
+        conditions: Optional[Conditions] = None,
+        allowed_ids: Optional[Iterable[str]] = None,
+    ) -> List[List[Hit]]:
+        """여러 질의를 행렬곱 한 번으로 검색하여 질의별 상위 k개를 반환합니다.
+
+        Args:
+            conditions: {필드: 허용 값 목록} 조건 (모두 색인된 필드여야 함)
+            allowed_ids: 검색 대상을 이 id로 제한 (색인되지 않은 필드 filter용)
+        """
+        queries = np.atleast_2d(np.asarray(query_vectors, dtype=np.float32))
+        with self._lock:
+            if not self._slots or k <= 0:
+                return [[] for _ in queries]
+            if queries.shape[1] != self.dimensions:
+                raise ValueError(f"Query dimensions mismatch: {queries.shape[1]} != {self.dimensions}")
+
+            rows = None
+            if conditions:
+                rows = self._fields.allowed_slots(conditions)
+            if allowed_ids is not None:
+                allowed = np.unique(np.fromiter(
+                    (self._slots[doc_id] for doc_id in allowed_ids if doc_id in self._slots),
+                    dtype=np.int64,
+                ))
+                rows = allowed if rows is None else np.intersect1d(rows, allowed, assume_unique=True)
+
+            if rows is None:
+                end = len(self._ids)
+                matrix, sq_norms = self._matrix[:end], self._sq_norms[:end]
+                dead = ~self._live[:end]
+            else:
+                if not len(rows):
+                    return [[] for _ in queries]
+                matrix, sq_norms = self._matrix[rows], self._sq_norms[rows]
+                dead = None
+
+            # (질의 수 × 후보 수) 제곱 L2 거리
+            distances = sq_norms[None, :] - 2 * (queries @ matrix.T)
+            distances += np.einsum("ij,ij->i", queries, queries)[:, None]
+            if dead is not None and dead.any():
+                distances[:, dead] = np.inf
+
+            n = min(k, len(self._slots) if rows is None else len(rows))
+            if n < distances.shape[1]:
+                top = np.argpartition(distances, n - 1, axis=1)[:, :n]
+            else:
+                top = np.broadcast_to(np.arange(distances.shape[1]), (len(queries), distances.shape[1]))
+            top_distances = np.take_along_axis(distances, top, axis=1)
+            order = np.argsort(top_distances, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_distances = np.take_along_axis(top_distances, order, axis=1)
+
+            results = []
+            for columns, row_distances in zip(top, top_distances):
+                slots = columns if rows is None else rows[columns]
+                # 검색 결과의 metadata를 수정해도 색인이 바뀌지 않도록 복사
+                results.append([
+                    (self._ids[slot], self._texts[slot], dict(self._metadatas[slot] or {}), float(max(distance, 0.0)))
+                    for slot, distance in zip(slots.tolist(), row_distances.tolist())
+                ])
+            return results
+
+    def clear(self):
+        with self._lock:
+            self._fields.clear()
+            self._matrix = np.zeros((0, 0), dtype=np.float32)
+            self._sq_norms = np.zeros(0, dtype=np.float32)
+            self._live = np.zeros(0, dtype=bool)
+            self._ids.clear()
+            self._texts.clear()
+            self._metadatas.clear()
+            self._slots.clear()
+            self._free.clear()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get_stats(self) -> dict:
+        return {
+            "documents": len(self._slots),
+            "dimensions": self.dimensions,
+            "size_bytes": int(self._matrix.nbytes),
+        }
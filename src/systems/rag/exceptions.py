@@ -24,3 +24,41 @@ class FileLoadError(RAGException):
         self.reason = reason
         message = f"Failed to load file '{file_path}': {reason}"
         super().__init__(message)
+
+
+class IngestionQueueFullError(RAGException):
+    """수집 작업 대기열이 가득 찬 경우의 예외"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        message = f"Ingestion queue is full (max {max_size} pending jobs). Try again later."
+        super().__init__(message)
+
+
+class IndexingBatchError(RAGException):
+    """벡터 저장소 배치 저장 실패 예외 (앞선 배치는 저장된 상태)"""
+
+    def __init__(self, added: int, total: int, reason: str):
+        self.added = added
+        self.total = total
+        self.reason = reason
+        message = f"Failed to index chunks after {added}/{total} were stored: {reason}"
+        super().__init__(message)
+
+
+class SnapshotError(RAGException):
+    """벡터 인덱스 스냅샷 export / import 실패 예외"""
+
+    def __init__(self, path: str, reason: str):
+        self.path = path
+        self.reason = reason
+        message = f"Invalid vector index snapshot '{path}': {reason}"
+        super().__init__(message)
+
+
+class InvalidFilterError(RAGException, ValueError):
+    """검색 metadata filter 형식 오류 (지원하지 않는 필드 이름, 연산자 또는 값 타입)"""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(reason)
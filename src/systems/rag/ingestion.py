@@ -1,86 +1,590 @@
+import asyncio
+import multiprocessing
 import os
 import shutil
-from typing import List
+import time
+import uuid
+import zipfile
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Tuple
 from fastapi import UploadFile
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
-from langchain_community.document_loaders import PyPDFLoader, TextLoader, Docx2txtLoader
-from src.systems.rag.vector_store import vector_store
-from src.systems.rag.loaders import ExcelLoader, PowerPointLoader
+from src.config.settings import get_settings
+from src.systems.rag.vector_store import get_vector_store
+from src.systems.rag.parsing import (
+    chunking_fingerprint,
+    count_pdf_pages,
+    create_text_splitter,
+    iter_documents,
+    parse_file_safe,
+    parse_pdf_range_safe,
+    split_documents,
+)
+from src.systems.rag.dedup import SyncPlan, SyncResult, SyncTracker, hash_file, plan_sync
 from src.systems.rag.exceptions import UnsupportedFileTypeError, FileLoadError
 
+settings = get_settings()
+
+# 단계 완료 콜백: (stage 이름, 소요 시간(초))
+StageCallback = Callable[[str, float], None]
+
+# 배치 진행 콜백: (처리된 파일 수, 전체 파일 수, 생성된 청크 수)
+BatchProgressCallback = Callable[[int, int, int], None]
+
+# 청크 진행 콜백: (지금까지 저장된 새 청크 수). 벡터 저장소 배치가 저장될 때마다 호출
+ChunkProgressCallback = Callable[[int], None]
+
+# 배치 수집 대상: (디스크 저장 경로, metadata source)
+BatchItem = Tuple[str, str]
+
+
+@dataclass
+class BatchResult:
+    """배치 수집 결과"""
+
+    files_total: int
+    files_succeeded: int = 0
+    files_unchanged: int = 0
+    sync: SyncResult = field(default_factory=SyncResult)
+    failed: dict[str, str] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def chunks_created(self) -> int:
+        return self.sync.added
+
+    def to_dict(self) -> dict:
+        return {
+            "files_total": self.files_total,
+            "files_succeeded": self.files_succeeded,
+            "files_unchanged": self.files_unchanged,
+            "files_failed": len(self.failed),
+            "chunks_created": self.sync.added,
+            "chunks_removed": self.sync.removed,
+            "chunks_unchanged": self.sync.unchanged,
+            "failed": self.failed,
+            "timings": {name: round(sec, 4) for name, sec in self.timings.items()},
+        }
+
+
 class IngestionService:
     # 지원하는 파일 확장자 목록
     SUPPORTED_EXTENSIONS = {".pdf", ".txt", ".docx", ".xlsx", ".pptx"}
 
+    # 배치 업로드 시 압축 해제하는 아카이브 확장자
+    ARCHIVE_EXTENSIONS = {".zip"}
+
+    # 수집 파이프라인 단계 (순서대로 실행)
+    STAGES = ("load", "split", "embed")
+
     def __init__(self):
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=500,
-            chunk_overlap=100,
-            length_function=len,
-        )
+        self.text_splitter = create_text_splitter()
         self.upload_dir = "./user_uploads"
         os.makedirs(self.upload_dir, exist_ok=True)
 
-    async def process_file(self, file: UploadFile) -> int:
-        # 1. 파일 확장자 검증
-        file_ext = os.path.splitext(file.filename)[1].lower()
+    async def process_file(self, file: UploadFile, shard: Optional[str] = None) -> SyncResult:
+        # 1. 파일 확장자 검증 및 저장
+        file_path = await self.save_upload(file)
+
+        try:
+            # 2. Load → Split → Index (CPU 작업은 이벤트 루프 밖에서 실행)
+            return await asyncio.to_thread(
+                lambda: self.ingest_path(
+                    file_path,
+                    self.source_path(file.filename, shard),
+                    metadata=self.shard_metadata(shard),
+                )
+            )
+        finally:
+            # 3. Cleanup
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    async def process_batch(
+        self, files: List[UploadFile], shard: Optional[str] = None
+    ) -> Tuple[BatchResult, List[str]]:
+        """여러 파일(또는 zip 아카이브)을 한 번에 수집합니다.
+
+        Returns:
+            (BatchResult, 건너뛴 파일 목록)
+        """
+        items, skipped = await self.save_batch_uploads(files, shard)
+        try:
+            result = await asyncio.to_thread(
+                lambda: self.ingest_batch(items, metadata=self.shard_metadata(shard))
+            )
+        finally:
+            self.cleanup(items)
+        return result, skipped
+
+    def validate_extension(self, filename: str) -> str:
+        """파일 확장자를 검증하고 소문자 확장자를 반환합니다."""
+        file_ext = os.path.splitext(filename)[1].lower()
         if file_ext not in self.SUPPORTED_EXTENSIONS:
             raise UnsupportedFileTypeError(
                 extension=file_ext,
                 supported=list(self.SUPPORTED_EXTENSIONS)
             )
+        return file_ext
+
+    def source_path(self, filename: str, shard: Optional[str] = None) -> str:
+        """청크 metadata의 source로 기록할 경로를 반환합니다.
+
+        shard를 지정하면 다른 shard의 같은 파일명과 겹치지 않도록 경로에 포함합니다.
+        """
+        if shard:
+            return os.path.join(self.upload_dir, shard, filename)
+        return os.path.join(self.upload_dir, filename)
+
+    @staticmethod
+    def shard_metadata(shard: Optional[str]) -> Optional[dict]:
+        """청크를 shard로 라우팅하기 위해 추가할 metadata ({VECTOR_SHARD_KEY: shard})"""
+        if not shard or not settings.VECTOR_SHARD_KEY:
+            return None
+        return {settings.VECTOR_SHARD_KEY: shard}
+
+    def _unique_path(self, filename: str) -> str:
+        """동일 파일명 동시 업로드에도 충돌하지 않는 저장 경로를 생성합니다."""
+        return os.path.join(self.upload_dir, f"{uuid.uuid4().hex}_{os.path.basename(filename)}")
+
+    async def save_upload(self, file: UploadFile) -> str:
+        """업로드 파일을 고유한 임시 경로에 저장하고 그 경로를 반환합니다."""
+        self.validate_extension(file.filename)
+
+        file_path = self._unique_path(file.filename)
+        await asyncio.to_thread(self._copy_upload, file, file_path)
+        return file_path
+
+    async def save_batch_uploads(
+        self, files: List[UploadFile], shard: Optional[str] = None
+    ) -> Tuple[List[BatchItem], List[str]]:
+        """배치 업로드 파일을 저장하고 zip 아카이브는 압축을 풉니다.
+
+        지원하지 않는 형식의 파일은 배치 전체를 실패시키지 않고 건너뜁니다.
+
+        Returns:
+            (수집 대상 목록, 건너뛴 파일 목록)
+        """
+        items: List[BatchItem] = []
+        skipped: List[str] = []
 
-        # 2. Save file temporarily
-        file_path = os.path.join(self.upload_dir, file.filename)
+        try:
+            for file in files:
+                file_ext = os.path.splitext(file.filename)[1].lower()
+
+                if file_ext in self.ARCHIVE_EXTENSIONS:
+                    archive_path = self._unique_path(file.filename)
+                    await asyncio.to_thread(self._copy_upload, file, archive_path)
+                    try:
+                        extracted, archive_skipped = await asyncio.to_thread(
+                            self._extract_archive, archive_path, file.filename, shard
+                        )
+                    finally:
+                        os.remove(archive_path)
+                    items.extend(extracted)
+                    skipped.extend(archive_skipped)
+                elif file_ext in self.SUPPORTED_EXTENSIONS:
+                    file_path = self._unique_path(file.filename)
+                    await asyncio.to_thread(self._copy_upload, file, file_path)
+                    items.append((file_path, self.source_path(file.filename, shard)))
+                else:
+                    skipped.append(file.filename)
+        except Exception:
+            # 중간에 실패하면(손상된 zip 등) 이미 저장한 파일 정리
+            self.cleanup(items)
+            raise
+
+        return items, skipped
+
+    @staticmethod
+    def _copy_upload(file: UploadFile, file_path: str):
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
 
-        try:
-            # 3. Load Documents
-            documents = self._load_file(file_path)
+    def _extract_archive(
+        self, archive_path: str, archive_name: str, shard: Optional[str] = None
+    ) -> Tuple[List[BatchItem], List[str]]:
+        """zip 아카이브에서 지원 형식의 파일만 추출합니다.
 
-            # 4. Split Documents
-            chunks = self.text_splitter.split_documents(documents)
+        아카이브 내부 경로는 디스크 경로로 사용하지 않으므로(zip slip 방지)
+        source에만 "<archive>/<member>" 형태로 기록됩니다.
+        """
+        items: List[BatchItem] = []
+        skipped: List[str] = []
 
-            # 5. Index to Vector Store
-            if chunks:
-                vector_store.add_documents(chunks)
+        with zipfile.ZipFile(archive_path) as archive:
+            for member in archive.infolist():
+                if member.is_dir():
+                    continue
+                member_name = f"{archive_name}/{member.filename}"
+                if os.path.splitext(member.filename)[1].lower() not in self.SUPPORTED_EXTENSIONS:
+                    skipped.append(member_name)
+                    continue
 
-            return len(chunks)
-        finally:
-            # 6. Cleanup
+                file_path = self._unique_path(member.filename)
+                with archive.open(member) as src, open(file_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                items.append((file_path, self.source_path(member_name, shard)))
+
+        return items, skipped
+
+    @staticmethod
+    def cleanup(items: List[BatchItem]):
+        """저장된 임시 파일을 삭제합니다."""
+        for file_path, _ in items:
             if os.path.exists(file_path):
                 os.remove(file_path)
 
-    def _load_file(self, file_path: str) -> List[Document]:
-        """파일 확장자에 따라 적절한 로더를 선택하여 문서를 로드합니다."""
-        file_ext = os.path.splitext(file_path)[1].lower()
+    def ingest_path(
+        self,
+        file_path: str,
+        source: Optional[str] = None,
+        on_stage: Optional[StageCallback] = None,
+        on_progress: Optional[ChunkProgressCallback] = None,
+        metadata: Optional[dict] = None,
+    ) -> SyncResult:
+        """저장된 파일을 load → split → embed 스트리밍 파이프라인으로 처리합니다.
 
-        loader_map = {
-            ".pdf": lambda: PyPDFLoader(file_path),
-            ".txt": lambda: TextLoader(file_path, encoding="utf-8"),
-            ".docx": lambda: Docx2txtLoader(file_path),
-            ".xlsx": lambda: ExcelLoader(file_path),
-            ".pptx": lambda: PowerPointLoader(file_path),
-        }
+        페이지(시트/슬라이드) 단위로 로드하여 바로 분할하고, 새 청크는
+        INGESTION_WINDOW_SIZE 개씩 모아 임베딩/저장하므로 파일 크기와 관계없이
+        메모리 사용량이 일정합니다. 페이지가 많은 PDF는 페이지 범위를 나누어
+        워커 프로세스에서 병렬로 파싱합니다.
 
-        loader_factory = loader_map.get(file_ext)
-        if loader_factory is None:
-            raise UnsupportedFileTypeError(
-                extension=file_ext,
-                supported=list(loader_map.keys())
+        파일 해시와 청크 분할 설정이 이미 저장된 청크와 같으면 파싱/임베딩을 건너뛰고
+        (metadata만 반영),
+        내용이 바뀐 경우에도 새로 생긴 청크만 임베딩합니다. (dedup.SyncTracker 참고)
+        동기 함수이므로 이벤트 루프에서는 스레드/워커를 통해 호출해야 합니다.
+
+        Args:
+            file_path: 디스크에 저장된 파일 경로
+            source: metadata["source"]로 기록할 값. None이면 file_path 그대로 사용
+            on_stage: 각 단계가 끝날 때마다 (stage, 누적 소요 시간)으로 호출되는 콜백.
+                스트리밍 중에는 단계가 번갈아 실행되므로 첫 청크가 나오면 load / split,
+                마지막 윈도우를 저장하면 embed를 보고하고, 윈도우마다 누적 시간을 다시 보고합니다.
+                (같은 단계가 여러 번 보고될 수 있음)
+            on_progress: 새 청크가 벡터 저장소에 배치 단위로 저장될 때마다
+                (지금까지 저장된 새 청크 수)로 호출되는 콜백
+            metadata: 모든 청크에 추가할 metadata (shard 라우팅 키 등)
+
+        Returns:
+            SyncResult: 추가/삭제/유지된 청크 수
+        """
+        source = source or file_path
+        started = time.perf_counter()
+
+        # 0. 동일 파일 재업로드 확인
+        file_hash = hash_file(file_path)
+        chunk_config = chunking_fingerprint()
+        existing = get_vector_store().get_source_entries(source)
+        if self._is_unchanged(existing, file_hash, chunk_config):
+            self._update_unchanged_metadata(existing, metadata)
+            for stage in self.STAGES:
+                started = self._finish_stage(stage, started, on_stage)
+            return SyncResult(unchanged=len(existing), file_unchanged=True)
+
+        timings = dict.fromkeys(self.STAGES, 0.0)
+        timings["load"] = time.perf_counter() - started
+        window_size = max(1, settings.INGESTION_WINDOW_SIZE)
+        tracker = SyncTracker(source, file_hash, existing, chunk_config)
+        result = SyncResult()
+        new_ids: List[str] = []
+        new_chunks: List[Document] = []
+        kept_ids: List[str] = []
+        kept_metadatas: List[dict] = []
+
+        def report(*stages: str):
+            if on_stage is not None:
+                for stage in stages:
+                    on_stage(stage, timings[stage])
+
+        def flush_new():
+            embed_started = time.perf_counter()
+            get_vector_store().add_documents(
+                new_chunks,
+                ids=new_ids,
+                on_progress=(
+                    (lambda done, _total: on_progress(result.added + done))
+                    if on_progress is not None
+                    else None
+                ),
             )
+            timings["embed"] += time.perf_counter() - embed_started
+            report("load", "split")
+            result.added += len(new_chunks)
+            new_ids.clear()
+            new_chunks.clear()
 
-        try:
-            loader = loader_factory()
-            documents = loader.load()
+        def flush_kept():
+            get_vector_store().update_metadatas(kept_ids, kept_metadatas)
+            result.unchanged += len(kept_ids)
+            kept_ids.clear()
+            kept_metadatas.clear()
 
-            if not documents:
-                raise FileLoadError(file_path, "No content extracted from file")
-            return documents
+        # 1~3. Load → Split → Index (윈도우 단위)
+        first_chunk = True
+        for chunk in self._iter_chunks(file_path, source, timings):
+            if first_chunk:
+                # 첫 청크가 나오면 작업 단계를 embed로 진행 (이후 load / split과 embed가 번갈아 실행)
+                report("load", "split")
+                first_chunk = False
+            if metadata:
+                chunk.metadata.update(metadata)
+            kind, doc_id = tracker.classify(chunk)
+            if kind == SyncTracker.NEW:
+                new_ids.append(doc_id)
+                new_chunks.append(chunk)
+                if len(new_chunks) >= window_size:
+                    flush_new()
+            elif kind == SyncTracker.KEPT:
+                kept_ids.append(doc_id)
+                kept_metadatas.append(chunk.metadata)
+                if len(kept_ids) >= window_size:
+                    flush_kept()
 
-        except (UnsupportedFileTypeError, FileLoadError):
-            raise
-        except Exception as e:
-            raise FileLoadError(file_path, str(e))
+        if new_chunks:
+            flush_new()
+        if kept_ids:
+            flush_kept()
+        report(*self.STAGES)
+
+        # 4. 재업로드로 사라진 청크 삭제
+        removed_ids = tracker.removed_ids()
+        get_vector_store().delete(ids=removed_ids)
+        result.removed = len(removed_ids)
+        return result
+
+    def _iter_chunks(
+        self, file_path: str, source: str, timings: dict[str, float]
+    ) -> Iterator[Document]:
+        """파일의 청크를 하나씩 생성합니다. (단계별 소요 시간을 timings에 누적)
+
+        페이지가 INGESTION_PDF_PARALLEL_MIN_PAGES 이상인 PDF는 페이지 범위를
+        워커 프로세스에 나누어 파싱하며, 이때 분할 시간은 load에 포함됩니다.
+        """
+        if self._should_parallelize_pdf(file_path):
+            yield from self._iter_pdf_chunks_parallel(file_path, source, timings)
+            return
+
+        documents = iter_documents(file_path)
+        while True:
+            load_started = time.perf_counter()
+            document = next(documents, None)
+            timings["load"] += time.perf_counter() - load_started
+            if document is None:
+                break
+
+            document.metadata["source"] = source
+            split_started = time.perf_counter()
+            chunks = split_documents([document], self.text_splitter)
+            timings["split"] += time.perf_counter() - split_started
+            yield from chunks
+
+    @staticmethod
+    def _should_parallelize_pdf(file_path: str) -> bool:
+        if os.path.splitext(file_path)[1].lower() != ".pdf":
+            return False
+        if (settings.INGESTION_PARSE_PROCESSES or os.cpu_count() or 1) < 2:
+            return False
+        return count_pdf_pages(file_path) >= settings.INGESTION_PDF_PARALLEL_MIN_PAGES
+
+    @staticmethod
+    def _iter_pdf_chunks_parallel(
+        file_path: str, source: str, timings: dict[str, float]
+    ) -> Iterator[Document]:
+        """PDF 페이지 범위를 프로세스 풀에서 병렬 파싱하고 페이지 순서대로 청크를 생성합니다.
+
+        동시에 진행 중인 범위 수를 프로세스 수의 2배로 제한하여,
+        임베딩이 파싱보다 느려도 파싱 결과가 메모리에 쌓이지 않도록 합니다.
+        """
+        num_pages = count_pdf_pages(file_path)
+        pages_per_range = max(1, settings.INGESTION_PDF_PAGES_PER_WORKER)
+        ranges = [
+            (start, min(start + pages_per_range, num_pages))
+            for start in range(0, num_pages, pages_per_range)
+        ]
+        num_processes = min(settings.INGESTION_PARSE_PROCESSES or os.cpu_count() or 1, len(ranges))
+        max_in_flight = num_processes * 2
+
+        with IngestionService.create_parse_pool(num_processes) as pool:
+            in_flight: deque = deque()
+            next_range = iter(ranges)
+
+            def submit_next() -> bool:
+                page_range = next(next_range, None)
+                if page_range is None:
+                    return False
+                in_flight.append(pool.submit(parse_pdf_range_safe, file_path, *page_range, source))
+                return True
+
+            while len(in_flight) < max_in_flight and submit_next():
+                pass
+
+            produced = False
+            while in_flight:
+                wait_started = time.perf_counter()
+                chunks, error = in_flight.popleft().result()
+                timings["load"] += time.perf_counter() - wait_started
+                if error is not None:
+                    raise FileLoadError(file_path, error)
+                submit_next()
+
+                produced = produced or bool(chunks)
+                yield from chunks
+
+        if not produced:
+            raise FileLoadError(file_path, "No content extracted from file")
+
+    def ingest_batch(
+        self,
+        items: List[BatchItem],
+        on_progress: Optional[BatchProgressCallback] = None,
+        pool: Optional[ProcessPoolExecutor] = None,
+        metadata: Optional[dict] = None,
+    ) -> BatchResult:
+        """여러 파일을 프로세스 풀에서 병렬 파싱하고, 청크 스트림을 큰 배치로 임베딩합니다.
+
+        파싱(load + split)은 CPU 바운드이며 GIL에 묶이므로 별도 프로세스에서 실행합니다.
+        완료된 파일의 새 청크는 INGESTION_EMBED_BATCH_SIZE 단위로 모아 임베딩하며,
+        그동안 다른 파일의 파싱은 워커 프로세스에서 계속 진행됩니다.
+        이미 같은 내용으로 수집된 파일은 파싱하지 않습니다.
+
+        pool을 전달하면 배치마다 프로세스를 새로 띄우지 않고 재사용합니다. (bulk index CLI 등)
+        metadata를 전달하면 모든 청크에 추가합니다. (shard 라우팅 키 등)
+        동기 함수이므로 이벤트 루프에서는 스레드/워커를 통해 호출해야 합니다.
+        """
+        result = BatchResult(files_total=len(items))
+        if not items:
+            return result
+
+        started = time.perf_counter()
+        files_done = 0
+
+        def report(chunks_in_flight: int = 0):
+            if on_progress is not None:
+                on_progress(files_done, result.files_total, result.sync.added + chunks_in_flight)
+
+        # 0. 변경되지 않은 파일은 파싱 대상에서 제외
+        chunk_config = chunking_fingerprint()
+        to_parse: List[Tuple[str, str, str, dict]] = []
+        for file_path, source in items:
+            file_hash = hash_file(file_path)
+            existing = get_vector_store().get_source_entries(source)
+            if self._is_unchanged(existing, file_hash, chunk_config):
+                self._update_unchanged_metadata(existing, metadata)
+                result.files_unchanged += 1
+                result.sync.unchanged += len(existing)
+                files_done += 1
+                report()
+            else:
+                to_parse.append((file_path, source, file_hash, existing))
+
+        if not to_parse:
+            result.timings["total"] = time.perf_counter() - started
+            return result
+
+        batch_size = max(1, settings.INGESTION_EMBED_BATCH_SIZE)
+        num_processes = min(settings.INGESTION_PARSE_PROCESSES or os.cpu_count() or 1, len(to_parse))
+        pending_ids: List[str] = []
+        pending: List[Document] = []
+        embed_seconds = 0.0
+
+        def flush(count: int):
+            nonlocal embed_seconds
+            embed_started = time.perf_counter()
+            get_vector_store().add_documents(
+                pending[:count],
+                ids=pending_ids[:count],
+                on_progress=lambda done, _total: report(done),
+            )
+            embed_seconds += time.perf_counter() - embed_started
+            result.sync.added += len(pending[:count])
+            del pending[:count]
+            del pending_ids[:count]
+
+        with (nullcontext(pool) if pool is not None else self.create_parse_pool(num_processes)) as pool:
+            futures = {
+                pool.submit(parse_file_safe, file_path, source): (source, file_hash, existing)
+                for file_path, source, file_hash, existing in to_parse
+            }
+            for future in as_completed(futures):
+                source, file_hash, existing = futures[future]
+                try:
+                    chunks, error = future.result()
+                except Exception as e:
+                    chunks, error = [], str(e)
+
+                if error is not None:
+                    result.failed[source] = error
+                else:
+                    result.files_succeeded += 1
+                    if metadata:
+                        for chunk in chunks:
+                            chunk.metadata.update(metadata)
+                    plan = plan_sync(source, file_hash, chunks, existing, chunk_config)
+                    result.sync.merge(self._apply_removals(plan))
+                    pending_ids.extend(plan.new_ids)
+                    pending.extend(plan.new_chunks)
+                    while len(pending) >= batch_size:
+                        flush(batch_size)
+
+                files_done += 1
+                report()
+
+        if pending:
+            flush(len(pending))
+
+        result.timings["parse"] = time.perf_counter() - started - embed_seconds
+        result.timings["embed"] = embed_seconds
+        result.timings["total"] = time.perf_counter() - started
+        return result
+
+    @staticmethod
+    def create_parse_pool(num_processes: Optional[int] = None) -> ProcessPoolExecutor:
+        """파싱용 프로세스 풀을 생성합니다.
+
+        spawn 방식을 사용하여 API 프로세스의 스레드/모델 상태를 fork로 복제하지 않습니다.
+        """
+        return ProcessPoolExecutor(
+            max_workers=num_processes or settings.INGESTION_PARSE_PROCESSES or os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    @staticmethod
+    def _is_unchanged(existing: dict[str, dict], file_hash: str, chunk_config: str) -> bool:
+        """저장된 청크가 모두 같은 파일 해시와 같은 청크 분할 설정으로 만들어졌는지 확인합니다."""
+        return bool(existing) and all(
+            (metadata or {}).get("file_hash") == file_hash
+            and (metadata or {}).get("chunk_config") == chunk_config
+            for metadata in existing.values()
+        )
+
+    @staticmethod
+    def _update_unchanged_metadata(existing: dict[str, dict], metadata: Optional[dict]):
+        """다시 분할하지 않는 파일에도 요청한 metadata를 저장된 청크에 반영합니다."""
+        if not metadata:
+            return
+        updates = {
+            doc_id: {**(stored or {}), **metadata}
+            for doc_id, stored in existing.items()
+            if any((stored or {}).get(key) != value for key, value in metadata.items())
+        }
+        if updates:
+            get_vector_store().update_metadatas(list(updates), list(updates.values()))
+
+    @staticmethod
+    def _apply_removals(plan: SyncPlan) -> SyncResult:
+        """사라진 청크를 삭제하고 유지되는 청크의 metadata를 갱신합니다."""
+        get_vector_store().delete(ids=plan.removed_ids)
+        get_vector_store().update_metadatas(plan.kept_ids, plan.kept_metadatas)
+        return SyncResult(removed=len(plan.removed_ids), unchanged=len(plan.kept_ids))
+
+    @staticmethod
+    def _finish_stage(stage: str, started: float, on_stage: Optional[StageCallback]) -> float:
+        """단계 소요 시간을 콜백에 전달하고 다음 단계 시작 시각을 반환합니다."""
+        now = time.perf_counter()
+        if on_stage is not None:
+            on_stage(stage, now - started)
+        return now
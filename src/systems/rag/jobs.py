@@ -0,0 +1,287 @@
+"""Ingestion Job Queue - 백그라운드 문서 수집 작업 관리
+
+업로드 요청은 job id만 즉시 반환하고, 제한된 수의 워커가
+load → split → embed 단계를 이벤트 루프 밖(전용 스레드 풀)에서 처리합니다.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Literal
+
+from src.config.settings import get_settings
+from src.systems.rag.ingestion import IngestionService, BatchItem
+from src.systems.rag.exceptions import IngestionQueueFullError
+
+settings = get_settings()
+
+JobStatus = Literal["queued", "running", "completed", "failed"]
+JobKind = Literal["file", "batch"]
+
+
+@dataclass
+class IngestionJob:
+    """수집 작업의 상태 (단일 파일 또는 배치)"""
+
+    job_id: str
+    filename: str
+    files: list[BatchItem]
+    kind: JobKind = "file"
+    shard: str | None = None
+    status: JobStatus = "queued"
+    stage: str | None = None
+    progress: float = 0.0
+    files_done: int = 0
+    chunks_created: int | None = None
+    result: dict | None = None
+    error: str | None = None
+    failed_files: dict[str, str] = field(default_factory=dict)
+    skipped_files: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def to_dict(self) -> dict:
+        """API 응답용 딕셔너리로 변환합니다."""
+        data = {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "shard": self.shard,
+            "filename": self.filename,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": round(self.progress, 3),
+            "chunks_created": self.chunks_created,
+            "result": self.result,
+            "error": self.error,
+            "timings": {name: round(sec, 4) for name, sec in self.timings.items()},
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.kind == "batch":
+            data.update({
+                "files_total": len(self.files),
+                "files_done": self.files_done,
+                "failed_files": self.failed_files,
+                "skipped_files": self.skipped_files,
+            })
+        return data
+
+
+class IngestionJobManager:
+    """백그라운드 수집 작업 관리자
+
+    asyncio.Queue(크기 제한)에 작업을 쌓고, INGESTION_WORKERS 개의 워커 태스크가
+    전용 ThreadPoolExecutor에서 IngestionService.ingest_path / ingest_batch를 실행합니다.
+    이벤트 루프는 파일 파싱/임베딩 동안에도 다른 요청(/v1/chat 등)을 계속 처리합니다.
+    """
+
+    def __init__(
+        self,
+        ingestion_service: IngestionService | None = None,
+        num_workers: int | None = None,
+        max_queue_size: int | None = None,
+        retention: int | None = None,
+    ):
+        self.ingestion_service = ingestion_service or IngestionService()
+        self.num_workers = max(1, num_workers or settings.INGESTION_WORKERS)
+        self.max_queue_size = max_queue_size or settings.INGESTION_QUEUE_SIZE
+        self.retention = retention or settings.INGESTION_JOB_RETENTION
+
+        self._jobs: "OrderedDict[str, IngestionJob]" = OrderedDict()
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def start(self):
+        """워커 태스크와 스레드 풀을 시작합니다. (이미 시작된 경우 무시)"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.num_workers, thread_name_prefix="ingestion"
+        )
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"ingestion-worker-{i}")
+            for i in range(self.num_workers)
+        ]
+
+    async def shutdown(self):
+        """워커를 중지하고 스레드 풀을 정리합니다."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def submit(self, file_path: str, filename: str, shard: str | None = None) -> IngestionJob:
+        """저장된 파일에 대한 수집 작업을 대기열에 추가합니다.
+
+        Raises:
+            IngestionQueueFullError: 대기열이 가득 찬 경우
+        """
+        job = IngestionJob(
+            job_id=uuid.uuid4().hex,
+            filename=filename,
+            files=[(file_path, self.ingestion_service.source_path(filename, shard))],
+            shard=shard,
+        )
+        return await self._enqueue(job)
+
+    async def submit_batch(
+        self, items: list[BatchItem], skipped: list[str] | None = None, shard: str | None = None
+    ) -> IngestionJob:
+        """저장된 여러 파일에 대한 배치 수집 작업을 대기열에 추가합니다.
+
+        Raises:
+            IngestionQueueFullError: 대기열이 가득 찬 경우
+        """
+        job = IngestionJob(
+            job_id=uuid.uuid4().hex,
+            filename=f"{len(items)} files",
+            files=items,
+            kind="batch",
+            shard=shard,
+            skipped_files=list(skipped or []),
+        )
+        return await self._enqueue(job)
+
+    async def _enqueue(self, job: IngestionJob) -> IngestionJob:
+        await self.start()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise IngestionQueueFullError(self.max_queue_size)
+
+        self._jobs[job.job_id] = job
+        self._evict_finished()
+        return job
+
+    def get_job(self, job_id: str) -> IngestionJob | None:
+        """job id로 작업을 조회합니다."""
+        return self._jobs.get(job_id)
+
+    def get_stats(self) -> dict:
+        """대기열/워커 상태를 반환합니다."""
+        counts = {"queued": 0, "running": 0, "completed": 0, "failed": 0}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {
+            "workers": self.num_workers,
+            "max_queue_size": self.max_queue_size,
+            "jobs": counts,
+        }
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run_job(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: IngestionJob):
+        job.status = "running"
+        job.started_at = time.time()
+
+        loop = asyncio.get_running_loop()
+        metadata = IngestionService.shard_metadata(job.shard)
+        try:
+            if job.kind == "batch":
+                job.stage = "parse"
+                result = await loop.run_in_executor(
+                    self._executor,
+                    lambda: self.ingestion_service.ingest_batch(
+                        job.files, on_progress=self._batch_recorder(job), metadata=metadata
+                    ),
+                )
+                job.chunks_created = result.chunks_created
+                job.failed_files = result.failed
+                job.timings.update(result.timings)
+                job.result = result.to_dict()
+            else:
+                job.stage = IngestionService.STAGES[0]
+                file_path, source = job.files[0]
+                sync = await loop.run_in_executor(
+                    self._executor,
+                    lambda: self.ingestion_service.ingest_path(
+                        file_path,
+                        source=source,
+                        on_stage=self._stage_recorder(job),
+                        on_progress=self._chunk_recorder(job),
+                        metadata=metadata,
+                    ),
+                )
+                job.chunks_created = sync.added
+                job.result = sync.to_dict()
+            job.status = "completed"
+            job.stage = None
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            self.ingestion_service.cleanup(job.files)
+
+    @staticmethod
+    def _stage_recorder(job: IngestionJob):
+        """워커 스레드에서 호출되는 단계 완료 콜백을 생성합니다.
+
+        스트리밍 수집은 같은 단계를 누적 시간과 함께 여러 번 보고하므로,
+        소요 시간은 항상 갱신하고 진행 단계는 앞으로만 이동합니다.
+        """
+        stages = IngestionService.STAGES
+
+        def on_stage(stage: str, elapsed: float):
+            job.timings[stage] = elapsed
+            stages_done = stages.index(stage) + 1
+            if stages_done / len(stages) <= job.progress:
+                return
+            job.progress = stages_done / len(stages)
+            if stages_done < len(stages):
+                job.stage = stages[stages_done]
+
+        return on_stage
+
+    @staticmethod
+    def _chunk_recorder(job: IngestionJob):
+        """워커 스레드에서 호출되는 청크 저장 진행 콜백을 생성합니다."""
+
+        def on_progress(chunks_created: int):
+            job.chunks_created = chunks_created
+
+        return on_progress
+
+    @staticmethod
+    def _batch_recorder(job: IngestionJob):
+        """워커 스레드에서 호출되는 배치 진행 콜백을 생성합니다."""
+
+        def on_progress(files_done: int, files_total: int, chunks_created: int):
+            job.files_done = files_done
+            job.chunks_created = chunks_created
+            job.progress = files_done / files_total if files_total else 1.0
+
+        return on_progress
+
+    def _evict_finished(self):
+        """보관 개수를 넘는 오래된 완료 작업을 제거합니다."""
+        excess = len(self._jobs) - self.retention
+        if excess <= 0:
+            return
+        for job_id in [jid for jid, job in self._jobs.items() if job.is_finished][:excess]:
+            del self._jobs[job_id]
+
+
+# Global instance
+ingestion_job_manager = IngestionJobManager()
@@ -0,0 +1,232 @@
+"""Lexical Index - BM25 역색인 (하이브리드 검색의 sparse 측)
+
+dense 검색이 놓치는 제품 코드, 한국어 고유명사, 정책 번호 같은 정확 일치를 찾기 위한
+메모리 내 BM25 역색인입니다. VectorStore가 add_documents / delete 시 함께 갱신합니다.
+
+토큰화 규칙 (형태소 분석기 없이):
+- 영문/숫자: 소문자화. "POL-2024-0042" 같은 코드는 전체("pol-2024-0042")와 각 부분을 모두 색인
+- 한글: 어절 전체 + 음절 bigram ("휴가정책은" → 휴가정책은, 휴가, 가정, 정책, 책은)
+  → 조사가 붙거나 띄어쓰기가 달라도 일치
+
+indexed_fields로 지정한 metadata 필드(source, file_type 등)는 값 → 문서 번호 색인을 함께 유지하여
+filter가 있는 검색에서 후보를 빠르게 제한합니다.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.systems.rag.metadata_filter import FieldIndex
+
+_TOKEN_PATTERN = re.compile(r"[0-9a-z]+(?:[-_./][0-9a-z]+)*|[가-힣]+")
+_PART_PATTERN = re.compile(r"[0-9a-z]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """BM25용 토큰 목록을 반환합니다."""
+    tokens: List[str] = []
+    for match in _TOKEN_PATTERN.finditer(text.lower()):
+        token = match.group()
+        tokens.append(token)
+        if "가" <= token[0] <= "힣":
+            if len(token) > 2:
+                tokens.extend(token[i:i + 2] for i in range(len(token) - 1))
+        else:
+            parts = _PART_PATTERN.findall(token)
+            if len(parts) > 1:
+                tokens.extend(parts)
+    return tokens
+
+
+class LexicalIndex:
+    """BM25 역색인 (스레드 안전)
+
+    posting은 갱신이 쉬운 dict로 유지하고, 검색 시에는 term별 numpy 배열(문서 번호, tf 가중치)로
+    변환해 둔 것을 사용합니다. 변경된 term만 다시 변환하며, tf 가중치는 평균 문서 길이가
+    5% 이상 달라지면 다시 계산합니다. 점수 합산은 bincount로,
+    후보 선택은 flatnonzero + argpartition으로 처리하여 흔한 단어가 섞인 질의도 빠르게 계산합니다.
+
+    Args:
+        k1: 단어 빈도 포화 계수
+        b: 문서 길이 정규화 계수
+        indexed_fields: 값 색인을 유지할 metadata 필드 목록
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, indexed_fields: Iterable[str] = ()):
+        self.k1 = k1
+        self.b = b
+        self.indexed_fields = tuple(indexed_fields)
+        self._fields = FieldIndex(self.indexed_fields)
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._compiled: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._compiled_avg_length = 0.0
+        self._doc_terms: Dict[int, Counter] = {}
+        self._ids: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._lengths = np.zeros(1024, dtype=np.float32)
+        self._total_length = 0
+        self._lock = threading.RLock()
+
+    def add(self, ids: Iterable[str], texts: Iterable[str], metadatas: Optional[Iterable[dict]] = None):
+        """문서를 색인합니다. (같은 id는 교체)"""
+        ids, texts = list(ids), list(texts)
+        metadatas = list(metadatas) if metadatas is not None else [None] * len(ids)
+        with self._lock:
+            for doc_id, text, metadata in zip(ids, texts, metadatas):
+                if doc_id in self._slots:
+                    self._remove(doc_id)
+                slot = self._allocate(doc_id)
+                self._fields.add(slot, metadata)
+                terms = Counter(tokenize(text))
+                self._doc_terms[slot] = terms
+                length = sum(terms.values())
+                self._lengths[slot] = length
+                self._total_length += length
+                for term, tf in terms.items():
+                    self._postings.setdefault(term, {})[slot] = tf
+                    self._compiled.pop(term, None)
+
+    def update_metadata(self, ids: Iterable[str], metadatas: Iterable[dict]):
+        """색인된 metadata 필드 값을 갱신합니다. (본문 색인은 유지)"""
+        with self._lock:
+            for doc_id, metadata in zip(ids, metadatas):
+                slot = self._slots.get(doc_id)
+                if slot is not None:
+                    self._fields.remove(slot)
+                    self._fields.add(slot, metadata)
+
+    def can_filter(self, conditions: Dict[str, list]) -> bool:
+        """모든 조건 필드가 색인된 필드인지 여부"""
+        return self._fields.can_filter(conditions)
+
+    def delete(self, ids: Iterable[str]):
+        """문서를 색인에서 제거합니다."""
+        with self._lock:
+            for doc_id in ids:
+                if doc_id in self._slots:
+                    self._remove(doc_id)
+
+    def _allocate(self, doc_id: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot] = doc_id
+        else:
+            slot = len(self._ids)
+            self._ids.append(doc_id)
+            if slot >= len(self._lengths):
+                self._lengths = np.concatenate([self._lengths, np.zeros_like(self._lengths)])
+        self._slots[doc_id] = slot
+        return slot
+
+    def _remove(self, doc_id: str):
+        slot = self._slots.pop(doc_id)
+        self._fields.remove(slot)
+        for term in self._doc_terms.pop(slot):
+            postings = self._postings[term]
+            del postings[slot]
+            self._compiled.pop(term, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= int(self._lengths[slot])
+        self._lengths[slot] = 0
+        self._ids[slot] = None
+        self._free.append(slot)
+
+    def _term_arrays(self, term: str, avg_length: float) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """term의 (문서 번호, BM25 tf 가중치) 배열을 반환합니다."""
+        compiled = self._compiled.get(term)
+        if compiled is None:
+            postings = self._postings.get(term)
+            if not postings:
+                return None
+            slots = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+            tf = np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+            norm = self.k1 * (1 - self.b + self.b * self._lengths[slots] / avg_length)
+            compiled = (slots, tf * (self.k1 + 1) / (tf + norm))
+            self._compiled[term] = compiled
+        return compiled
+
+    def search(
+        self,
+        query: str,
+        k: int = 10,
+        conditions: Optional[Dict[str, list]] = None,
+        allowed_ids: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """BM25 점수 상위 k개의 (id, 점수)를 반환합니다.
+
+        Args:
+            conditions: {필드: 허용 값 목록} 조건 (모두 색인된 필드여야 함)
+            allowed_ids: 검색 대상을 이 id로 제한 (색인되지 않은 필드 filter용)
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._slots)
+            if not count or not terms or k <= 0:
+                return []
+            avg_length = self._total_length / count
+            if abs(avg_length - self._compiled_avg_length) > 0.05 * self._compiled_avg_length:
+                self._compiled.clear()
+                self._compiled_avg_length = avg_length
+
+            slots, weights = [], []
+            for term in terms:
+                arrays = self._term_arrays(term, self._compiled_avg_length)
+                if arrays is None:
+                    continue
+                term_slots, tf_weight = arrays
+                idf = math.log(1 + (count - len(term_slots) + 0.5) / (len(term_slots) + 0.5))
+                slots.append(term_slots)
+                weights.append(tf_weight * idf)
+            if not slots:
+                return []
+
+            scores = np.bincount(np.concatenate(slots), weights=np.concatenate(weights))
+            candidates = np.flatnonzero(scores)
+            if conditions:
+                candidates = np.intersect1d(candidates, self._fields.allowed_slots(conditions), assume_unique=True)
+            if allowed_ids is not None:
+                allowed = np.fromiter(
+                    (self._slots[doc_id] for doc_id in allowed_ids if doc_id in self._slots),
+                    dtype=np.int64,
+                )
+                candidates = np.intersect1d(candidates, allowed)
+            candidate_scores = scores[candidates]
+            if len(candidates) > k:
+                top = np.argpartition(-candidate_scores, k - 1)[:k]
+                candidates, candidate_scores = candidates[top], candidate_scores[top]
+            order = np.argsort(-candidate_scores, kind="stable")
+            return [(self._ids[candidates[i]], float(candidate_scores[i])) for i in order]
+
+    def clear(self):
+        with self._lock:
+            self._postings.clear()
+            self._compiled.clear()
+            self._compiled_avg_length = 0.0
+            self._fields.clear()
+            self._doc_terms.clear()
+            self._ids.clear()
+            self._slots.clear()
+            self._free.clear()
+            self._lengths[:] = 0
+            self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get_stats(self) -> dict:
+        return {"documents": len(self._slots), "terms": len(self._postings)}
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """여러 순위 목록을 RRF(Σ 1 / (k + rank))로 합쳐 점수 내림차순으로 반환합니다."""
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
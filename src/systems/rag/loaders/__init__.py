@@ -2,5 +2,6 @@
 
 from .excel_loader import ExcelLoader
 from .pptx_loader import PowerPointLoader
+from .pptx_xml_loader import PowerPointXMLLoader
 
-__all__ = ["ExcelLoader", "PowerPointLoader"]
+__all__ = ["ExcelLoader", "PowerPointLoader", "PowerPointXMLLoader"]
@@ -1,44 +1,131 @@
 """Excel 파일 로더 - openpyxl 기반"""
 
-from typing import List
+from typing import Callable, Iterator, List, Optional
 from langchain_core.documents import Document
 from openpyxl import load_workbook
+from src.systems.rag.tokenization import count_tokens
 
 
 class ExcelLoader:
     """
     openpyxl을 사용한 Excel 파일 로더.
     각 시트를 별도의 Document로 변환하며, 마크다운 테이블 형식으로 출력합니다.
+
+    rows_per_chunk 또는 max_tokens를 지정하면 스트리밍 모드로 동작합니다.
+    시트를 read-only 모드로 한 행씩 읽어 N행 또는 M토큰마다 Document를 생성하고,
+    모든 Document에 헤더 행을 반복하여 각 청크가 스스로 의미를 갖도록 합니다.
+    스트리밍 모드의 Document는 이미 청크 크기이므로 metadata에 row_start/row_end가 기록됩니다.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        rows_per_chunk: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ):
         self.file_path = file_path
+        self.rows_per_chunk = rows_per_chunk
+        self.max_tokens = max_tokens
+        self.token_counter = token_counter or count_tokens
+
+    @property
+    def streaming(self) -> bool:
+        return bool(self.rows_per_chunk or self.max_tokens)
 
     def load(self) -> List[Document]:
         """Excel 파일을 로드하여 Document 리스트로 반환합니다."""
-        documents = []
+        return list(self.lazy_load())
 
+    def lazy_load(self) -> Iterator[Document]:
+        """시트 단위(스트리밍 모드에서는 행 윈도우 단위)로 Document를 하나씩 생성합니다."""
         workbook = load_workbook(
             filename=self.file_path, read_only=True, data_only=True
         )
 
-        for sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
-            content = self._sheet_to_markdown_table(sheet)
-
-            if content.strip():
-                doc = Document(
-                    page_content=content,
-                    metadata={
-                        "source": self.file_path,
-                        "sheet_name": sheet_name,
-                        "file_type": "xlsx",
-                    },
+        try:
+            for sheet_name in workbook.sheetnames:
+                sheet = workbook[sheet_name]
+
+                if self.streaming:
+                    yield from self._iter_row_windows(sheet, sheet_name)
+                    continue
+
+                content = self._sheet_to_markdown_table(sheet)
+
+                if content.strip():
+                    yield Document(
+                        page_content=content,
+                        metadata=self._metadata(sheet_name),
+                    )
+        finally:
+            workbook.close()
+
+    def _metadata(self, sheet_name: str) -> dict:
+        return {
+            "source": self.file_path,
+            "sheet_name": sheet_name,
+            "file_type": "xlsx",
+        }
+
+    def _iter_row_windows(self, sheet, sheet_name: str) -> Iterator[Document]:
+        """시트를 한 행씩 읽어 헤더가 반복된 행 윈도우 Document를 생성합니다."""
+        header_lines: Optional[List[str]] = None
+        header_tokens = 0
+        lines: List[str] = []
+        tokens = 0
+        row_start = row_end = 0
+
+        def emit() -> Document:
+            metadata = self._metadata(sheet_name)
+            metadata["row_start"] = row_start
+            metadata["row_end"] = row_end
+            return Document(
+                page_content="\n".join(header_lines + lines),
+                metadata=metadata,
+            )
+
+        for row_number, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+            # 빈 행 제거
+            if not any(cell is not None for cell in row):
+                continue
+
+            line = self._row_to_markdown(row)
+
+            # 첫 행을 헤더로 처리
+            if header_lines is None:
+                row_start = row_end = row_number
+                header_lines = [line, "| " + " | ".join(["---"] * len(row)) + " |"]
+                header_tokens = (
+                    self.token_counter("\n".join(header_lines)) if self.max_tokens else 0
                 )
-                documents.append(doc)
-
-        workbook.close()
-        return documents
+                continue
+
+            line_tokens = self.token_counter(line) if self.max_tokens else 0
+            if lines and (
+                (self.rows_per_chunk and len(lines) >= self.rows_per_chunk)
+                or (self.max_tokens and header_tokens + tokens + line_tokens > self.max_tokens)
+            ):
+                yield emit()
+                lines = []
+                tokens = 0
+
+            if not lines:
+                row_start = row_number
+            lines.append(line)
+            tokens += line_tokens
+            row_end = row_number
+
+        if lines:
+            yield emit()
+        elif header_lines is not None:
+            # 헤더만 있는 시트도 기존 모드와 동일하게 Document로 남김
+            yield emit()
+
+    @staticmethod
+    def _row_to_markdown(row) -> str:
+        row_values = [str(cell) if cell is not None else "" for cell in row]
+        return "| " + " | ".join(row_values) + " |"
 
     def _sheet_to_markdown_table(self, sheet) -> str:
         """시트 데이터를 마크다운 테이블로 변환합니다."""
@@ -57,14 +144,12 @@ class ExcelLoader:
 
         # 첫 행을 헤더로 처리
         header = non_empty_rows[0]
-        header_values = [str(cell) if cell is not None else "" for cell in header]
 
         lines = []
-        lines.append("| " + " | ".join(header_values) + " |")
+        lines.append(self._row_to_markdown(header))
         lines.append("| " + " | ".join(["---"] * len(header)) + " |")
 
         for row in non_empty_rows[1:]:
-            row_values = [str(cell) if cell is not None else "" for cell in row]
-            lines.append("| " + " | ".join(row_values) + " |")
+            lines.append(self._row_to_markdown(row))
 
         return "\n".join(lines)
@@ -1,6 +1,6 @@
 """PowerPoint 파일 로더 - python-pptx 기반"""
 
-from typing import List
+from typing import Iterator, List
 from langchain_core.documents import Document
 from pptx import Presentation
 
@@ -16,15 +16,17 @@ class PowerPointLoader:
 
     def load(self) -> List[Document]:
         """PowerPoint 파일을 로드하여 Document 리스트로 반환합니다."""
-        documents = []
+        return list(self.lazy_load())
 
+    def lazy_load(self) -> Iterator[Document]:
+        """슬라이드 단위로 Document를 하나씩 생성합니다."""
         prs = Presentation(self.file_path)
 
         for slide_num, slide in enumerate(prs.slides, start=1):
             content = self._extract_slide_text(slide)
 
             if content.strip():
-                doc = Document(
+                yield Document(
                     page_content=content,
                     metadata={
                         "source": self.file_path,
@@ -32,9 +34,6 @@ class PowerPointLoader:
                         "file_type": "pptx",
                     },
                 )
-                documents.append(doc)
-
-        return documents
 
     def _extract_slide_text(self, slide) -> str:
         """슬라이드에서 모든 텍스트를 추출합니다."""
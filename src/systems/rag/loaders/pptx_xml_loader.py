@@ -0,0 +1,179 @@
+"""PowerPoint 파일 로더 - XML 스트리밍 기반
+
+python-pptx의 Presentation 객체 모델을 만들지 않고, zip 아카이브에서
+ppt/slides/slideN.xml 을 직접 읽어 증분 XML 파서(iterparse)로 텍스트와 표 셀만 추출합니다.
+이미지/미디어 파트는 열지 않으므로 슬라이드가 많거나 미디어가 큰 덱에서 빠르고 메모리를 적게 사용합니다.
+"""
+
+import multiprocessing
+import posixpath
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+from xml.etree.ElementTree import iterparse
+from langchain_core.documents import Document
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_SLIDE_NAME_RE = re.compile(r"^ppt/slides/slide(\d+)\.xml$")
+
+
+def _slide_part_names(archive: zipfile.ZipFile) -> List[str]:
+    """presentation.xml의 슬라이드 순서대로 슬라이드 XML 파트 이름을 반환합니다.
+
+    관계 정보를 읽을 수 없으면 파일명 번호 순으로 대체합니다.
+    """
+    names = set(archive.namelist())
+    try:
+        targets = {}
+        with archive.open("ppt/_rels/presentation.xml.rels") as rels:
+            for _, elem in iterparse(rels):
+                if elem.tag == f"{_REL}Relationship":
+                    targets[elem.get("Id")] = posixpath.normpath(
+                        posixpath.join("ppt", elem.get("Target", ""))
+                    )
+
+        ordered = []
+        with archive.open("ppt/presentation.xml") as presentation:
+            for _, elem in iterparse(presentation):
+                if elem.tag == f"{_P}sldId":
+                    target = targets.get(elem.get(f"{_R}id"))
+                    if target in names:
+                        ordered.append(target)
+        if ordered:
+            return ordered
+    except KeyError:
+        pass
+
+    numbered = [
+        (int(match.group(1)), name)
+        for name in names
+        if (match := _SLIDE_NAME_RE.match(name))
+    ]
+    return [name for _, name in sorted(numbered)]
+
+
+def _extract_slide_xml(stream) -> str:
+    """슬라이드 XML 스트림에서 텍스트를 추출합니다.
+
+    PowerPointLoader와 같은 형식으로 출력합니다:
+    - 도형 문단: run 텍스트를 이어 붙인 한 줄
+    - 표: 행마다 셀 텍스트를 " | "로 연결
+    """
+    text_parts: List[str] = []
+    runs: List[str] = []
+    cell_paragraphs: List[str] = []
+    row_cells: List[str] = []
+    table_rows: List[str] = []
+    in_run = False
+    table_depth = 0
+
+    for event, elem in iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+
+        if event == "start":
+            if tag == f"{_A}r":
+                in_run = True
+            elif tag == f"{_A}p":
+                runs = []
+            elif tag == f"{_A}tbl":
+                table_depth += 1
+                table_rows = []
+            elif tag == f"{_A}tr":
+                row_cells = []
+            elif tag == f"{_A}tc":
+                cell_paragraphs = []
+            continue
+
+        if tag == f"{_A}t":
+            if in_run:
+                runs.append(elem.text or "")
+        elif tag == f"{_A}r":
+            in_run = False
+        elif tag == f"{_A}p":
+            paragraph_text = "".join(runs)
+            if table_depth:
+                cell_paragraphs.append(paragraph_text)
+            elif paragraph_text.strip():
+                text_parts.append(paragraph_text.strip())
+        elif tag == f"{_A}tc":
+            row_cells.append("\n".join(cell_paragraphs).strip())
+        elif tag == f"{_A}tr":
+            table_rows.append(" | ".join(row_cells))
+        elif tag == f"{_A}tbl":
+            table_depth -= 1
+            table_text = "\n".join(table_rows)
+            if table_text:
+                text_parts.append(table_text)
+
+        # 처리한 요소는 즉시 해제하여 메모리를 일정하게 유지
+        elem.clear()
+
+    return "\n".join(text_parts)
+
+
+def _extract_slides(file_path: str, slides: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+    """지정한 슬라이드들의 텍스트를 추출합니다. (프로세스 풀 워커용)"""
+    results = []
+    with zipfile.ZipFile(file_path) as archive:
+        for slide_num, part_name in slides:
+            with archive.open(part_name) as stream:
+                results.append((slide_num, _extract_slide_xml(stream)))
+    return results
+
+
+class PowerPointXMLLoader:
+    """
+    XML 스트리밍 기반 PowerPoint 파일 로더.
+    PowerPointLoader와 같은 Document(슬라이드 단위, 동일 metadata)를 생성합니다.
+
+    max_workers가 2 이상이면 슬라이드를 나누어 워커 프로세스에서 병렬로 추출합니다.
+    """
+
+    def __init__(self, file_path: str, max_workers: Optional[int] = None):
+        self.file_path = file_path
+        self.max_workers = max_workers
+
+    def load(self) -> List[Document]:
+        """PowerPoint 파일을 로드하여 Document 리스트로 반환합니다."""
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """슬라이드 단위로 Document를 하나씩 생성합니다."""
+        with zipfile.ZipFile(self.file_path) as archive:
+            slides = list(enumerate(_slide_part_names(archive), start=1))
+
+        for slide_num, content in self._iter_slide_texts(slides):
+            if content.strip():
+                yield Document(
+                    page_content=content,
+                    metadata={
+                        "source": self.file_path,
+                        "slide_number": slide_num,
+                        "file_type": "pptx",
+                    },
+                )
+
+    def _iter_slide_texts(self, slides: List[Tuple[int, str]]) -> Iterator[Tuple[int, str]]:
+        workers = min(self.max_workers or 1, len(slides))
+        if workers < 2:
+            # 순차 모드: 아카이브를 한 번만 열고 슬라이드를 하나씩 스트리밍
+            with zipfile.ZipFile(self.file_path) as archive:
+                for slide_num, part_name in slides:
+                    with archive.open(part_name) as stream:
+                        yield slide_num, _extract_slide_xml(stream)
+            return
+
+        # 병렬 모드: 슬라이드를 워커 수만큼 연속 구간으로 나누어 추출 (순서 유지)
+        size = -(-len(slides) // workers)
+        groups = [slides[i:i + size] for i in range(0, len(slides), size)]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            for results in pool.map(_extract_slides, [self.file_path] * len(groups), groups):
+                yield from results
@@ -0,0 +1,108 @@
+"""Metadata Filter - 검색 filter 정규화
+
+검색 API / RAGTool / VectorStore가 공통으로 사용하는 단순한 metadata filter 형식입니다.
+
+    {"source": "./user_uploads/규정.pdf"}                  # 같음
+    {"file_type": ["pdf", "docx"]}                         # 목록 중 하나
+    {"file_type": "xlsx", "sheet_name": {"$in": ["1월"]}}  # 여러 필드는 AND
+
+정규화 결과({필드: 허용 값 목록})는 Chroma where 절로 변환되고, 메모리 내 색인(BM25, exact)의
+필드 색인(FieldIndex) 조회와 검색 결과 캐시 키에도 그대로 사용됩니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.systems.rag.exceptions import InvalidFilterError
+
+Conditions = Dict[str, List[Any]]
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def normalize_filter(filter: Optional[Dict[str, Any]]) -> Optional[Conditions]:
+    """filter를 {필드: 허용 값 목록}으로 정규화합니다. (비어 있으면 None)
+
+    Raises:
+        InvalidFilterError: 지원하지 않는 필드 이름, 연산자 또는 값 타입
+    """
+    if not filter:
+        return None
+    if not isinstance(filter, dict):
+        raise InvalidFilterError("filter must be an object of {field: value}")
+
+    conditions: Conditions = {}
+    for field, value in sorted(filter.items()):
+        if not isinstance(field, str) or not field or field.startswith("$"):
+            raise InvalidFilterError(f"Invalid filter field: {field!r}")
+        if isinstance(value, dict):
+            if len(value) != 1 or next(iter(value)) not in ("$eq", "$in"):
+                raise InvalidFilterError(f"Unsupported operator for '{field}'. Use '$eq' or '$in'")
+            value = next(iter(value.values()))
+        values = value if isinstance(value, list) else [value]
+        if not values:
+            raise InvalidFilterError(f"Empty value list for '{field}'")
+        for item in values:
+            if not isinstance(item, _SCALAR_TYPES):
+                raise InvalidFilterError(f"Invalid value for '{field}': {item!r}")
+        conditions[field] = list(dict.fromkeys(values))
+    return conditions
+
+
+def to_chroma_where(conditions: Optional[Conditions]) -> Optional[Dict[str, Any]]:
+    """정규화된 조건을 Chroma where 절로 변환합니다."""
+    if not conditions:
+        return None
+    clauses = [
+        {field: values[0]} if len(values) == 1 else {field: {"$in": values}}
+        for field, values in conditions.items()
+    ]
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+class FieldIndex:
+    """metadata 필드 값 → 문서 번호(slot) 색인
+
+    LexicalIndex / ExactIndex가 filter가 있는 검색에서 후보를 제한하는 데 사용합니다.
+    스레드 안전하지 않으므로 소유한 색인의 잠금 안에서 호출해야 합니다.
+    """
+
+    def __init__(self, fields: Iterable[str] = ()):
+        self.fields = tuple(fields)
+        self._index: Dict[str, Dict[Any, set]] = {field: {} for field in self.fields}
+        self._doc_fields: Dict[int, Dict[str, Any]] = {}
+
+    def add(self, slot: int, metadata: Optional[dict]):
+        if not self.fields or not metadata:
+            return
+        values = {field: metadata[field] for field in self.fields if field in metadata}
+        self._doc_fields[slot] = values
+        for field, value in values.items():
+            self._index[field].setdefault(value, set()).add(slot)
+
+    def remove(self, slot: int):
+        for field, value in self._doc_fields.pop(slot, {}).items():
+            slots = self._index[field][value]
+            slots.discard(slot)
+            if not slots:
+                del self._index[field][value]
+
+    def can_filter(self, conditions: Conditions) -> bool:
+        """모든 조건 필드가 색인된 필드인지 여부"""
+        return all(field in self._index for field in conditions)
+
+    def allowed_slots(self, conditions: Conditions) -> np.ndarray:
+        """모든 조건을 만족하는 slot 배열 (정렬됨)"""
+        allowed: Optional[set] = None
+        for field, values in conditions.items():
+            index = self._index[field]
+            matched = set().union(*(index.get(value, set()) for value in values))
+            allowed = matched if allowed is None else allowed & matched
+            if not allowed:
+                break
+        return np.sort(np.fromiter(allowed or (), dtype=np.int64))
+
+    def clear(self):
+        self._index = {field: {} for field in self.fields}
+        self._doc_fields.clear()
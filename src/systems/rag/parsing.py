@@ -0,0 +1,249 @@
+"""문서 파싱 - 파일 로드 및 청크 분할
+
+벡터 저장소/임베딩 모델에 의존하지 않으므로 ProcessPoolExecutor 워커 프로세스에서도
+모델 로딩 없이 import 할 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+from typing import Iterator, List, Optional, Tuple
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
+from src.config.settings import get_settings
+from src.systems.rag.loaders import ExcelLoader, PowerPointLoader, PowerPointXMLLoader
+from src.systems.rag.exceptions import UnsupportedFileTypeError, FileLoadError
+from src.systems.rag.tokenization import TokenTextSplitter
+
+settings = get_settings()
+
+
+def _pdf_loader(path: str):
+    # langchain_community는 import 비용이 크므로 로더가 필요할 때 import
+    from langchain_community.document_loaders import PyPDFLoader
+
+    return PyPDFLoader(path)
+
+
+def _text_loader(path: str):
+    from langchain_community.document_loaders import TextLoader
+
+    return TextLoader(path, encoding="utf-8")
+
+
+def _docx_loader(path: str):
+    from langchain_community.document_loaders import Docx2txtLoader
+
+    return Docx2txtLoader(path)
+
+
+# 확장자별 로더 팩토리
+LOADER_MAP = {
+    ".pdf": _pdf_loader,
+    ".txt": _text_loader,
+    ".docx": _docx_loader,
+    ".xlsx": lambda path: ExcelLoader(
+        path,
+        rows_per_chunk=settings.EXCEL_ROWS_PER_CHUNK if settings.EXCEL_STREAMING else None,
+        max_tokens=settings.EXCEL_MAX_TOKENS_PER_CHUNK if settings.EXCEL_STREAMING else None,
+    ),
+    ".pptx": lambda path: (
+        PowerPointXMLLoader(path, max_workers=settings.PPTX_XML_WORKERS)
+        if settings.PPTX_LOADER_ENGINE == "xml"
+        else PowerPointLoader(path)
+    ),
+}
+
+# 프로세스별 text splitter 캐시 (워커 프로세스에서 한 번만 생성)
+_text_splitter: Optional[RecursiveCharacterTextSplitter] = None
+
+
+def create_text_splitter() -> RecursiveCharacterTextSplitter:
+    """수집 파이프라인에서 사용하는 text splitter를 생성합니다.
+
+    CHUNK_LENGTH_UNIT이 "tokens"이면 CHUNK_TOKENIZER 기준 토큰 수로 청크 크기를 잽니다.
+    청크 metadata의 start_index(원문 내 위치)는 검색 결과에서 겹치는 인접 청크를 합치는 데 사용됩니다.
+    """
+    if settings.CHUNK_LENGTH_UNIT == "tokens":
+        return TokenTextSplitter(
+            chunk_size=settings.CHUNK_SIZE,
+            chunk_overlap=settings.CHUNK_OVERLAP,
+            add_start_index=True,
+        )
+    return RecursiveCharacterTextSplitter(
+        chunk_size=settings.CHUNK_SIZE,
+        chunk_overlap=settings.CHUNK_OVERLAP,
+        length_function=len,
+        add_start_index=True,
+    )
+
+
+def chunking_fingerprint() -> str:
+    """청크 결과에 영향을 주는 설정(청크 크기/단위/tokenizer, Excel 윈도우, PPTX 로더)의 해시
+
+    청크 metadata의 chunk_config로 기록되며, 값이 다르면 같은 파일도 다시 분할합니다.
+    """
+    config = {
+        "chunk_length_unit": settings.CHUNK_LENGTH_UNIT,
+        "chunk_size": settings.CHUNK_SIZE,
+        "chunk_overlap": settings.CHUNK_OVERLAP,
+        "chunk_tokenizer": settings.CHUNK_TOKENIZER,
+        "tokenizer_name": (
+            settings.TIKTOKEN_ENCODING
+            if settings.CHUNK_TOKENIZER == "tiktoken"
+            else settings.LOCAL_EMBEDDING_MODEL
+        ),
+        "excel_streaming": settings.EXCEL_STREAMING,
+        "excel_rows_per_chunk": settings.EXCEL_ROWS_PER_CHUNK,
+        "excel_max_tokens_per_chunk": settings.EXCEL_MAX_TOKENS_PER_CHUNK,
+        "pptx_loader_engine": settings.PPTX_LOADER_ENGINE,
+    }
+    encoded = json.dumps(config, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def get_text_splitter() -> RecursiveCharacterTextSplitter:
+    """프로세스 내에서 재사용되는 text splitter를 반환합니다."""
+    global _text_splitter
+    if _text_splitter is None:
+        _text_splitter = create_text_splitter()
+    return _text_splitter
+
+
+def is_prechunked(document: Document) -> bool:
+    """로더가 이미 청크 단위로 생성한 Document인지 확인합니다.
+
+    스트리밍 ExcelLoader의 행 윈도우(row_start/row_end)는 행 중간에서 잘리거나
+    헤더가 빠지지 않도록 text splitter를 거치지 않습니다.
+    """
+    return "row_start" in document.metadata
+
+
+def split_documents(
+    documents: List[Document],
+    splitter: Optional[RecursiveCharacterTextSplitter] = None,
+) -> List[Document]:
+    """Document 목록을 청크로 분할합니다. (이미 청크 단위인 Document는 그대로 유지)"""
+    splitter = splitter or get_text_splitter()
+    chunks: List[Document] = []
+    for document in documents:
+        if is_prechunked(document):
+            chunks.append(document)
+        else:
+            chunks.extend(splitter.split_documents([document]))
+    return chunks
+
+
+def load_file(file_path: str) -> List[Document]:
+    """파일 확장자에 따라 적절한 로더를 선택하여 문서를 로드합니다."""
+    file_ext = os.path.splitext(file_path)[1].lower()
+
+    loader_factory = LOADER_MAP.get(file_ext)
+    if loader_factory is None:
+        raise UnsupportedFileTypeError(
+            extension=file_ext,
+            supported=list(LOADER_MAP.keys())
+        )
+
+    try:
+        loader = loader_factory(file_path)
+        documents = loader.load()
+
+        if not documents:
+            raise FileLoadError(file_path, "No content extracted from file")
+        return documents
+
+    except (UnsupportedFileTypeError, FileLoadError):
+        raise
+    except Exception as e:
+        raise FileLoadError(file_path, str(e))
+
+
+def iter_documents(file_path: str) -> Iterator[Document]:
+    """로더의 lazy_load로 페이지/시트/슬라이드 단위 Document를 하나씩 생성합니다.
+
+    전체 문서를 메모리에 올리지 않으므로 대용량 파일의 스트리밍 수집에 사용합니다.
+    """
+    file_ext = os.path.splitext(file_path)[1].lower()
+
+    loader_factory = LOADER_MAP.get(file_ext)
+    if loader_factory is None:
+        raise UnsupportedFileTypeError(
+            extension=file_ext,
+            supported=list(LOADER_MAP.keys())
+        )
+
+    produced = False
+    try:
+        for document in loader_factory(file_path).lazy_load():
+            produced = True
+            yield document
+    except (UnsupportedFileTypeError, FileLoadError):
+        raise
+    except Exception as e:
+        raise FileLoadError(file_path, str(e))
+
+    if not produced:
+        raise FileLoadError(file_path, "No content extracted from file")
+
+
+def count_pdf_pages(file_path: str) -> int:
+    """PDF 페이지 수를 반환합니다. (페이지 내용은 읽지 않음)"""
+    from pypdf import PdfReader
+
+    try:
+        return len(PdfReader(file_path).pages)
+    except Exception as e:
+        raise FileLoadError(file_path, str(e))
+
+
+def parse_pdf_range_safe(
+    file_path: str, start: int, end: int, source: str
+) -> Tuple[List[Document], Optional[str]]:
+    """PDF의 [start, end) 페이지 범위를 추출하고 청크로 분할합니다. (프로세스 풀용)
+
+    PyPDFLoader와 같은 방식(pypdf extract_text)으로 페이지 텍스트를 추출하며,
+    metadata의 page는 0부터 시작합니다.
+    """
+    from pypdf import PdfReader
+
+    try:
+        reader = PdfReader(file_path)
+        documents = [
+            Document(
+                page_content=reader.pages[page].extract_text(),
+                metadata={"source": source, "page": page},
+            )
+            for page in range(start, min(end, len(reader.pages)))
+        ]
+        return get_text_splitter().split_documents(documents), None
+    except Exception as e:
+        return [], str(e)
+
+
+def parse_file(file_path: str, source: Optional[str] = None) -> List[Document]:
+    """파일을 로드하고 청크로 분할합니다.
+
+    Args:
+        file_path: 디스크에 저장된 파일 경로
+        source: metadata["source"]로 기록할 값. None이면 로더가 설정한 값 유지
+    """
+    documents = load_file(file_path)
+    if source is not None:
+        for doc in documents:
+            doc.metadata["source"] = source
+    return split_documents(documents)
+
+
+def parse_file_safe(
+    file_path: str, source: Optional[str] = None
+) -> Tuple[List[Document], Optional[str]]:
+    """프로세스 풀용 parse_file 래퍼
+
+    커스텀 예외는 생성자 인자 때문에 프로세스 간 pickle이 깨질 수 있으므로
+    예외 대신 (chunks, 에러 메시지) 튜플을 반환합니다.
+    """
+    try:
+        return parse_file(file_path, source), None
+    except Exception as e:
+        return [], str(e)
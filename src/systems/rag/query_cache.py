@@ -0,0 +1,93 @@
+"""Query Result Cache - 검색 결과 캐시 (LRU + TTL, 인덱스 버전 기반 무효화)
+
+자주 묻는 질문("휴가 정책", "경비 규정")은 같은 텍스트로 반복 검색되므로, 질의 임베딩과
+HNSW 검색 결과를 (인덱스 버전, 검색 종류, 정규화된 질의, k, filter) 키로 캐시합니다.
+
+VectorStore는 add_documents / delete / update_metadatas 때마다 버전을 올리고 캐시를 비우므로,
+변경 이전에 계산된 결과는 (계산 중이던 결과가 늦게 저장되더라도) 다시 조회되지 않습니다.
+
+결과(Document / (Document, score))는 저장할 때와 반환할 때 모두 깊은 복사하므로,
+호출자가 반환된 Document의 metadata를 수정해도 캐시된 결과에는 영향이 없습니다.
+"""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from src.core.embedding_cache import normalize_text
+
+
+class QueryResultCache:
+    """버전 키를 사용하는 LRU/TTL 검색 결과 캐시 (스레드 안전)
+
+    Args:
+        max_entries: 최대 캐시 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+        ttl_seconds: 항목 유효 시간 (0이면 만료 없음)
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.saved_ms = 0.0
+
+    def key(self, kind: str, query: str, k: int, filter: Optional[dict] = None) -> Hashable:
+        """현재 버전 기준 캐시 키를 만듭니다."""
+        filter_key = json.dumps(filter, sort_keys=True, ensure_ascii=False) if filter else None
+        return (self.version, kind, normalize_text(query), k, filter_key)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], list]) -> list:
+        """캐시된 결과를 반환하고, 없으면 compute()로 계산해 저장합니다."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created, elapsed_ms, results = entry
+                if not self.ttl_seconds or now - created < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self.saved_ms += elapsed_ms
+                    return copy.deepcopy(results)
+                del self._entries[key]
+            self.misses += 1
+
+        started = time.perf_counter()
+        results = compute()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        snapshot = copy.deepcopy(results)
+
+        with self._lock:
+            # 계산 도중 인덱스가 바뀌었으면 저장하지 않음
+            if key[0] == self.version:
+                self._entries[key] = (now, elapsed_ms, snapshot)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return results
+
+    def bump_version(self):
+        """인덱스가 변경되었음을 알리고 캐시를 비웁니다."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """캐시 적중률과 절약한 검색 시간을 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "version": self.version,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "saved_ms": round(self.saved_ms, 1),
+        }
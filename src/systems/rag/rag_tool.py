@@ -1,28 +1,177 @@
-from typing import List, Type
+import asyncio
+import math
+from typing import List, Optional, Type
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
+from src.config.settings import get_settings
 
-class SearchInput(BaseModel):
+class SearchFilters(BaseModel):
+    file_name: Optional[str] = Field(
+        default=None, description="Only search in the document with this file name (e.g. 'travel_policy.pdf')."
+    )
+    file_type: Optional[str] = Field(
+        default=None, description="Only search in documents of this type: pdf, txt, docx, xlsx or pptx."
+    )
+    sheet_name: Optional[str] = Field(default=None, description="Only search in this Excel sheet.")
+    slide_number: Optional[int] = Field(default=None, description="Only search in this PowerPoint slide.")
+
+    def to_filter(self) -> Optional[dict]:
+        """지정된 필드로 VectorStore metadata filter를 만듭니다."""
+        fields = self.model_dump(include=set(SearchFilters.model_fields), exclude_none=True)
+        if "file_type" in fields:
+            fields["file_type"] = fields["file_type"].lower().lstrip(".")
+        return fields or None
+
+class SearchInput(SearchFilters):
     query: str = Field(description="The query to search for in the knowledge base.")
 
+class BatchSearchInput(SearchFilters):
+    queries: List[str] = Field(
+        min_length=1,
+        max_length=get_settings().RAG_BATCH_MAX_QUERIES,
+        description="Queries to search for at once, one per topic or sub-question.",
+    )
+
+def _doc_key(doc) -> tuple:
+    return doc.metadata.get("source"), doc.page_content
+
 class RAGTool(BaseTool):
     name: str = "search_knowledge_base"
     description: str = """
     Use this tool to search for internal documents and knowledge.
     Always use this when asked about specific company policies,
-    project details or internal data."""
+    project details or internal data.
+    If the user mentions a specific file, sheet or slide, set the matching filter field."""
     args_schema: Type[BaseModel] = SearchInput
 
-    def _run(self, query: str) -> str:
-        from src.systems.rag.vector_store import vector_store
-        
-        docs = vector_store.similarity_search(query)
+    def _run(self, query: str, **filters) -> str:
+        from src.systems.rag.vector_store import get_vector_store
+
+        store = get_vector_store()
+        search_filter = SearchInput(query=query, **filters).to_filter()
+        k = get_settings().RAG_MAX_K
+        # 제품 코드, 고유명사, 정책 번호 같은 정확 일치를 위해 기본은 하이브리드 검색
+        if get_settings().HYBRID_SEARCH_ENABLED:
+            hits = self._hybrid_hits(store.hybrid_search_with_dense(query, k=k, filter=search_filter))
+        else:
+            hits = self._dense_hits(store.similarity_search_with_score(query, k=k, filter=search_filter))
+        return self._format(self._assemble(hits))
+
+    async def _arun(self, query: str, **filters) -> str:
+        # 질의 임베딩과 Chroma 조회는 VectorStore 전용 스레드 풀에서 실행 (이벤트 루프 비차단)
+        from src.systems.rag.vector_store import aget_vector_store
+
+        store = await aget_vector_store()
+        search_filter = SearchInput(query=query, **filters).to_filter()
+        k = get_settings().RAG_MAX_K
+        if get_settings().HYBRID_SEARCH_ENABLED:
+            hits = self._hybrid_hits(await store.ahybrid_search_with_dense(query, k=k, filter=search_filter))
+        else:
+            hits = self._dense_hits(await store.asimilarity_search_with_score(query, k=k, filter=search_filter))
+        return self._format(self._assemble(hits))
+
+    @staticmethod
+    def _hybrid_hits(results: List) -> List:
+        """하이브리드 결과를 (Document, dense 거리, BM25 일치 여부) 목록으로 바꿉니다."""
+        return [(doc, distance, lexical) for doc, _, distance, lexical in results]
+
+    @staticmethod
+    def _dense_hits(results: List) -> List:
+        """dense 결과를 (Document, dense 거리, BM25 일치 여부) 목록으로 바꿉니다."""
+        return [(doc, distance, False) for doc, distance in results]
+
+    @classmethod
+    def _assemble(cls, hits: List) -> List:
+        """검색 결과를 적응형 k → 인접 청크 병합 → 중복 제거 → 토큰 예산 순으로 정리합니다."""
+        from src.systems.rag.context_assembly import assemble
+
+        return assemble(cls._select(hits))
+
+    @staticmethod
+    def _select(hits: List) -> List:
+        """(Document, dense 거리, BM25 일치 여부) 순위 목록에서 적응형 k 기준을 넘는 문서를 반환합니다.
+
+        BM25가 찾은 문서(제품 코드, 정책 번호 같은 정확 일치)는 dense 유사도와 관계없이 유지하고,
+        나머지 후보는 dense 유사도가 RAG_MIN_SIMILARITY 이상인 것만 남깁니다.
+        """
+        from src.systems.rag.context_assembly import distance_to_similarity, select_adaptive
+
+        return select_adaptive([
+            (doc, math.inf if lexical or distance is None else distance_to_similarity(distance))
+            for doc, distance, lexical in hits
+        ])
+
+    @staticmethod
+    def _format(docs: List, queries: Optional[List[str]] = None) -> str:
         if not docs:
             return "No relevant documents found."
-            
+
         result = "\n\n".join([f"Content: {doc.page_content}\nSource: {doc.metadata.get('source', 'Unknown')}" for doc in docs])
-        return f"[RAG Search Results]\n{result}"
+        header = f"[RAG Search Results] queries: {' | '.join(queries)}" if queries else "[RAG Search Results]"
+        return f"{header}\n{result}"
+
+class BatchRAGTool(BaseTool):
+    """여러 질의를 한 번에 검색하는 RAG 도구
+
+    에이전트가 search_knowledge_base를 연속으로 여러 번 호출하면 검색마다 LLM 왕복이 필요합니다.
+    질의 목록을 한 번에 받아 임베딩을 한 번의 배치로 계산하고, 모든 질의를 함께 검색한 뒤
+    결과를 합쳐 중복을 제거합니다.
+    """
+
+    name: str = "search_knowledge_base_batch"
+    description: str = """
+    Search internal documents and knowledge for several queries at once.
+    Use this instead of calling search_knowledge_base repeatedly when the question
+    covers multiple topics, documents or sub-questions (e.g. comparing two policies).
+    Results for all queries are merged and deduplicated.
+    If the user mentions a specific file, sheet or slide, set the matching filter field."""
+    args_schema: Type[BaseModel] = BatchSearchInput
+
+    def _run(self, queries: List[str], **filters) -> str:
+        from src.systems.rag.vector_store import get_vector_store
+
+        store = get_vector_store()
+        search_filter = BatchSearchInput(queries=queries, **filters).to_filter()
+        queries = list(dict.fromkeys(queries))
+        k = get_settings().RAG_MAX_K
+        if get_settings().HYBRID_SEARCH_ENABLED:
+            results = store.batch_hybrid_search_with_dense(queries, k=k, filter=search_filter)
+            hits = [RAGTool._hybrid_hits(query_results) for query_results in results]
+        else:
+            results = store.batch_similarity_search_with_score(queries, k=k, filter=search_filter)
+            hits = [RAGTool._dense_hits(query_results) for query_results in results]
+        return self._merge(queries, hits)
+
+    async def _arun(self, queries: List[str], **filters) -> str:
+        from src.systems.rag.vector_store import aget_vector_store
+
+        store = await aget_vector_store()
+        search_filter = BatchSearchInput(queries=queries, **filters).to_filter()
+        queries = list(dict.fromkeys(queries))
+        k = get_settings().RAG_MAX_K
+        if get_settings().HYBRID_SEARCH_ENABLED:
+            results = await store.abatch_hybrid_search_with_dense(queries, k=k, filter=search_filter)
+            hits = [RAGTool._hybrid_hits(query_results) for query_results in results]
+        else:
+            results = await store.abatch_similarity_search_with_score(queries, k=k, filter=search_filter)
+            hits = [RAGTool._dense_hits(query_results) for query_results in results]
+        return self._merge(queries, hits)
+
+    @staticmethod
+    def _merge(queries: List[str], hits: List) -> str:
+        """질의별 결과를 순위가 같은 것끼리 번갈아 합치고(round-robin) 중복 제거 후 토큰 예산 안에 담습니다.
+
+        hits: 질의별 (Document, dense 거리, BM25 일치 여부) 목록
+        """
+        from src.systems.rag.context_assembly import assemble
+
+        rankings = [RAGTool._select(query_hits) for query_hits in hits]
+        merged, seen = [], set()
+        for rank in range(max((len(ranking) for ranking in rankings), default=0)):
+            for ranking in rankings:
+                if rank < len(ranking) and _doc_key(ranking[rank]) not in seen:
+                    seen.add(_doc_key(ranking[rank]))
+                    merged.append(ranking[rank])
 
-    async def _arun(self, query: str) -> str:
-        # For now, synchronous call is fine as Chroma is local
-        return self._run(query)
+        docs = assemble(merged, max_tokens=get_settings().RAG_BATCH_CONTEXT_MAX_TOKENS)
+        return RAGTool._format(docs, queries)
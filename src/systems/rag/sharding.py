@@ -0,0 +1,73 @@
+"""Collection Sharding - metadata 키 기반 다중 컬렉션
+
+VECTOR_SHARD_KEY(예: "department", "tenant")를 설정하면 청크를 해당 metadata 값별로
+별도 Chroma 컬렉션(shard)에 저장합니다. shard마다 HNSW 인덱스와 BM25 역색인이 따로 있으므로
+새 부서/테넌트가 추가되어도 기존 shard만 대상으로 하는 검색은 느려지지 않습니다.
+
+- 키가 없는 청크는 기본 shard(VECTOR_SHARD_DEFAULT)에 저장되며, 기본 shard는 기존 컬렉션
+  이름을 그대로 사용합니다. (샤딩 도입 전 데이터는 재색인 없이 기본 shard로 유지)
+- 다른 shard의 컬렉션 이름은 "<기본 컬렉션>__<값>"이고, 원래 값은 컬렉션 metadata("shard")에
+  기록하여 재시작 시 다시 찾습니다.
+- 검색 filter에 shard 키 조건이 있으면 해당 shard만, 없으면 모든 shard를 동시에 검색합니다.
+
+이미 저장된 source를 다른 shard로 옮기려면 먼저 삭제한 뒤 다시 수집해야 합니다.
+"""
+
+import hashlib
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.config.settings import get_settings
+
+settings = get_settings()
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^a-zA-Z0-9._-]")
+
+
+@dataclass
+class Shard:
+    """shard 하나의 Chroma 컬렉션과 BM25 역색인, exact 검색 색인"""
+
+    value: str
+    collection: Any
+    lexical: Any = None
+    lexical_lock: threading.Lock = field(default_factory=threading.Lock)
+    exact: Any = None
+    exact_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def collection_name(base: str, value: str) -> str:
+    """shard 값에 해당하는 Chroma 컬렉션 이름을 반환합니다.
+
+    Chroma 컬렉션 이름에 쓸 수 없는 문자(한글 등)가 있으면 제거하고 값의 해시를 붙입니다.
+    """
+    if value == settings.VECTOR_SHARD_DEFAULT:
+        return base
+    safe = _UNSAFE_NAME_CHARS.sub("", value)
+    if safe != value or not safe:
+        safe = f"{safe}-{hashlib.sha1(value.encode('utf-8')).hexdigest()[:8]}".lstrip("-")
+    return f"{base}__{safe}"[:512]
+
+
+def shard_of(metadata: Optional[dict]) -> str:
+    """청크 metadata로 저장할 shard 값을 결정합니다."""
+    key = settings.VECTOR_SHARD_KEY
+    value = (metadata or {}).get(key) if key else None
+    return str(value) if value not in (None, "") else settings.VECTOR_SHARD_DEFAULT
+
+
+def split_conditions(
+    conditions: Optional[Dict[str, list]],
+) -> tuple[Optional[List[str]], Optional[Dict[str, list]]]:
+    """filter 조건을 (검색할 shard 값 목록, shard 안에서 적용할 나머지 조건)으로 나눕니다.
+
+    shard 키 조건이 없으면 shard 값 목록은 None(모든 shard)입니다.
+    """
+    key = settings.VECTOR_SHARD_KEY
+    if not conditions or not key or key not in conditions:
+        return None, conditions
+    values = [str(value) for value in conditions[key]]
+    rest = {field: allowed for field, allowed in conditions.items() if field != key}
+    return values, rest or None
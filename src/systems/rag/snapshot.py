@@ -0,0 +1,320 @@
+"""Vector Index Snapshot - 컬렉션 export / 재임베딩 없는 bulk import
+
+새 API 레플리카가 문서를 다시 임베딩하거나 사용 중인 CHROMA_DB_PATH를 복사하지 않고,
+스냅샷 디렉터리 복사 + bulk import만으로 같은 인덱스를 갖도록 합니다.
+
+스냅샷 디렉터리 구조 (모든 파일은 little-endian raw 배열, dtype / shape는 manifest에 기록):
+
+    manifest.json                       형식 버전, 임베딩 모델, 저장 차원, shard 목록
+    <shard>/vectors.f32                 Chroma에 저장된 벡터 (count × dims, float32)
+    <shard>/ids.bin, ids.offsets.i64    UTF-8 문자열 열 (i번째 값 = bin[offsets[i]:offsets[i + 1]])
+    <shard>/documents.bin, documents.offsets.i64
+    <shard>/metadatas.bin, metadatas.offsets.i64    (JSON, metadata가 없으면 빈 문자열)
+    <shard>/rescore.mask.u8                         청크별 rescoring 벡터 유무 (count, 0/1)
+    <shard>/rescore.bin, rescore.scales.f32         rescoring 벡터 (저장 정밀도 그대로, mask가 1인 청크만 순서대로)
+
+벡터 파일은 np.memmap으로 바로 열 수 있으므로 import 시 전체를 메모리에 올리지 않고
+페이지 단위로 Chroma에 upsert합니다.
+
+export는 시작 시점의 id 목록을 기준으로 하며, 그 사이 삭제된 청크는 제외됩니다.
+"""
+
+import json
+import os
+import time
+from contextlib import ExitStack
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from src.config.settings import get_settings
+from src.core.embedding_service import EmbeddingService
+from src.systems.rag.exceptions import SnapshotError
+
+settings = get_settings()
+
+FORMAT_VERSION = 2
+# 1: rescore.mask.u8 없음 (rescore.bin이 모든 청크를 포함)
+_READABLE_FORMAT_VERSIONS = (1, 2)
+MANIFEST = "manifest.json"
+
+# 한 번에 조회/upsert하는 청크 수 (Chroma 최대 배치 크기를 넘지 않도록 조정됨)
+_PAGE_SIZE = 5000
+
+_RESCORE_DTYPES = {"float32": "<f4", "float16": "<f2", "int8": "i1"}
+
+
+class StringColumnWriter:
+    """UTF-8 문자열 열을 (blob, offsets) 파일로 순차 기록합니다."""
+
+    def __init__(self, directory: str, name: str):
+        self._data_path = os.path.join(directory, f"{name}.bin")
+        self._offsets_path = os.path.join(directory, f"{name}.offsets.i64")
+        self._data = open(self._data_path, "wb")
+        self._offsets: List[int] = [0]
+
+    def extend(self, values: List[str]):
+        for value in values:
+            encoded = value.encode("utf-8")
+            self._data.write(encoded)
+            self._offsets.append(self._offsets[-1] + len(encoded))
+
+    def close(self):
+        self._data.close()
+        np.asarray(self._offsets, dtype="<i8").tofile(self._offsets_path)
+
+
+class StringColumn:
+    """(blob, offsets) 파일로 저장된 문자열 열 (memory-mapped)"""
+
+    def __init__(self, directory: str, name: str):
+        self._offsets = np.fromfile(os.path.join(directory, f"{name}.offsets.i64"), dtype="<i8")
+        data_path = os.path.join(directory, f"{name}.bin")
+        self._data = (
+            np.memmap(data_path, dtype=np.uint8, mode="r")
+            if os.path.getsize(data_path)
+            else np.zeros(0, dtype=np.uint8)
+        )
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def slice(self, start: int, stop: int) -> List[str]:
+        offsets = self._offsets
+        return [
+            bytes(self._data[offsets[i]:offsets[i + 1]]).decode("utf-8")
+            for i in range(start, min(stop, len(self)))
+        ]
+
+
+def open_vectors(directory: str, name: str, dtype: str, shape: List[int]) -> np.ndarray:
+    """raw 벡터 파일을 memory-mapped 배열로 엽니다."""
+    path = os.path.join(directory, name)
+    if not shape[0]:
+        return np.zeros(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=tuple(shape))
+
+
+def read_manifest(path: str) -> dict:
+    """스냅샷 manifest를 읽고 형식 버전을 확인합니다."""
+    manifest_path = os.path.join(path, MANIFEST)
+    if not os.path.exists(manifest_path):
+        raise SnapshotError(path, "manifest.json not found")
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") not in _READABLE_FORMAT_VERSIONS:
+        raise SnapshotError(path, f"Unsupported snapshot format: {manifest.get('format_version')}")
+    return manifest
+
+
+def _embedding_identity() -> dict:
+    return {"provider": EmbeddingService.get_provider(), "model": EmbeddingService.get_model_info()["model"]}
+
+
+def _pages(total: int, page_size: int) -> Iterator[tuple[int, int]]:
+    for start in range(0, total, page_size):
+        yield start, min(start + page_size, total)
+
+
+def _page_size(store) -> int:
+    try:
+        return min(_PAGE_SIZE, store._chroma.get_max_batch_size())
+    except AttributeError:
+        return _PAGE_SIZE
+
+
+def export_snapshot(store, path: str) -> dict:
+    """VectorStore의 모든 shard를 스냅샷 디렉터리로 export합니다.
+
+    Returns:
+        dict: 기록된 manifest
+    """
+    os.makedirs(path, exist_ok=True)
+    started = time.perf_counter()
+    page_size = _page_size(store)
+    rescore_store = store.rescore_store
+    shards = []
+
+    for shard in store._target_shards(None):
+        directory = os.path.join(path, shard.collection.name)
+        os.makedirs(directory, exist_ok=True)
+        ids_all = shard.collection.get(include=[])["ids"]
+
+        columns = {name: StringColumnWriter(directory, name) for name in ("ids", "documents", "metadatas")}
+        count, dims, rescore_dims, rescore_count = 0, 0, 0, 0
+        with ExitStack() as files:
+            vectors_file = files.enter_context(open(os.path.join(directory, "vectors.f32"), "wb"))
+            if rescore_store is not None:
+                mask_file = files.enter_context(open(os.path.join(directory, "rescore.mask.u8"), "wb"))
+                rescore_file = files.enter_context(open(os.path.join(directory, "rescore.bin"), "wb"))
+                scales_file = files.enter_context(open(os.path.join(directory, "rescore.scales.f32"), "wb"))
+            for start, stop in _pages(len(ids_all), page_size):
+                page = shard.collection.get(
+                    ids=ids_all[start:stop], include=["embeddings", "documents", "metadatas"]
+                )
+                if not page["ids"]:
+                    continue
+                vectors = np.asarray(page["embeddings"], dtype="<f4")
+                dims = vectors.shape[1]
+                vectors.tofile(vectors_file)
+                columns["ids"].extend(page["ids"])
+                columns["documents"].extend([text or "" for text in page["documents"]])
+                columns["metadatas"].extend([
+                    json.dumps(metadata, ensure_ascii=False) if metadata else ""
+                    for metadata in page["metadatas"]
+                ])
+                if rescore_store is not None:
+                    written, page_dims = _write_rescore(
+                        rescore_store, page["ids"], mask_file, rescore_file, scales_file, rescore_dims
+                    )
+                    rescore_count += written
+                    rescore_dims = rescore_dims or page_dims
+                count += len(page["ids"])
+        for column in columns.values():
+            column.close()
+
+        shards.append({
+            "value": shard.value,
+            "collection": shard.collection.name,
+            "directory": shard.collection.name,
+            "count": count,
+            "dims": dims,
+            "rescore_dims": rescore_dims,
+            "rescore_count": rescore_count,
+        })
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "created_at": time.time(),
+        "embedding": _embedding_identity(),
+        "storage": {
+            "dimensions": store.dimensions,
+            "rescore_precision": rescore_store.precision if rescore_store is not None else None,
+        },
+        "shard_key": settings.VECTOR_SHARD_KEY or None,
+        "shards": shards,
+    }
+    with open(os.path.join(path, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    manifest["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    return manifest
+
+
+def _write_rescore(
+    rescore_store, ids: List[str], mask_file, rescore_file, scales_file, dims: int
+) -> tuple[int, int]:
+    """페이지의 rescoring 벡터 유무(mask)와 저장된 벡터를 저장 정밀도로 기록합니다.
+
+    rescoring 저장소에 없는 청크(rescoring을 켜기 전에 저장된 청크 등)는 mask만 0으로 기록하며,
+    import 후에도 검색 시 축소 차원 점수를 사용합니다. (compact_vectors.rescore()의 fallback과 동일)
+
+    Returns:
+        (기록한 벡터 수, 벡터 차원 수)
+    """
+    from src.systems.rag.compact_vectors import encode_matrix
+
+    found = rescore_store.get_many(ids)
+    np.fromiter((chunk_id in found for chunk_id in ids), dtype=np.uint8, count=len(ids)).tofile(mask_file)
+    if not found:
+        return 0, dims
+    dims = dims or len(next(iter(found.values())))
+    matrix = np.stack([found[chunk_id] for chunk_id in ids if chunk_id in found]).astype(np.float32)
+    if matrix.shape[1] != dims:
+        raise ValueError(f"Rescore vector dimensions mismatch: {matrix.shape[1]} != {dims}")
+    encoded, scales = encode_matrix(matrix, rescore_store.precision)
+    encoded.astype(_RESCORE_DTYPES[rescore_store.precision]).tofile(rescore_file)
+    scales.astype("<f4").tofile(scales_file)
+    return len(matrix), dims
+
+
+def import_snapshot(store, path: str, force: bool = False) -> dict:
+    """스냅샷을 재임베딩 없이 VectorStore에 bulk import합니다. (같은 id는 덮어씀)
+
+    Args:
+        force: 임베딩 모델이 달라도 import (벡터 공간이 같다고 확신할 때만 사용)
+
+    Raises:
+        SnapshotError: manifest가 없거나, 임베딩 모델 / 저장 차원이 현재 설정과 다른 경우
+    """
+    manifest = read_manifest(path)
+    current = _embedding_identity()
+    if manifest["embedding"]["model"] != current["model"] and not force:
+        raise SnapshotError(
+            path,
+            f"Embedding model mismatch: snapshot={manifest['embedding']['model']}, current={current['model']}",
+        )
+    if manifest["storage"]["dimensions"] != store.dimensions:
+        raise SnapshotError(
+            path,
+            f"Storage dimensions mismatch: snapshot={manifest['storage']['dimensions']}, "
+            f"current={store.dimensions} (VECTOR_STORAGE_DIMENSIONS)",
+        )
+
+    from src.systems.rag.compact_vectors import decode_matrix
+
+    started = time.perf_counter()
+    page_size = _page_size(store)
+    precision = manifest["storage"]["rescore_precision"]
+    imported = {}
+
+    for entry in manifest["shards"]:
+        directory = os.path.join(path, entry["directory"])
+        count = entry["count"]
+        if not count:
+            continue
+        vectors = open_vectors(directory, "vectors.f32", "<f4", [count, entry["dims"]])
+        ids = StringColumn(directory, "ids")
+        documents = StringColumn(directory, "documents")
+        metadatas = StringColumn(directory, "metadatas")
+        rescore = None
+        if precision and store.rescore_store is not None and entry.get("rescore_dims"):
+            mask_path = os.path.join(directory, "rescore.mask.u8")
+            present = (
+                np.fromfile(mask_path, dtype=np.uint8).astype(bool)
+                if os.path.exists(mask_path)
+                else np.ones(count, dtype=bool)
+            )
+            # 청크 순서 → rescore.bin 행 번호 (mask가 1인 청크만 기록되어 있음)
+            rescore_rows = np.cumsum(present) - 1
+            rescore = open_vectors(
+                directory, "rescore.bin", _RESCORE_DTYPES[precision], [int(present.sum()), entry["rescore_dims"]]
+            )
+            scales = np.fromfile(os.path.join(directory, "rescore.scales.f32"), dtype="<f4")
+
+        shard = store._get_shard(entry["value"])
+        for start, stop in _pages(count, page_size):
+            page_ids = ids.slice(start, stop)
+            page_metadatas = [json.loads(text) if text else None for text in metadatas.slice(start, stop)]
+            shard.collection.upsert(
+                ids=page_ids,
+                embeddings=np.asarray(vectors[start:stop], dtype=np.float32),
+                documents=documents.slice(start, stop),
+                metadatas=page_metadatas,
+            )
+            if rescore is not None and present[start:stop].any():
+                selected = present[start:stop]
+                rows = rescore_rows[start:stop][selected]
+                store.rescore_store.put_many(
+                    [chunk_id for chunk_id, keep in zip(page_ids, selected) if keep],
+                    decode_matrix(rescore[rows], scales[rows], precision),
+                )
+        imported[entry["value"]] = count
+
+    store._reset_after_bulk_load()
+    return {
+        "shards": imported,
+        "count": sum(imported.values()),
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def snapshot_info(path: Optional[str]) -> Optional[dict]:
+    """스냅샷 manifest 요약을 반환합니다. (없으면 None)"""
+    if not path or not os.path.exists(os.path.join(path, MANIFEST)):
+        return None
+    manifest = read_manifest(path)
+    return {
+        "embedding": manifest["embedding"],
+        "count": sum(entry["count"] for entry in manifest["shards"]),
+        "created_at": manifest["created_at"],
+    }
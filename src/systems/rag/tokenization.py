@@ -0,0 +1,157 @@
+"""토큰 길이 계산 - 캐시된 tokenizer
+
+청크 크기를 문자 수가 아닌 토큰 수로 맞추기 위한 tokenizer를 제공합니다.
+tokenizer는 프로세스당 한 번만 로드되며(lru_cache), 여러 텍스트의 길이는 배치로 계산합니다.
+
+- "tiktoken": LLM 프롬프트 예산 기준 (기본 cl100k_base)
+- "embedding": 임베딩 모델(LOCAL_EMBEDDING_MODEL)의 HuggingFace tokenizer 기준
+"""
+
+import copy
+import re
+from functools import lru_cache
+from typing import Any, List, Literal, Optional
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from src.config.settings import get_settings
+
+settings = get_settings()
+
+TokenizerKind = Literal["tiktoken", "embedding"]
+
+
+class TokenCounter:
+    """tokenizer 래퍼 - 단일/배치 토큰 수 계산"""
+
+    def __init__(self, kind: TokenizerKind, name: str):
+        self.kind = kind
+        self.name = name
+        if kind == "tiktoken":
+            import tiktoken
+
+            self._tokenizer = tiktoken.get_encoding(name)
+        elif kind == "embedding":
+            from transformers import AutoTokenizer
+
+            self._tokenizer = AutoTokenizer.from_pretrained(name)
+        else:
+            raise ValueError(f"Unknown tokenizer: {kind}. Use 'tiktoken' or 'embedding'")
+
+    def count(self, text: str) -> int:
+        """텍스트의 토큰 수를 반환합니다."""
+        return self.count_batch([text])[0]
+
+    def count_batch(self, texts: List[str]) -> List[int]:
+        """여러 텍스트의 토큰 수를 한 번에 계산합니다."""
+        if not texts:
+            return []
+        if self.kind == "tiktoken":
+            return [len(ids) for ids in self._tokenizer.encode_ordinary_batch(texts)]
+        encoded = self._tokenizer(texts, add_special_tokens=False)["input_ids"]
+        return [len(ids) for ids in encoded]
+
+
+@lru_cache(maxsize=4)
+def get_token_counter(
+    kind: Optional[TokenizerKind] = None, name: Optional[str] = None
+) -> TokenCounter:
+    """캐시된 TokenCounter를 반환합니다. (프로세스당 tokenizer 한 번만 로드)
+
+    Args:
+        kind: "tiktoken" 또는 "embedding". None이면 settings.CHUNK_TOKENIZER 사용
+        name: tiktoken 인코딩명 또는 HuggingFace 모델명. None이면 kind에 따른 기본값 사용
+    """
+    selected_kind = kind or settings.CHUNK_TOKENIZER
+    if name is None:
+        name = (
+            settings.TIKTOKEN_ENCODING
+            if selected_kind == "tiktoken"
+            else settings.LOCAL_EMBEDDING_MODEL
+        )
+    return TokenCounter(selected_kind, name)
+
+
+def count_tokens(text: str) -> int:
+    """기본 tokenizer 기준 토큰 수를 반환합니다."""
+    return get_token_counter().count(text)
+
+
+try:
+    from langchain_text_splitters.character import _split_text_with_regex
+except ImportError:  # pragma: no cover - langchain 내부 함수가 바뀐 경우 배치 prefill만 생략
+    _split_text_with_regex = None
+
+
+class TokenTextSplitter(RecursiveCharacterTextSplitter):
+    """토큰 수 기준 RecursiveCharacterTextSplitter
+
+    RecursiveCharacterTextSplitter는 조각마다 length_function을 여러 번 호출합니다.
+    각 재귀 단계에서 나올 조각들의 토큰 수를 배치로 미리 계산해 캐시에 채워두어,
+    tokenizer 호출을 조각 단위 단건 호출에서 단계별 배치 호출로 줄입니다.
+    """
+
+    # 길이 캐시가 이 크기를 넘으면 비웁니다. (메모리 상한)
+    _MAX_CACHE_SIZE = 50_000
+
+    def __init__(self, counter: Optional[TokenCounter] = None, **kwargs: Any):
+        self._counter = counter or get_token_counter()
+        self._lengths: dict[str, int] = {}
+        super().__init__(length_function=self._token_length, **kwargs)
+
+    def _token_length(self, text: str) -> int:
+        length = self._lengths.get(text)
+        if length is None:
+            length = self._counter.count(text)
+            self._remember([text], [length])
+        return length
+
+    def _remember(self, texts: List[str], lengths: List[int]):
+        if len(self._lengths) + len(texts) > self._MAX_CACHE_SIZE:
+            self._lengths.clear()
+        self._lengths.update(zip(texts, lengths))
+
+    def _prefill(self, text: str, separators: List[str]):
+        """RecursiveCharacterTextSplitter와 같은 규칙으로 이번 단계의 조각을 만들어 배치 계산합니다."""
+        if _split_text_with_regex is None:
+            return
+        separator = separators[-1]
+        for candidate in separators:
+            pattern = candidate if self._is_separator_regex else re.escape(candidate)
+            if candidate == "":
+                separator = candidate
+                break
+            if re.search(pattern, text):
+                separator = candidate
+                break
+        pattern = separator if self._is_separator_regex else re.escape(separator)
+        splits = _split_text_with_regex(text, pattern, keep_separator=self._keep_separator)
+
+        missing = list({s for s in splits + [separator] if s not in self._lengths})
+        if missing:
+            self._remember(missing, self._counter.count_batch(missing))
+
+    def _split_text(self, text: str, separators: List[str]) -> List[str]:
+        self._prefill(text, separators)
+        return super()._split_text(text, separators)
+
+    def create_documents(self, texts: List[str], metadatas: Optional[List[dict]] = None) -> List[Document]:
+        """청크 Document를 만들고 add_start_index이면 원문 내 문자 위치를 기록합니다.
+
+        LangChain 기본 구현은 다음 청크의 검색 시작 위치를 "이전 위치 + 이전 길이 - chunk_overlap"으로
+        잡는데, 여기서 chunk_overlap은 토큰 수라 문자 위치와 단위가 달라 -1이나 틀린 값이 나옵니다.
+        청크는 원문 순서대로 나오므로 이전 청크 시작 바로 다음부터 찾습니다.
+        (찾지 못한 청크에는 start_index를 기록하지 않음)
+        """
+        metadatas = metadatas or [{}] * len(texts)
+        documents = []
+        for text, metadata in zip(texts, metadatas):
+            previous = -1
+            for chunk in self.split_text(text):
+                chunk_metadata = copy.deepcopy(metadata)
+                if self._add_start_index:
+                    start = text.find(chunk, previous + 1)
+                    if start >= 0:
+                        chunk_metadata["start_index"] = previous = start
+                documents.append(Document(page_content=chunk, metadata=chunk_metadata))
+        return documents
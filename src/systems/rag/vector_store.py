@@ -1,12 +1,45 @@
 """Vector Store - ChromaDB 기반 벡터 저장소
 
 EmbeddingService를 사용하여 Local HuggingFace 또는 OpenAI Embeddings를 지원합니다.
+
+import 시점에는 아무것도 로드하지 않습니다. 임베딩 모델과 Chroma는 get_vector_store()를
+처음 호출할 때(또는 서버 시작 후 백그라운드 warm_up에서) 초기화됩니다.
+
+VECTOR_STORAGE_DIMENSIONS / VECTOR_RESCORE_PRECISION을 설정하면 Chroma에는 축소 차원 벡터를
+저장하고, 검색 후보를 전체 차원 벡터로 다시 점수 매깁니다. (compact_vectors.py 참고)
+
+hybrid_search는 dense 검색과 BM25 역색인(lexical_index.py) 결과를 RRF로 합칩니다.
+역색인은 첫 하이브리드 검색 때 컬렉션에서 만들고, 이후 add_documents / delete 시 함께 갱신합니다.
+
+검색 메서드는 metadata filter(metadata_filter.py 형식)를 받습니다. dense 측은 Chroma where 절로,
+BM25 측은 FILTER_INDEXED_FIELDS 필드 색인(그 밖의 필드는 Chroma에서 조회한 id 목록)으로 제한합니다.
+
+VECTOR_SEARCH_BACKEND="numpy"이면 dense 검색을 Chroma HNSW 대신 shard별 메모리 내 float32 행렬의
+brute-force exact 검색(exact_index.py)으로 수행합니다. Chroma는 계속 원본 저장소로 사용합니다.
+
+검색 결과는 인덱스 버전 기반 캐시(query_cache.py)에 저장되며, 저장소가 변경될 때마다 버전이 올라갑니다.
+
+VECTOR_SHARD_KEY를 설정하면 청크를 해당 metadata 값별 컬렉션(shard)에 나누어 저장하고,
+검색은 질의를 한 번만 임베딩한 뒤 대상 shard를 동시에 검색하여 상위 k개를 합칩니다. (sharding.py 참고)
+
+export_snapshot / import_snapshot은 모든 shard를 memory-mappable 스냅샷 디렉터리로 내보내고
+재임베딩 없이 다시 불러옵니다. (snapshot.py 참고)
+
+비동기 API(asimilarity_search 등)는 질의 임베딩과 Chroma 조회를 이벤트 루프가 아닌
+전용 스레드 풀(VECTOR_STORE_ASYNC_WORKERS)에서 실행합니다.
 """
 
+import asyncio
 import os
-from langchain_community.vectorstores import Chroma
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 from src.config.settings import get_settings
 from src.core.embedding_service import EmbeddingService
+from src.systems.rag.metadata_filter import normalize_filter, to_chroma_where
+from src.systems.rag.query_cache import QueryResultCache
+from src.systems.rag.sharding import Shard, collection_name, shard_of, split_conditions
 
 settings = get_settings()
 
@@ -19,58 +52,779 @@ class VectorStore:
     """
 
     _instance = None
+    _lock = threading.Lock()
+    _executor: ThreadPoolExecutor | None = None
+    _fanout_executor: ThreadPoolExecutor | None = None
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(VectorStore, cls).__new__(cls)
-            cls._instance._initialize()
+            # warm-up 스레드와 요청 처리 스레드가 동시에 초기화하지 않도록 잠금
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(VectorStore, cls).__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
 
     def _initialize(self):
         """VectorStore 초기화"""
+        import chromadb
+        from langchain_community.vectorstores import Chroma
+
+        self._warmed_up = False
+
         # Ensure directory exists
         os.makedirs(settings.CHROMA_DB_PATH, exist_ok=True)
 
         # EmbeddingService를 통해 embedding function 획득
         self.embedding_function = EmbeddingService.get_embeddings()
 
+        self.dimensions = settings.VECTOR_STORAGE_DIMENSIONS
+        self.rescore_store = None
+        chroma_embeddings = self.embedding_function
+        base_collection = "soundmind_knowledge"
+        if self.dimensions:
+            from src.systems.rag.compact_vectors import TruncatedEmbeddings, create_rescore_store
+
+            # as_retriever 등 Chroma를 직접 쓰는 경로도 축소 차원으로 검색하도록 래핑
+            chroma_embeddings = TruncatedEmbeddings(self.embedding_function, self.dimensions)
+            base_collection = f"soundmind_knowledge_d{self.dimensions}"
+            self.rescore_store = create_rescore_store(
+                settings.CHROMA_DB_PATH, settings.VECTOR_RESCORE_PRECISION
+            )
+        elif settings.VECTOR_RESCORE_PRECISION != "off":
+            # Chroma에 이미 전체 차원 벡터가 있으므로 rescoring 저장소는 용량만 늘림
+            print(
+                f"VECTOR_RESCORE_PRECISION={settings.VECTOR_RESCORE_PRECISION} is ignored: "
+                "rescoring needs VECTOR_STORAGE_DIMENSIONS > 0"
+            )
+        self.compact = chroma_embeddings is not self.embedding_function
+        self.query_cache = (
+            QueryResultCache(settings.QUERY_CACHE_MAX_ENTRIES, settings.QUERY_CACHE_TTL_SECONDS)
+            if settings.QUERY_CACHE_ENABLED
+            else None
+        )
+
+        # 모든 shard가 하나의 Chroma client를 공유. self.client(LangChain 래퍼)는 기본 shard용
+        self._chroma = chromadb.PersistentClient(path=settings.CHROMA_DB_PATH)
         self.client = Chroma(
-            persist_directory=settings.CHROMA_DB_PATH,
-            embedding_function=self.embedding_function,
-            collection_name="soundmind_knowledge"
+            client=self._chroma,
+            embedding_function=chroma_embeddings,
+            collection_name=base_collection
+        )
+        self.collection_name = base_collection
+        self._shards_lock = threading.Lock()
+        self._shards: dict[str, Shard] = {
+            settings.VECTOR_SHARD_DEFAULT: Shard(settings.VECTOR_SHARD_DEFAULT, self.client._collection)
+        }
+        if settings.VECTOR_SHARD_KEY:
+            self._load_shards()
+
+    # ==========================================================
+    # Shards
+    # ==========================================================
+    def _load_shards(self):
+        """저장된 shard 컬렉션을 찾아 등록합니다."""
+        prefix = f"{self.collection_name}__"
+        for entry in self._chroma.list_collections():
+            name = entry if isinstance(entry, str) else entry.name
+            if not name.startswith(prefix):
+                continue
+            collection = self._chroma.get_collection(name)
+            value = (collection.metadata or {}).get("shard")
+            if value:
+                self._shards[value] = Shard(value, collection)
+
+    def _get_shard(self, value: str) -> Shard:
+        """shard를 반환합니다. (없으면 컬렉션을 만들어 등록)"""
+        shard = self._shards.get(value)
+        if shard is None:
+            with self._shards_lock:
+                shard = self._shards.get(value)
+                if shard is None:
+                    collection = self._chroma.get_or_create_collection(
+                        collection_name(self.collection_name, value), metadata={"shard": value}
+                    )
+                    shard = Shard(value, collection)
+                    # 검색 스레드가 잠금 없이 읽을 수 있도록 새 dict로 교체
+                    self._shards = {**self._shards, value: shard}
+        return shard
+
+    def _target_shards(self, values: list[str] | None) -> list[Shard]:
+        """검색할 shard 목록 (values가 None이면 전체)"""
+        shards = self._shards
+        if values is None:
+            return list(shards.values())
+        return [shards[value] for value in values if value in shards]
+
+    def _fan_out(self, func, shards: list[Shard]) -> list:
+        """shard별 func(shard)를 동시에 실행하여 결과 목록을 반환합니다."""
+        if len(shards) <= 1:
+            return [func(shard) for shard in shards]
+        return list(self._get_fanout_executor().map(func, shards))
+
+    @classmethod
+    def _get_fanout_executor(cls) -> ThreadPoolExecutor:
+        if cls._fanout_executor is None:
+            with cls._lock:
+                if cls._fanout_executor is None:
+                    cls._fanout_executor = ThreadPoolExecutor(
+                        max_workers=settings.VECTOR_SHARD_SEARCH_WORKERS,
+                        thread_name_prefix="vector-store-shard",
+                    )
+        return cls._fanout_executor
+
+    def add_documents(
+        self,
+        documents,
+        ids: list[str] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ):
+        """문서를 벡터 저장소에 추가합니다.
+
+        ids를 지정하면 해당 id로 저장합니다. (content-hash 기반 증분 수집용)
+        청크 수 / 토큰 수 기준 배치(batching.py)로 나누어, 배치 N을 저장하는 동안
+        배치 N+1을 임베딩합니다. 배치별 임베딩/저장은 실패 시 재시도하며,
+        저장된 배치는 바로 검색에 반영됩니다.
+
+        Args:
+            on_progress: 배치 저장 후 (저장된 청크 수, 전체 청크 수)로 호출되는 콜백
+
+        Raises:
+            IndexingBatchError: 재시도 후에도 배치 임베딩/저장에 실패한 경우 (앞선 배치는 유지)
+        """
+        from src.systems.rag.batching import call_with_retry, plan_batches
+        from src.systems.rag.exceptions import IndexingBatchError
+
+        documents = list(documents)
+        if not documents:
+            return []
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in documents]
+
+        texts = [doc.page_content for doc in documents]
+        batches = plan_batches(
+            texts, settings.VECTOR_ADD_BATCH_SIZE, settings.VECTOR_ADD_BATCH_MAX_TOKENS
+        )
+
+        added = 0
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="vector-store-embed") as embedder:
+            def embed(batch: range):
+                return embedder.submit(
+                    call_with_retry, self.embedding_function.embed_documents, texts[batch.start:batch.stop]
+                )
+
+            pending = embed(batches[0])
+            for n, batch in enumerate(batches):
+                try:
+                    vectors = pending.result()
+                    if n + 1 < len(batches):
+                        pending = embed(batches[n + 1])
+                    call_with_retry(
+                        self._insert_batch,
+                        ids[batch.start:batch.stop],
+                        documents[batch.start:batch.stop],
+                        vectors,
+                    )
+                except Exception as e:
+                    pending.cancel()
+                    raise IndexingBatchError(added, len(documents), str(e)) from e
+
+                added += len(batch)
+                if on_progress is not None:
+                    on_progress(added, len(documents))
+        return ids
+
+    def _insert_batch(self, ids: list[str], documents, vectors: list[list[float]]):
+        """임베딩된 배치를 shard별 Chroma 컬렉션(compact 모드에서는 축소 차원)과
+        rescoring 저장소, BM25 역색인에 저장합니다."""
+        embeddings = vectors
+        if self.compact:
+            from src.systems.rag.compact_vectors import truncate
+
+            embeddings = truncate(vectors, self.dimensions).tolist()
+
+        groups: dict[str, list[int]] = {}
+        for i, doc in enumerate(documents):
+            groups.setdefault(shard_of(doc.metadata), []).append(i)
+
+        for value, rows in groups.items():
+            shard = self._get_shard(value)
+            shard_ids = [ids[i] for i in rows]
+            shard_docs = [documents[i] for i in rows]
+            shard.collection.upsert(
+                ids=shard_ids,
+                embeddings=[embeddings[i] for i in rows],
+                # Chroma는 빈 metadata dict를 허용하지 않음
+                metadatas=[doc.metadata or None for doc in shard_docs],
+                documents=[doc.page_content for doc in shard_docs],
+            )
+            with shard.lexical_lock:
+                if shard.lexical is not None:
+                    shard.lexical.add(
+                        shard_ids,
+                        [doc.page_content for doc in shard_docs],
+                        [doc.metadata for doc in shard_docs],
+                    )
+            with shard.exact_lock:
+                if shard.exact is not None:
+                    shard.exact.add(
+                        shard_ids,
+                        [embeddings[i] for i in rows],
+                        [doc.page_content for doc in shard_docs],
+                        [doc.metadata or None for doc in shard_docs],
+                    )
+        if self.rescore_store is not None:
+            self.rescore_store.put_many(ids, vectors)
+        self._bump_version()
+
+    def get_source_entries(self, source: str) -> dict[str, dict]:
+        """source에 속한 저장된 청크의 id → metadata 매핑을 반환합니다. (모든 shard)"""
+        entries: dict[str, dict] = {}
+        for result in self._fan_out(
+            lambda shard: shard.collection.get(where={"source": source}, include=["metadatas"]),
+            self._target_shards(None),
+        ):
+            entries.update(zip(result["ids"], result["metadatas"] or []))
+        return entries
+
+    def update_metadatas(self, ids: list[str], metadatas: list[dict]):
+        """임베딩을 다시 계산하지 않고 청크의 metadata만 갱신합니다. (metadata의 shard로 라우팅)"""
+        if not ids:
+            return
+        groups: dict[str, list[int]] = {}
+        for i, metadata in enumerate(metadatas):
+            groups.setdefault(shard_of(metadata), []).append(i)
+        for value, rows in groups.items():
+            shard = self._get_shard(value)
+            shard_ids = [ids[i] for i in rows]
+            shard_metadatas = [metadatas[i] for i in rows]
+            shard.collection.update(ids=shard_ids, metadatas=shard_metadatas)
+            with shard.lexical_lock:
+                if shard.lexical is not None:
+                    shard.lexical.update_metadata(shard_ids, shard_metadatas)
+            with shard.exact_lock:
+                if shard.exact is not None:
+                    shard.exact.update_metadata(shard_ids, shard_metadatas)
+        self._bump_version()
+
+    def _bump_version(self):
+        """저장소 변경 시 검색 결과 캐시를 무효화합니다."""
+        if self.query_cache is not None:
+            self.query_cache.bump_version()
+
+    def _cached(self, kind: str, query: str, k: int, conditions, compute):
+        if self.query_cache is None:
+            return compute()
+        return self.query_cache.get_or_compute(
+            self.query_cache.key(kind, query, k, conditions), compute
         )
 
-    def add_documents(self, documents):
-        """문서를 벡터 저장소에 추가합니다."""
-        return self.client.add_documents(documents)
+    def similarity_search(self, query: str, k: int = 4, filter: dict | None = None):
+        """유사한 문서를 검색합니다.
+
+        Raises:
+            InvalidFilterError: 잘못된 filter
+        """
+        conditions = normalize_filter(filter)
+
+        def compute():
+            return [doc for _, doc, _ in self._dense_search(query, k, conditions)]
+
+        return self._cached("similarity", query, k, conditions, compute)
+
+    def similarity_search_with_score(self, query: str, k: int = 4, filter: dict | None = None):
+        """유사한 문서를 점수와 함께 검색합니다.
+
+        Raises:
+            InvalidFilterError: 잘못된 filter
+        """
+        conditions = normalize_filter(filter)
+
+        def compute():
+            return [(doc, distance) for _, doc, distance in self._dense_search(query, k, conditions)]
+
+        return self._cached("similarity_with_score", query, k, conditions, compute)
+
+    def batch_similarity_search_with_score(
+        self, queries: list[str], k: int = 4, filter: dict | None = None
+    ) -> list[list[tuple]]:
+        """여러 질의를 한 번에 검색하여 질의별 (Document, 거리) 목록을 반환합니다.
+
+        질의를 한 번에 임베딩하고, shard마다 모든 질의를 한 번의 조회(numpy backend에서는 행렬곱 한 번)로
+        검색합니다. 검색 결과 캐시는 사용하지 않습니다.
+
+        Raises:
+            InvalidFilterError: 잘못된 filter
+        """
+        conditions = normalize_filter(filter)
+        if not queries:
+            return []
+        results = self._dense_search_many(self._embed_queries(queries), k, conditions)
+        return [[(doc, distance) for _, doc, distance in hits] for hits in results]
+
+    def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """질의 목록을 한 번의 배치로 임베딩합니다. (캐시 래퍼가 있으면 미스만 계산)"""
+        from src.core.embedding_batcher import embed_queries
+
+        return embed_queries(self.embedding_function, queries)
+
+    def _dense_search(self, query: str, k: int, conditions=None) -> list[tuple]:
+        """dense 검색 결과를 (id, Document, 거리) 목록으로 반환합니다."""
+        return self._dense_search_many([self.embedding_function.embed_query(query)], k, conditions)[0]
+
+    def _dense_search_many(self, query_vectors: list, k: int, conditions=None) -> list[list[tuple]]:
+        """질의 벡터별 dense 검색 결과를 (id, Document, 거리) 목록으로 반환합니다.
+
+        compact 모드에서는 축소 차원으로 후보를 찾고, rescoring 저장소가 있으면 전체 차원 벡터로
+        다시 정렬합니다. 이때 점수는 Chroma 기본(l2)과 같은 의미가 되도록 정규화 벡터의
+        제곱 L2 거리(2 - 2·cos)로 반환합니다.
+
+        대상 shard를 동시에 검색한 뒤 질의별로 거리순으로 합칩니다.
+        """
+        from langchain_core.documents import Document
+
+        values, shard_conditions = split_conditions(conditions)
+        shards = self._target_shards(values)
+        if not shards:
+            return [[] for _ in query_vectors]
+
+        search_vectors = query_vectors
+        n_results = k
+        if self.compact:
+            from src.systems.rag.compact_vectors import truncate
+
+            search_vectors = truncate(query_vectors, self.dimensions).tolist()
+            if self.rescore_store is not None:
+                n_results = k * settings.VECTOR_RESCORE_CANDIDATES
+
+        query_shard = (
+            self._exact_query(search_vectors, n_results, shard_conditions)
+            if settings.VECTOR_SEARCH_BACKEND == "numpy"
+            else self._chroma_query(search_vectors, n_results, shard_conditions)
+        )
+
+        per_query = [[] for _ in query_vectors]
+        for shard_hits in self._fan_out(query_shard, shards):
+            for hits, query_hits in zip(per_query, shard_hits):
+                hits.extend(query_hits)
+
+        results = []
+        for query_vector, hits in zip(query_vectors, per_query):
+            if len(shards) > 1:
+                hits = sorted(hits, key=lambda hit: hit[3])[:n_results]
+
+            ids = [hit[0] for hit in hits]
+            documents = [Document(page_content=hit[1], metadata=hit[2] or {}) for hit in hits]
+            distances = [hit[3] for hit in hits]
+
+            if self.rescore_store is None:
+                results.append(list(zip(ids, documents, distances))[:k])
+                continue
+
+            from src.systems.rag.compact_vectors import rescore
 
-    def similarity_search(self, query: str, k: int = 4):
-        """유사한 문서를 검색합니다."""
-        return self.client.similarity_search(query, k=k)
+            ranked = rescore(
+                query_vector, ids, [1 - distance / 2 for distance in distances], self.rescore_store, k
+            )
+            results.append([(ids[i], documents[i], 2 - 2 * score) for i, score in ranked])
+        return results
 
-    def similarity_search_with_score(self, query: str, k: int = 4):
-        """유사한 문서를 점수와 함께 검색합니다."""
-        return self.client.similarity_search_with_score(query, k=k)
+    def _chroma_query(self, vectors: list, n_results: int, conditions):
+        """shard의 Chroma HNSW 색인으로 질의별 (id, 본문, metadata, 거리) 목록을 구하는 함수"""
+        where = to_chroma_where(conditions)
+
+        def query_shard(shard: Shard) -> list[list[tuple]]:
+            result = shard.collection.query(
+                query_embeddings=vectors,
+                n_results=n_results,
+                where=where,
+                include=["documents", "metadatas", "distances"],
+            )
+            return [
+                list(zip(ids, documents, metadatas, distances))
+                for ids, documents, metadatas, distances in zip(
+                    result["ids"], result["documents"], result["metadatas"], result["distances"]
+                )
+            ]
+
+        return query_shard
+
+    def _exact_query(self, vectors: list, n_results: int, conditions):
+        """shard의 exact 색인(numpy)으로 질의별 (id, 본문, metadata, 거리) 목록을 구하는 함수
+
+        filter 필드가 모두 색인된 필드이면 필드 색인으로, 아니면 Chroma where 조회 결과로 제한합니다.
+        """
+
+        def query_shard(shard: Shard) -> list[list[tuple]]:
+            index = self._shard_exact_index(shard)
+            if not conditions:
+                return index.search_batch(vectors, n_results)
+            if index.can_filter(conditions):
+                return index.search_batch(vectors, n_results, conditions=conditions)
+            allowed = shard.collection.get(where=to_chroma_where(conditions), include=[])["ids"]
+            return index.search_batch(vectors, n_results, allowed_ids=allowed)
+
+        return query_shard
+
+    def hybrid_search(self, query: str, k: int = 4, filter: dict | None = None):
+        """dense + BM25 하이브리드 검색으로 유사한 문서를 반환합니다."""
+        return [doc for doc, _ in self.hybrid_search_with_score(query, k, filter)]
+
+    def hybrid_search_with_score(self, query: str, k: int = 4, filter: dict | None = None):
+        """dense 검색과 BM25 검색 결과를 RRF로 합쳐 (Document, RRF 점수) 목록을 반환합니다.
+
+        Raises:
+            InvalidFilterError: 잘못된 filter
+        """
+        return [(doc, score) for doc, score, _, _ in self.hybrid_search_with_dense(query, k, filter)]
+
+    def hybrid_search_with_dense(self, query: str, k: int = 4, filter: dict | None = None):
+        """하이브리드 검색 결과를 (Document, RRF 점수, dense 거리, BM25 일치 여부) 목록으로 반환합니다.
+
+        각 측에서 max(k, HYBRID_CANDIDATES)개 후보를 가져와 합칩니다. BM25 후보 중
+        최고 점수의 HYBRID_LEXICAL_MIN_SCORE_RATIO 미만인 문서는 제외합니다.
+        BM25에만 나온 문서는 컬렉션에서 본문/metadata를 조회하며, dense 거리는 None입니다.
+        (질의 임베딩과 dense 검색은 한 번만 수행하므로 dense 점수가 필요할 때 별도 검색이 필요 없음)
+
+        Raises:
+            InvalidFilterError: 잘못된 filter
+        """
+        conditions = normalize_filter(filter)
+        return self._cached(
+            "hybrid", query, k, conditions, lambda: self._hybrid_search(query, k, conditions)
+        )
+
+    def batch_hybrid_search_with_score(
+        self, queries: list[str], k: int = 4, filter: dict | None = None
+    ) -> list[list[tuple]]:
+        """여러 질의를 한 번에 하이브리드 검색하여 질의별 (Document, RRF 점수) 목록을 반환합니다.
+
+        Raises:
+            InvalidFilterError: 잘못된 filter
+        """
+        return [
+            [(doc, score) for doc, score, _, _ in hits]
+            for hits in self.batch_hybrid_search_with_dense(queries, k, filter)
+        ]
+
+    def batch_hybrid_search_with_dense(
+        self, queries: list[str], k: int = 4, filter: dict | None = None
+    ) -> list[list[tuple]]:
+        """여러 질의를 한 번에 하이브리드 검색하여 질의별
+        (Document, RRF 점수, dense 거리, BM25 일치 여부) 목록을 반환합니다.
+
+        dense 측은 batch_similarity_search_with_score처럼 질의를 한 번에 임베딩/검색하고,
+        BM25 검색과 RRF 결합은 질의별로 수행합니다. 검색 결과 캐시는 사용하지 않습니다.
+
+        Raises:
+            InvalidFilterError: 잘못된 filter
+        """
+        conditions = normalize_filter(filter)
+        if not queries:
+            return []
+        candidates = max(k, settings.HYBRID_CANDIDATES)
+        dense = self._dense_search_many(self._embed_queries(queries), candidates, conditions)
+        return [
+            self._fuse(query, k, conditions, query_dense)
+            for query, query_dense in zip(queries, dense)
+        ]
+
+    def _hybrid_search(self, query: str, k: int, conditions=None):
+        dense = self._dense_search(query, max(k, settings.HYBRID_CANDIDATES), conditions)
+        return self._fuse(query, k, conditions, dense)
+
+    def _fuse(self, query: str, k: int, conditions, dense: list[tuple]):
+        """dense 결과와 BM25 결과를 RRF로 합쳐 (Document, RRF 점수, dense 거리, BM25 일치 여부) 목록을 반환합니다."""
+        from langchain_core.documents import Document
+        from src.systems.rag.lexical_index import reciprocal_rank_fusion
+
+        candidates = max(k, settings.HYBRID_CANDIDATES)
+        lexical = self._lexical_search(query, candidates, conditions)
+        if lexical:
+            # 흔한 토큰만 겹친 약한 BM25 일치는 제외 (정확 일치 문서가 RRF에서 묻히지 않도록)
+            min_score = lexical[0][1] * settings.HYBRID_LEXICAL_MIN_SCORE_RATIO
+            lexical = [(doc_id, score) for doc_id, score in lexical if score >= min_score]
+
+        fused = reciprocal_rank_fusion(
+            [[doc_id for doc_id, _, _ in dense], [doc_id for doc_id, _ in lexical]],
+            k=settings.HYBRID_RRF_K,
+        )[:k]
+
+        documents = {doc_id: doc for doc_id, doc, _ in dense}
+        missing = [doc_id for doc_id, _ in fused if doc_id not in documents]
+        if missing:
+            values, _ = split_conditions(conditions)
+            for result in self._fan_out(
+                lambda shard: shard.collection.get(ids=missing, include=["documents", "metadatas"]),
+                self._target_shards(values),
+            ):
+                for doc_id, text, metadata in zip(result["ids"], result["documents"], result["metadatas"]):
+                    documents[doc_id] = Document(page_content=text, metadata=metadata or {})
+
+        distances = {doc_id: distance for doc_id, _, distance in dense}
+        lexical_ids = {doc_id for doc_id, _ in lexical}
+        return [
+            (documents[doc_id], score, distances.get(doc_id), doc_id in lexical_ids)
+            for doc_id, score in fused
+            if doc_id in documents
+        ]
+
+    def _lexical_search(self, query: str, k: int, conditions=None) -> list[tuple[str, float]]:
+        """대상 shard의 BM25 결과를 점수순으로 합칩니다.
+
+        filter 필드가 모두 색인된 필드이면 필드 색인으로, 아니면 Chroma where 조회 결과로 제한합니다.
+        (IDF는 shard별로 계산되므로 shard 간 점수 비교는 근사치입니다.)
+        """
+        values, shard_conditions = split_conditions(conditions)
+
+        def search_shard(shard: Shard) -> list[tuple[str, float]]:
+            index = self._shard_lexical_index(shard)
+            if not shard_conditions:
+                return index.search(query, k)
+            if index.can_filter(shard_conditions):
+                return index.search(query, k, conditions=shard_conditions)
+            allowed = shard.collection.get(where=to_chroma_where(shard_conditions), include=[])["ids"]
+            return index.search(query, k, allowed_ids=allowed)
+
+        shards = self._target_shards(values)
+        results = self._fan_out(search_shard, shards)
+        if len(results) == 1:
+            return results[0]
+        hits = [hit for result in results for hit in result]
+        return sorted(hits, key=lambda hit: hit[1], reverse=True)[:k]
+
+    # ==========================================================
+    # Async API (전용 스레드 풀에서 실행하여 이벤트 루프를 막지 않음)
+    # ==========================================================
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=settings.VECTOR_STORE_ASYNC_WORKERS,
+                        thread_name_prefix="vector-store",
+                    )
+        return cls._executor
+
+    async def _run_async(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    async def asimilarity_search(self, query: str, k: int = 4, filter: dict | None = None):
+        """similarity_search의 비동기 버전"""
+        return await self._run_async(self.similarity_search, query, k, filter)
+
+    async def asimilarity_search_with_score(self, query: str, k: int = 4, filter: dict | None = None):
+        """similarity_search_with_score의 비동기 버전"""
+        return await self._run_async(self.similarity_search_with_score, query, k, filter)
+
+    async def ahybrid_search(self, query: str, k: int = 4, filter: dict | None = None):
+        """hybrid_search의 비동기 버전"""
+        return await self._run_async(self.hybrid_search, query, k, filter)
+
+    async def ahybrid_search_with_score(self, query: str, k: int = 4, filter: dict | None = None):
+        """hybrid_search_with_score의 비동기 버전"""
+        return await self._run_async(self.hybrid_search_with_score, query, k, filter)
+
+    async def ahybrid_search_with_dense(self, query: str, k: int = 4, filter: dict | None = None):
+        """hybrid_search_with_dense의 비동기 버전"""
+        return await self._run_async(self.hybrid_search_with_dense, query, k, filter)
+
+    async def abatch_similarity_search_with_score(
+        self, queries: list[str], k: int = 4, filter: dict | None = None
+    ):
+        """batch_similarity_search_with_score의 비동기 버전"""
+        return await self._run_async(self.batch_similarity_search_with_score, queries, k, filter)
+
+    async def abatch_hybrid_search_with_score(
+        self, queries: list[str], k: int = 4, filter: dict | None = None
+    ):
+        """batch_hybrid_search_with_score의 비동기 버전"""
+        return await self._run_async(self.batch_hybrid_search_with_score, queries, k, filter)
+
+    async def abatch_hybrid_search_with_dense(
+        self, queries: list[str], k: int = 4, filter: dict | None = None
+    ):
+        """batch_hybrid_search_with_dense의 비동기 버전"""
+        return await self._run_async(self.batch_hybrid_search_with_dense, queries, k, filter)
+
+    async def aadd_documents(
+        self,
+        documents,
+        ids: list[str] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ):
+        """add_documents의 비동기 버전 (on_progress는 스레드 풀에서 호출됨)"""
+        return await self._run_async(self.add_documents, documents, ids, on_progress)
+
+    async def adelete(self, ids: list[str] | None = None):
+        """delete의 비동기 버전"""
+        return await self._run_async(self.delete, ids)
+
+    @classmethod
+    def shutdown_executor(cls):
+        """비동기 API용 / shard 검색용 스레드 풀을 종료합니다."""
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
+            if cls._fanout_executor is not None:
+                cls._fanout_executor.shutdown(wait=False, cancel_futures=True)
+                cls._fanout_executor = None
+
+    def get_lexical_index(self, shard: str | None = None):
+        """shard(기본: 기본 shard)의 BM25 역색인을 반환합니다. (처음 호출 시 컬렉션 전체에서 생성)"""
+        return self._shard_lexical_index(self._get_shard(shard or settings.VECTOR_SHARD_DEFAULT))
+
+    def _shard_lexical_index(self, shard: Shard):
+        if shard.lexical is not None:
+            return shard.lexical
+
+        from src.systems.rag.lexical_index import LexicalIndex
+
+        with shard.lexical_lock:
+            if shard.lexical is None:
+                index = LexicalIndex(indexed_fields=settings.FILTER_INDEXED_FIELDS)
+                collection = shard.collection
+                page_size = 5000
+                for offset in range(0, collection.count(), page_size):
+                    page = collection.get(
+                        include=["documents", "metadatas"], limit=page_size, offset=offset
+                    )
+                    index.add(page["ids"], page["documents"], page["metadatas"])
+                shard.lexical = index
+        return shard.lexical
+
+    def _shard_exact_index(self, shard: Shard):
+        """shard의 exact 검색 색인을 반환합니다. (처음 호출 시 컬렉션 전체에서 생성)"""
+        if shard.exact is not None:
+            return shard.exact
+
+        from src.systems.rag.exact_index import ExactIndex
+
+        with shard.exact_lock:
+            if shard.exact is None:
+                index = ExactIndex(indexed_fields=settings.FILTER_INDEXED_FIELDS)
+                collection = shard.collection
+                page_size = 5000
+                for offset in range(0, collection.count(), page_size):
+                    page = collection.get(
+                        include=["embeddings", "documents", "metadatas"], limit=page_size, offset=offset
+                    )
+                    index.add(page["ids"], page["embeddings"], page["documents"], page["metadatas"])
+                shard.exact = index
+        return shard.exact
 
     def as_retriever(self, **kwargs):
-        """Retriever로 변환합니다."""
+        """Retriever로 변환합니다. (기본 shard만 검색)"""
         return self.client.as_retriever(**kwargs)
 
     def delete(self, ids: list[str] | None = None):
         """문서를 삭제합니다."""
-        if ids:
-            self.client.delete(ids=ids)
+        if not ids:
+            return
+
+        def delete_from(shard: Shard):
+            shard.collection.delete(ids=ids)
+            with shard.lexical_lock:
+                if shard.lexical is not None:
+                    shard.lexical.delete(ids)
+            with shard.exact_lock:
+                if shard.exact is not None:
+                    shard.exact.delete(ids)
+
+        self._fan_out(delete_from, self._target_shards(None))
+        if self.rescore_store is not None:
+            self.rescore_store.delete(ids)
+        self._bump_version()
+
+    def export_snapshot(self, path: str) -> dict:
+        """모든 shard의 벡터, 문서, metadata, id를 스냅샷 디렉터리로 내보냅니다."""
+        from src.systems.rag.snapshot import export_snapshot
+
+        return export_snapshot(self, path)
+
+    def import_snapshot(self, path: str, force: bool = False) -> dict:
+        """스냅샷을 재임베딩 없이 불러옵니다. (같은 id는 덮어씀)
+
+        Raises:
+            SnapshotError: 스냅샷이 없거나 임베딩 모델 / 저장 차원이 현재 설정과 다른 경우
+        """
+        from src.systems.rag.snapshot import import_snapshot
+
+        return import_snapshot(self, path, force=force)
+
+    def _reset_after_bulk_load(self):
+        """컬렉션에 직접 bulk 저장한 뒤 BM25 / exact 색인을 다시 만들도록 하고 캐시를 무효화합니다."""
+        for shard in self._target_shards(None):
+            with shard.lexical_lock:
+                shard.lexical = None
+            with shard.exact_lock:
+                shard.exact = None
+        self._bump_version()
 
     def get_collection_stats(self) -> dict:
         """컬렉션 통계를 반환합니다."""
-        collection = self.client._collection
+        shards = {
+            shard.value: {
+                "collection": shard.collection.name,
+                "count": shard.collection.count(),
+                "lexical_index": shard.lexical.get_stats() if shard.lexical is not None else None,
+                "exact_index": shard.exact.get_stats() if shard.exact is not None else None,
+            }
+            for shard in self._target_shards(None)
+        }
+        lexical_stats = [stats["lexical_index"] for stats in shards.values() if stats["lexical_index"]]
         return {
-            "name": collection.name,
-            "count": collection.count(),
+            "name": self.collection_name,
+            "count": sum(stats["count"] for stats in shards.values()),
+            "shard_key": settings.VECTOR_SHARD_KEY or None,
+            "shards": shards,
             "embedding_provider": EmbeddingService.get_provider(),
-            "embedding_model": EmbeddingService.get_model_info()
+            "embedding_model": EmbeddingService.get_model_info(),
+            "embedding_cache": EmbeddingService.get_cache_stats(),
+            "search_backend": settings.VECTOR_SEARCH_BACKEND,
+            "storage": {
+                "dimensions": self.dimensions or "full",
+                "rescore": self.rescore_store.get_stats() if self.rescore_store is not None else None
+            },
+            "lexical_index": {
+                "documents": sum(stats["documents"] for stats in lexical_stats),
+                "terms": sum(stats["terms"] for stats in lexical_stats),
+            } if lexical_stats else None,
+            "query_cache": self.query_cache.get_stats() if self.query_cache is not None else None
         }
 
+    def warm_up(self):
+        """임베딩 모델 가중치와 Chroma 컬렉션(및 shard별 BM25 역색인 / exact 검색 색인)을 미리 로드합니다."""
+        if self._warmed_up:
+            return
+        shards = self._target_shards(None)
+        count = sum(shard.collection.count() for shard in shards)
+        if not count and settings.VECTOR_SNAPSHOT_PATH:
+            from src.systems.rag.snapshot import snapshot_info
+
+            if snapshot_info(settings.VECTOR_SNAPSHOT_PATH) is not None:
+                result = self.import_snapshot(settings.VECTOR_SNAPSHOT_PATH)
+                print(
+                    f"Imported {result['count']} chunks from snapshot "
+                    f"{settings.VECTOR_SNAPSHOT_PATH} ({result['elapsed_seconds']}s)"
+                )
+                shards = self._target_shards(None)
+        self.embedding_function.embed_query("warm-up")
+        if settings.HYBRID_SEARCH_ENABLED:
+            self._fan_out(self._shard_lexical_index, shards)
+        if settings.VECTOR_SEARCH_BACKEND == "numpy":
+            self._fan_out(self._shard_exact_index, shards)
+        self._warmed_up = True
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """초기화와 warm-up이 끝났는지 여부를 반환합니다."""
+        return cls._instance is not None and cls._instance._warmed_up
+
     @classmethod
     def reset_instance(cls):
         """싱글톤 인스턴스를 리셋합니다. (테스트용)"""
@@ -78,5 +832,14 @@ class VectorStore:
         EmbeddingService.clear_cache()
 
 
-# Global instance
-vector_store = VectorStore()
+def get_vector_store() -> VectorStore:
+    """VectorStore 싱글톤을 반환합니다. (최초 호출 시 초기화)"""
+    return VectorStore()
+
+
+async def aget_vector_store() -> VectorStore:
+    """VectorStore 싱글톤을 반환합니다. 초기화(모델 로드)가 필요하면 전용 스레드 풀에서 수행합니다."""
+    if VectorStore._instance is not None:
+        return VectorStore._instance
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(VectorStore._get_executor(), VectorStore)
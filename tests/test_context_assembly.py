@@ -0,0 +1,58 @@
+"""context_assembly.merge_adjacent / TokenTextSplitter start_index 테스트"""
+
+from langchain_core.documents import Document
+
+from src.systems.rag.context_assembly import merge_adjacent
+from src.systems.rag.tokenization import TokenTextSplitter
+
+
+class WordCounter:
+    """공백 단위 토큰 수 (tiktoken 다운로드 없이 토큰 모드 splitter를 만들기 위한 대체 counter)"""
+
+    def count(self, text):
+        return len(text.split())
+
+    def count_batch(self, texts):
+        return [self.count(text) for text in texts]
+
+
+def _token_chunks():
+    text = " ".join(f"word{i}" for i in range(400))
+    splitter = TokenTextSplitter(
+        counter=WordCounter(), chunk_size=50, chunk_overlap=20, add_start_index=True
+    )
+    return text, splitter.split_documents([Document(page_content=text, metadata={"source": "a.txt"})])
+
+
+def test_token_splitter_records_character_offsets():
+    text, chunks = _token_chunks()
+
+    assert len(chunks) > 10
+    for chunk in chunks:
+        start = chunk.metadata["start_index"]
+        assert text[start:start + len(chunk.page_content)] == chunk.page_content
+
+
+def test_merge_adjacent_keeps_both_distant_token_chunks():
+    _, chunks = _token_chunks()
+
+    passages = merge_adjacent([chunks[1], chunks[9]])
+
+    merged_text = " ".join(passage.text for passage in passages)
+    assert chunks[1].page_content in merged_text
+    assert chunks[9].page_content in merged_text
+
+
+def test_merge_adjacent_falls_back_to_text_overlap_for_invalid_start_index():
+    _, chunks = _token_chunks()
+    first, second = (
+        Document(page_content=chunk.page_content, metadata={**chunk.metadata, "start_index": -1})
+        for chunk in chunks[1:3]
+    )
+
+    passages = merge_adjacent([first, second])
+
+    assert len(passages) == 1
+    assert passages[0].parts == 2
+    assert first.page_content in passages[0].text
+    assert second.page_content in passages[0].text